@@ -1,25 +1,66 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget
+import importlib
 
-from widgets.keyword_report import KeywordReportPage
-from widgets.keyword_task_detail import KeywordTaskDetailPage
-from widgets.keyword_task_list import KeywordTaskListPage
-from widgets.login import LoginPage
-from widgets.home import HomePage
-from widgets.task_list import TaskListPage
-from widgets.task_detail import TaskDetailPage
-from widgets.article_list import ArticleListPage
-from widgets.article_detail import ArticleDetailPage
-from widgets.reader import ReaderPage
+from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QSystemTrayIcon
+from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QStandardPaths
+import os
+
+from utils.api_client import ApiClient
+from utils.article_store import ArticleStore
+from utils.request_engine import RequestEngine
+from utils.job_manager import JobManager
+from utils.event_stream import EventStream
+from utils.path_tool import resource_path
+
+# 页面注册表: 属性名 -> (模块, 类名)
+# 页面在第一次被访问/导航时才导入模块并创建，阅读器的 QtWebEngine 也随之延迟加载
+PAGE_REGISTRY = {
+    "login_page": ("widgets.login", "LoginPage"),
+    "home_page": ("widgets.home", "HomePage"),
+    "task_list_page": ("widgets.task_list", "TaskListPage"),
+    "task_detail_page": ("widgets.task_detail", "TaskDetailPage"),
+    "article_list_page": ("widgets.article_list", "ArticleListPage"),
+    "article_detail_page": ("widgets.article_detail", "ArticleDetailPage"),
+    "reader_page": ("widgets.reader", "ReaderPage"),
+    "keyword_task_list_page": ("widgets.keyword_task_list", "KeywordTaskListPage"),  # 新增
+    "keyword_task_detail_page": ("widgets.keyword_task_detail", "KeywordTaskDetailPage"),  # 新增
+    "keyword_report_page": ("widgets.keyword_report", "KeywordReportPage"),  # 新增
+}
+
+# 是否订阅服务器推送，关闭后只用轮询刷新任务状态
+PUSH_UPDATES = True
+# 文章列表是否只请求摘要字段，正文在详情页需要时再单独获取
+# 开启后本地全文索引只包含打开过的文章的正文，本地搜索正文的效果会变差，所以默认关闭
+HEADER_ONLY_LISTS = False
 
 
 class MainApp(QApplication):
     def __init__(self, argv):
+        # QtWebEngine 延迟到打开阅读器时才导入，需要在创建 QApplication 之前设置
+        QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
         super().__init__(argv)
+        self.setApplicationName("adaptive_spider")
 
         # 初始化用户信息
         self.user_info = None
         self.current_task_id = None
         self.current_article = None
+        # 全局共享的接口客户端，下层是本地SQLite存储
+        data_dir = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+        self.api = ApiClient(store=ArticleStore(os.path.join(data_dir, "cache.db")),
+                             header_lists=HEADER_ONLY_LISTS)
+        self.aboutToQuit.connect(self.api.close)
+        # 后台请求引擎，页面数据加载都不在GUI线程中进行
+        self.engine = RequestEngine(parent=self)
+        # 长耗时作业队列（分类处理、翻译），不属于任何页面，切换页面后继续执行
+        self.jobs = JobManager(parent=self)
+        self.jobs.job_added.connect(self.show_job_panel)
+        self.job_panel = None
+        self.tray_icon = None
+        # 服务器推送的任务和文章更新，登录后订阅；服务器不支持时页面继续轮询
+        self.events = EventStream(self.api.base_url, parent=self)
+        self.events.event_received.connect(self.on_push_event)
+        self.aboutToQuit.connect(self.events.close)
         # 主窗口设置
         self.main_window = QMainWindow()
         self.main_window.setWindowTitle("我的应用")
@@ -29,7 +70,7 @@ class MainApp(QApplication):
         self.pages = QStackedWidget()
         self.main_window.setCentralWidget(self.pages)
 
-        # 初始化所有页面
+        # 初始化页面
         self.init_pages()
 
         # 显示登录页面
@@ -37,32 +78,76 @@ class MainApp(QApplication):
         self.main_window.show()
 
     def init_pages(self):
-        """初始化所有页面"""
-        self.login_page = LoginPage(self)
-        self.home_page = HomePage(self)
-        self.task_list_page = TaskListPage(self)
-        self.task_detail_page = TaskDetailPage(self)
-        self.article_list_page = ArticleListPage(self)
-        self.article_detail_page = ArticleDetailPage(self)
-        self.reader_page = ReaderPage(self)
-        self.keyword_task_list_page = KeywordTaskListPage(self)  # 新增
-        self.keyword_task_detail_page = KeywordTaskDetailPage(self)  # 新增
-        self.keyword_report_page = KeywordReportPage(self)  # 新增
-
-        # 添加到堆栈
-        self.pages.addWidget(self.login_page)
-        self.pages.addWidget(self.home_page)
-        self.pages.addWidget(self.task_list_page)
-        self.pages.addWidget(self.task_detail_page)
-        self.pages.addWidget(self.article_list_page)
-        self.pages.addWidget(self.article_detail_page)
-        self.pages.addWidget(self.reader_page)
-        self.pages.addWidget(self.keyword_task_list_page)  # 新增
-        self.pages.addWidget(self.keyword_task_detail_page)  # 新增
-        self.pages.addWidget(self.keyword_report_page)  # 新增
+        """初始化页面缓存，启动时只创建登录页"""
+        self.built_pages = {}
+        self.get_page("login_page")
+
+    def __getattr__(self, name):
+        # 只有常规属性查找失败时才会进入这里
+        if name in PAGE_REGISTRY:
+            return self.get_page(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def get_page(self, name):
+        """获取页面，第一次访问时导入模块并创建"""
+        page = self.built_pages.get(name)
+        if page is None:
+            module_name, class_name = PAGE_REGISTRY[name]
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            page = page_class(self)
+            self.built_pages[name] = page
+            self.pages.addWidget(page)
+        return page
+
+    def is_page_built(self, name):
+        """页面是否已经创建"""
+        return name in self.built_pages
+
     def navigate_to(self, page):
-        """导航到指定页面"""
+        """导航到指定页面，page 可以是页面对象或注册表中的属性名"""
+        if isinstance(page, str):
+            page = self.get_page(page)
+
+        # 离开页面时取消它尚未返回的请求
+        current = self.pages.currentWidget()
+        if current is not page:
+            self.engine.cancel_owner(current)
+        # 文章列表页在显示时自行从缓存刷新，不再强制重新下载
         self.pages.setCurrentWidget(page)
-        # 如果是文章列表页，强制刷新
-        if isinstance(page, ArticleListPage):
-            page.reload_articles()
\ No newline at end of file
+
+    def show_job_panel(self):
+        """显示后台作业面板，第一次提交作业时才创建"""
+        if self.job_panel is None:
+            from widgets.job_panel import JobPanel
+            self.job_panel = JobPanel(self.jobs, self.main_window)
+            self.main_window.addDockWidget(Qt.BottomDockWidgetArea, self.job_panel)
+        self.job_panel.show()
+
+    def start_push_updates(self):
+        """登录后订阅服务器推送"""
+        if PUSH_UPDATES and self.user_info:
+            self.events.start(self.user_info["userid"])
+
+    def on_push_event(self, event_type, data):
+        """推送事件先使相关缓存失效，页面各自再刷新显示"""
+        if not self.user_info:
+            return
+        user_id = self.user_info["userid"]
+        if event_type == "task_status":
+            self.api.cache.invalidate(f"api/tasks/{user_id}/")
+        elif event_type == "articles_added":
+            self.api.invalidate_task_articles(user_id, data.get("task_id"))
+        elif event_type == "article_translated":
+            self.api.invalidate_articles(user_id)
+            if data.get("article_id") is not None:
+                self.api.invalidate_body("task", data["article_id"])
+
+    def show_notification(self, title, message):
+        """发出通知：有系统托盘时弹出托盘消息，否则显示在主窗口状态栏"""
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            if self.tray_icon is None:
+                self.tray_icon = QSystemTrayIcon(QIcon(resource_path("imgs/logo.png")), self.main_window)
+                self.tray_icon.show()
+            self.tray_icon.showMessage(title, message)
+        else:
+            self.main_window.statusBar().showMessage(f"{title}: {message}", 10000)
@@ -12,7 +12,21 @@ a = Analysis(
         ('utils\\*.py', 'utils'),
         ('widgets\\*.py', 'widgets')
     ],
-    hiddenimports=[],
+    # 页面模块由 app.PAGE_REGISTRY 按名称延迟导入，需要显式声明
+    hiddenimports=[
+        'widgets.login',
+        'widgets.home',
+        'widgets.task_list',
+        'widgets.task_detail',
+        'widgets.article_list',
+        'widgets.article_detail',
+        'widgets.reader',
+        'widgets.keyword_task_list',
+        'widgets.keyword_task_detail',
+        'widgets.keyword_report',
+        'widgets.job_panel',
+        'PyQt5.QtWebEngineWidgets',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
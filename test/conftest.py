@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# 测试从仓库根目录导入 utils、widgets
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QTimer 和跨线程信号需要 QCoreApplication"""
+    from PyQt5.QtCore import QCoreApplication
+    return QCoreApplication.instance() or QCoreApplication([])
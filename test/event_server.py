@@ -0,0 +1,157 @@
+"""本地替身事件服务器，用于在没有后端的情况下测试推送订阅
+
+只实现 GET /api/events/<user_id>/：按 SSE 格式推送 publish() 发布的事件，
+请求头带 Last-Event-ID 时先补发之后的历史事件，空闲时定期发送注释行保活。
+
+    python test/event_server.py --port 8001
+    然后在标准输入中逐行输入: <事件类型> <JSON数据>，例如
+    task_status {"task_id": 3, "status": "完成"}
+"""
+import argparse
+import json
+import sys
+import threading
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class EventServer:
+    """线程化的 SSE 服务器，保留最近 history 条事件用于断线补发
+
+    newline 是行结束符，SSE 允许 "\n"、"\r\n" 和 "\r"。
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, keepalive=15, history=1000, newline="\n"):
+        self.keepalive = keepalive
+        self.newline = newline
+        self.events = deque(maxlen=history)  # (id, user_id, 事件类型, 数据)
+        self.next_id = 1
+        self.condition = threading.Condition()
+        self.connections = set()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.drop_connections()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def publish(self, event_type, data, user_id=None):
+        """发布一个事件，user_id 为 None 时发给所有用户，返回事件ID"""
+        # 路径中的用户ID是字符串
+        user_id = None if user_id is None else str(user_id)
+        with self.condition:
+            event_id = self.next_id
+            self.next_id += 1
+            self.events.append((event_id, user_id, event_type, data))
+            self.condition.notify_all()
+        return event_id
+
+    def drop_connections(self):
+        """断开所有订阅连接，用于测试客户端重连"""
+        with self.condition:
+            connections = list(self.connections)
+            self.connections.clear()
+            self.condition.notify_all()
+        for connection in connections:
+            try:
+                connection.shutdown(2)
+            except OSError:
+                pass
+
+    def _pending(self, user_id, after):
+        return [event for event in self.events
+                if event[0] > after and event[1] in (None, user_id)]
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parts = [part for part in self.path.split("?")[0].split("/") if part]
+                if len(parts) != 3 or parts[:2] != ["api", "events"]:
+                    self.send_error(404)
+                    return
+                user_id = parts[2]
+                try:
+                    after = int(self.headers.get("Last-Event-ID") or 0)
+                except ValueError:
+                    after = 0
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                with server.condition:
+                    server.connections.add(self.connection)
+                try:
+                    while True:
+                        with server.condition:
+                            if self.connection not in server.connections:
+                                return
+                            events = server._pending(user_id, after)
+                            if not events:
+                                server.condition.wait(server.keepalive)
+                                if self.connection not in server.connections:
+                                    return
+                                events = server._pending(user_id, after)
+                        newline = server.newline
+                        if not events:
+                            self.wfile.write(f": keepalive{newline}{newline}".encode("utf-8"))
+                        for event_id, _, event_type, data in events:
+                            lines = [f"id: {event_id}", f"event: {event_type}",
+                                     f"data: {json.dumps(data, ensure_ascii=False)}", "", ""]
+                            self.wfile.write(newline.join(lines).encode("utf-8"))
+                            after = event_id
+                        self.wfile.flush()
+                except OSError:
+                    # 客户端断开
+                    pass
+                finally:
+                    with server.condition:
+                        server.connections.discard(self.connection)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地替身事件服务器")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+
+    server = EventServer(args.host, args.port).start()
+    print(f"事件服务器已启动: {server.url}api/events/<user_id>/")
+    for line in sys.stdin:
+        event_type, _, data = line.strip().partition(" ")
+        if not event_type:
+            continue
+        try:
+            payload = json.loads(data or "{}")
+        except ValueError:
+            print("数据不是合法的JSON")
+            continue
+        print("已发布事件", server.publish(event_type, payload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""同步执行的替身 RequestEngine，测试按需决定请求何时返回
+
+submit() 只记录请求，run() 在当前线程执行并像 RequestHandle 一样发出信号；
+同一 owner 下相同 key 的新请求会取消旧请求，被取消的请求不再送达结果。
+"""
+
+
+class Signal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+
+class FakeHandle:
+    def __init__(self, fn, args, kwargs, owner, key):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.owner = owner
+        self.key = key
+        self.cancelled = False
+        self.done = False
+        self.succeeded = Signal()
+        self.failed = Signal()
+        self.finished = Signal()
+        self.partial = Signal()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeEngine:
+    def __init__(self):
+        self.handles = []
+
+    def submit(self, fn, *args, owner=None, key=None, streaming=False, **kwargs):
+        if key is not None:
+            self.cancel_owner(owner, key)
+        handle = FakeHandle(fn, args, kwargs, owner, key)
+        self.handles.append(handle)
+        return handle
+
+    def cancel_owner(self, owner, key=None):
+        for handle in self.pending():
+            if handle.owner is owner and (key is None or handle.key == key):
+                handle.cancel()
+
+    def is_busy(self, owner, key=None):
+        return any(handle.owner is owner and (key is None or handle.key == key) for handle in self.pending())
+
+    def pending(self, key=None):
+        """还没返回也没被取消的请求"""
+        return [handle for handle in self.handles
+                if not handle.done and not handle.cancelled and (key is None or handle.key == key)]
+
+    def run(self, handle):
+        """执行一个请求并送达结果，返回它的结果或异常"""
+        handle.done = True
+        try:
+            result = handle.fn(*handle.args, **handle.kwargs)
+        except Exception as e:
+            if not handle.cancelled:
+                handle.failed.emit(e)
+                handle.finished.emit()
+            return e
+        if not handle.cancelled:
+            handle.succeeded.emit(result)
+            handle.finished.emit()
+        return result
+
+    def run_all(self):
+        """执行所有待返回的请求，包括执行过程中新发出的"""
+        while self.pending():
+            self.run(self.pending()[0])
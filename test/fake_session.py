@@ -0,0 +1,47 @@
+"""替身 requests.Session，用于在没有后端的情况下测试 ApiClient
+
+routes 把 (方法, 路径) 映射到 handler(params, json, headers)，handler 返回
+(状态码, 数据) 或 (状态码, 数据, 响应头)；calls 记录每次请求的 (方法, 路径, params, headers)。
+"""
+import io
+import json
+
+import requests
+
+
+def make_response(status_code, payload, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(response._content)
+    response.encoding = "utf-8"
+    return response
+
+
+class FakeSession:
+    def __init__(self, base_url="http://test/"):
+        self.base_url = base_url
+        self.routes = {}
+        self.calls = []
+        self.headers = {}
+
+    def route(self, method, path, handler):
+        self.routes[(method, path)] = handler
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def close(self):
+        pass
+
+    def request(self, method, url, params=None, json=None, headers=None, timeout=None, stream=False):
+        path = url[len(self.base_url):]
+        self.calls.append((method, path, dict(params or {}), dict(headers or {})))
+        handler = self.routes.get((method, path))
+        if handler is None:
+            return make_response(404, {"error": "not found"})
+        return make_response(*handler(dict(params or {}), json, dict(headers or {})))
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
@@ -0,0 +1,214 @@
+import pytest
+
+from fake_session import FakeSession
+from utils.api_client import ApiClient, ApiError
+
+CATEGORY_PATH = "get_filtered_articles/"
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def api(session):
+    api = ApiClient(base_url=session.base_url)
+    api.session = session
+    return api
+
+
+def category_page(article_ids):
+    return 200, {"articles_by_category": {"Finance": [{"article_id": i, "title": f"t{i}"} for i in article_ids]},
+                 "total_count": len(article_ids)}
+
+
+def load_category(api):
+    return api.get_filtered_articles(1, ["Finance"], 1, 10, "updated_at", "desc")
+
+
+def ids_of(data):
+    return [article["article_id"] for article in data["articles_by_category"]["Finance"]]
+
+
+def test_pending_delete_hidden_from_refresh(api, session):
+    # 服务器还没执行删除，列表照常返回这篇文章
+    session.route("GET", CATEGORY_PATH, lambda params, body, headers: category_page([1, 2, 3]))
+    api.drop_articles("category", 1, [2])
+    data = load_category(api)
+    assert ids_of(data) == [1, 3]
+    assert data["total_count"] == 2
+    # 缓存中的也是去掉后的数据
+    assert ids_of(api.get_filtered_articles(1, ["Finance"], 1, 10, "updated_at", "desc", cached_only=True)) == [1, 3]
+
+
+def test_response_generated_before_delete_commits(api, session):
+    # 请求在删除确认之前发出、之后才返回：仍然去掉
+    def list_then_delete(params, body, headers):
+        api.delete_category_articles(1, [2])
+        return category_page([1, 2, 3])
+
+    session.route("DELETE", "delete_category_articles/", lambda params, body, headers: (200, {"success": True}))
+    session.route("GET", CATEGORY_PATH, list_then_delete)
+    assert ids_of(load_category(api)) == [1, 3]
+
+    # 确认之后发出的请求以服务器为准
+    session.route("GET", CATEGORY_PATH, lambda params, body, headers: category_page([1, 3]))
+    api.cache.clear()
+    assert ids_of(load_category(api)) == [1, 3]
+
+
+def test_failed_delete_shows_article_again(api, session):
+    session.route("DELETE", "delete_category_articles/", lambda params, body, headers: (500, {"error": "x"}))
+    session.route("GET", CATEGORY_PATH, lambda params, body, headers: category_page([1, 2, 3]))
+    api.drop_articles("category", 1, [2])
+    with pytest.raises(ApiError):
+        api.delete_category_articles(1, [2])
+    assert ids_of(load_category(api)) == [1, 2, 3]
+
+
+def test_delete_scope_and_user_are_separate(api, session):
+    session.route("GET", CATEGORY_PATH, lambda params, body, headers: category_page([1, 2]))
+    api.drop_articles("task", 1, [1])
+    api.drop_articles("category", 2, [2])
+    assert ids_of(load_category(api)) == [1, 2]
+
+
+@pytest.fixture
+def stored_api(session, tmp_path):
+    from utils.article_store import ArticleStore
+    store = ArticleStore(str(tmp_path / "articles.db"))
+    api = ApiClient(base_url=session.base_url, store=store)
+    api.session = session
+    yield api
+    api.close()
+
+
+def test_translation_keeps_full_list_bodies(stored_api, session):
+    # 服务器返回完整文章、没有 get_article_bodies/ 接口
+    api = stored_api
+    session.route("GET", "get_articles/", lambda params, body, headers: (
+        200, {"articles": [{"article_id": 5, "title": "t", "content": "原文"}]}))
+    session.route("POST", "api/translate-article/", lambda params, body, headers: (200, {"success": True}))
+    api.get_articles(1, 9)
+    api.translate_article(1, 5)
+
+    article = api.get_articles(1, 9, cached_only=True)["articles"][0]
+    assert article["content"] == "原文"
+    assert api.article_body(1, "task", {"article_id": 5})["content"] == "原文"
+    assert api.article_body(1, "task", {"article_id": 6}) == {}
+    assert api.get_article_bodies(1, "task", [6]) == {}
+    assert not any(call[1] == "get_article_bodies/" for call in session.calls)
+
+
+def test_header_mode_fetches_and_invalidates_bodies(stored_api, session):
+    api = stored_api
+    api.header_lists = True
+    session.route("GET", "get_articles/", lambda params, body, headers: (
+        200, {"articles": [{"article_id": 5, "title": "t"}]}))
+    session.route("GET", "get_article_bodies/", lambda params, body, headers: (
+        200, {"bodies": [{"article_id": 5, "content": "正文"}]}))
+    api.get_articles(1, 9)
+    assert api.article_body(1, "task", {"article_id": 5})["content"] == "正文"
+    # 已缓存，不再请求；分类文章是另一条记录
+    assert api.article_body(1, "task", {"article_id": 5}, cached_only=True)["content"] == "正文"
+    assert api.article_body(1, "category", {"article_id": 5}, cached_only=True) is None
+
+    api.invalidate_body("task", 5)
+    assert api.article_body(1, "task", {"article_id": 5}, cached_only=True) is None
+    assert [call[1] for call in session.calls].count("get_article_bodies/") == 1
+
+
+TASKS_PATH = "api/tasks/1/"
+
+
+def task(task_id, status="执行中", updated_at="2024-01-01T00:00:00"):
+    return {"task_id": task_id, "status": status, "updated_at": updated_at}
+
+
+def load_tasks(api):
+    return api.get_tasks(1, 1, 10, "article", fresh=True)
+
+
+def task_ids(data):
+    return [record["task_id"] for record in data["tasks"]]
+
+
+def test_delta_sync_merges_changed_records(api, session):
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {
+        "tasks": [task(1), task(2), task(3)], "total": 3}))
+    first = load_tasks(api)
+
+    # 任务 2 完成，任务 3 被删除，新增任务 4
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {
+        "delta": True, "ids": [4, 1, 2], "total": 3,
+        "tasks": [task(4, updated_at="2024-01-02T00:00:00"), task(2, "完成", "2024-01-02T00:00:00")]}))
+    data = load_tasks(api)
+    assert session.calls[-1][2]["since"] == "2024-01-01T00:00:00"
+    assert task_ids(data) == [4, 1, 2]
+    assert data["tasks"][2]["status"] == "完成"
+    # 未变化的记录沿用旧对象
+    assert data["tasks"][1] is first["tasks"][0]
+    assert "delta" not in data and "ids" not in data
+
+
+def test_delta_without_changes_returns_previous_data(api, session):
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {"tasks": [task(1), task(2)], "total": 2}))
+    first = load_tasks(api)
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {
+        "delta": True, "ids": [1, 2], "tasks": [], "total": 2}))
+    assert load_tasks(api) is first
+
+
+def test_delta_with_unknown_record_downloads_full_list(api, session):
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {"tasks": [task(1)], "total": 1}))
+    load_tasks(api)
+
+    def handler(params, body, headers):
+        if "since" in params:
+            # 引用了本地没有的任务 5
+            return 200, {"delta": True, "ids": [5, 1], "tasks": [], "total": 2}
+        return 200, {"tasks": [task(5), task(1)], "total": 2}
+
+    session.route("GET", TASKS_PATH, handler)
+    assert task_ids(load_tasks(api)) == [5, 1]
+    assert "since" in session.calls[-2][2] and "since" not in session.calls[-1][2]
+
+
+def test_server_without_delta_support_returns_full_list(api, session):
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {"tasks": [task(1)], "total": 1}))
+    load_tasks(api)
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (200, {"tasks": [task(2)], "total": 1}))
+    assert task_ids(load_tasks(api)) == [2]
+
+
+def test_conditional_request_reuses_data_on_304(api, session):
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (
+        200, {"tasks": [{"task_id": 1, "status": "执行中"}], "total": 1}, {"ETag": '"v1"'}))
+    first = load_tasks(api)
+    assert "If-None-Match" not in session.calls[-1][3]
+
+    def handler(params, body, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, None
+        return 200, {"tasks": [], "total": 0}
+
+    session.route("GET", TASKS_PATH, handler)
+    assert load_tasks(api) is first
+    assert api.transfer_stats()["api/tasks/<id>/"]["not_modified"] == 1
+    # 304 之后验证器仍然保留
+    assert load_tasks(api) is first
+
+
+def test_last_modified_sent_as_if_modified_since(api, session):
+    stamp = "Mon, 01 Jan 2024 00:00:00 GMT"
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (
+        200, {"tasks": [], "total": 0}, {"Last-Modified": stamp}))
+    load_tasks(api)
+    session.route("GET", TASKS_PATH, lambda params, body, headers: (
+        200, {"tasks": [{"task_id": 2, "status": "完成"}], "total": 1}))
+    assert task_ids(load_tasks(api)) == [2]
+    assert session.calls[-1][3] == {"If-Modified-Since": stamp}
+    # 新响应没有验证器，下次不再做条件请求
+    load_tasks(api)
+    assert session.calls[-1][3] == {}
@@ -0,0 +1,204 @@
+import pytest
+
+from fake_engine import FakeEngine
+from utils.article_cursor import ArticleCursor
+
+
+class FakeList:
+    """按页返回文章的替身接口，记录请求的页码"""
+
+    def __init__(self, count, paged=True):
+        self.articles = [{"article_id": i} for i in range(count)]
+        self.paged = paged
+        self.cache = {}
+        self.requests = []
+        self.fail = set()
+
+    def __call__(self, page, per_page, cached_only=False):
+        if cached_only:
+            return self.cache.get(page)
+        self.requests.append(page)
+        if page in self.fail:
+            raise OSError("down")
+        if not self.paged:
+            return {"articles": list(self.articles)}
+        start = (page - 1) * per_page
+        return {"articles": self.articles[start:start + per_page], "total": len(self.articles)}
+
+
+@pytest.fixture
+def engine():
+    return FakeEngine()
+
+
+@pytest.fixture
+def cursor(qapp, engine):
+    return ArticleCursor(engine, owner="page", per_page=10, prefetch=3, keep_distance=1)
+
+
+def current_id(cursor):
+    article = cursor.current()
+    return None if article is None else article["article_id"]
+
+
+def move(cursor, engine, steps):
+    for _ in range(abs(steps)):
+        assert cursor.move(1 if steps > 0 else -1)
+        engine.run_all()
+
+
+def test_loads_first_page_and_prefetches_ahead(cursor, engine):
+    source = FakeList(50)
+    cursor.reset(source)
+    assert cursor.is_loading()
+    engine.run_all()
+    assert current_id(cursor) == 0 and cursor.total == 50
+    assert source.requests == [1]
+
+    move(cursor, engine, 6)
+    assert source.requests == [1]
+    # 再往后 3 篇就是第 2 页，提前取
+    move(cursor, engine, 1)
+    assert source.requests == [1, 2]
+    move(cursor, engine, 3)
+    assert current_id(cursor) == 10 and not cursor.is_loading()
+
+
+def test_prefetch_follows_direction_and_evicts_far_pages(cursor, engine):
+    source = FakeList(50)
+    cursor.reset(source)
+    engine.run_all()
+    move(cursor, engine, 35)
+    assert current_id(cursor) == 35
+    # 只保留当前页前后 keep_distance 页
+    assert min(cursor.items) >= 20
+    # 往回翻时朝前预取，第 2 页已被丢弃，需要重新请求
+    move(cursor, engine, -13)
+    assert source.requests[-1] == 2
+    assert current_id(cursor) == 22
+
+
+def test_cached_page_shown_before_refresh(cursor, engine):
+    source = FakeList(30)
+    source.cache[1] = {"articles": [{"article_id": "cached"}], "total": 30}
+    cursor.reset(source)
+    assert current_id(cursor) == "cached"
+    engine.run_all()
+    assert current_id(cursor) == 0
+
+
+def test_unpaged_server_falls_back_to_whole_list(cursor, engine):
+    source = FakeList(25, paged=False)
+    cursor.reset(source)
+    engine.run_all()
+    assert not cursor.paged and cursor.total == 25
+    move(cursor, engine, 24)
+    assert current_id(cursor) == 24 and source.requests == [1]
+    assert not cursor.move(1)
+
+
+def test_failure_reported_only_for_current_page(cursor, engine):
+    source = FakeList(50)
+    source.fail = {2}
+    errors = []
+    cursor.load_failed.connect(errors.append)
+    cursor.reset(source)
+    engine.run_all()
+    move(cursor, engine, 7)
+    # 预取失败不提示
+    assert errors == []
+    move(cursor, engine, 3)
+    assert len(errors) == 1 and cursor.current() is None
+
+
+def test_reset_drops_late_responses(cursor, engine):
+    first = FakeList(10)
+    cursor.reset(first)
+    late = engine.pending()[0]
+    second = FakeList(5)
+    second.articles = [{"article_id": "b%d" % i} for i in range(5)]
+    cursor.reset(second)
+    engine.run(late)
+    engine.run_all()
+    assert current_id(cursor) == "b0" and cursor.total == 5
+
+
+def loaded_ids(cursor):
+    return [cursor.items[position]["article_id"] for position in sorted(cursor.items)]
+
+
+def test_remove_current_holds_loads_until_confirmed(cursor, engine):
+    source = FakeList(50)
+    cursor.reset(source)
+    engine.run_all()
+    move(cursor, engine, 8)
+    snapshot = cursor.remove_current()
+    assert snapshot == ({"article_id": 8}, 8)
+    assert current_id(cursor) == 9 and cursor.total == 49
+
+    # 删除确认前翻到没加载的页：显示加载中，不发请求
+    requested = len(source.requests)
+    move(cursor, engine, 16)
+    assert cursor.current() is None and cursor.is_loading()
+    assert len(source.requests) == requested
+
+    del source.articles[8]
+    cursor.confirm([8])
+    engine.run_all()
+    assert current_id(cursor) == 25
+    ids = loaded_ids(cursor)
+    assert len(ids) == len(set(ids)) and 8 not in ids
+
+
+def test_responses_from_before_delete_are_ignored(cursor, engine):
+    source = FakeList(30)
+    cursor.reset(source)
+    engine.run_all()
+    move(cursor, engine, 6)
+    assert cursor.move(1)
+    in_flight = engine.pending()[0]
+    cursor.remove_current()
+    # 删除之前发出的第 2 页请求返回：仍包含被删除的文章，不使用
+    engine.run(in_flight)
+    assert 10 not in cursor.items
+
+    del source.articles[7]
+    cursor.confirm([7])
+    engine.run_all()
+    seen = [current_id(cursor)]
+    while cursor.index < cursor.total - 1:
+        move(cursor, engine, 1)
+        seen.append(current_id(cursor))
+    assert seen == [article["article_id"] for article in source.articles[7:]]
+
+
+def test_restore_puts_article_back_and_resumes(cursor, engine):
+    source = FakeList(30)
+    cursor.reset(source)
+    engine.run_all()
+    move(cursor, engine, 2)
+    snapshot = cursor.remove_current()
+    cursor.restore(snapshot)
+    assert current_id(cursor) == 2 and cursor.total == 30 and not cursor.pending
+    move(cursor, engine, 8)
+    assert current_id(cursor) == 10
+
+
+def test_bulk_remove_reloads_after_settle(cursor, engine):
+    source = FakeList(40)
+    cursor.reset(source)
+    engine.run_all()
+    move(cursor, engine, 3)
+    cursor.remove_ids([1, 25, 30])
+    assert cursor.total == 37
+    assert 1 not in loaded_ids(cursor)
+
+    for article_id in (25, 30):
+        source.articles.remove({"article_id": article_id})
+    cursor.confirm([25, 30])
+    assert cursor.pending == {1}
+    # 删除失败的文章重新出现
+    cursor.restore_ids([1])
+    engine.run_all()
+    assert cursor.total == 38
+    assert loaded_ids(cursor)[:4] == [0, 1, 2, 3]
@@ -0,0 +1,44 @@
+from widgets.article_model import merge_categories
+
+
+def article(article_id, updated_at="", score=None):
+    return {"article_id": article_id, "updated_at": updated_at, "score": score}
+
+
+def ids_of(articles):
+    return [item["article_id"] for item in articles]
+
+
+def test_merges_sorted_categories_into_one_order():
+    by_category = {
+        "Finance": [article(1, "2024-01-05"), article(2, "2024-01-02")],
+        "Sports": [article(3, "2024-01-04"), article(4, "2024-01-03"), article(5, "2024-01-01")],
+        "Culture": [],
+    }
+    assert ids_of(merge_categories(by_category, "updated_at", "desc")) == [1, 3, 4, 2, 5]
+
+
+def test_ascending_order():
+    by_category = {
+        "Finance": [article(1, "2024-01-01"), article(2, "2024-01-04")],
+        "Sports": [article(3, "2024-01-02"), article(4, "2024-01-03")],
+    }
+    assert ids_of(merge_categories(by_category, "updated_at", "asc")) == [1, 3, 4, 2]
+
+
+def test_score_compares_numerically():
+    by_category = {
+        "Finance": [article(1, score="10"), article(2, score=None)],
+        "Sports": [article(3, score="9.5")],
+    }
+    # 字符串比较时 "9.5" 会排在 "10" 前面
+    assert ids_of(merge_categories(by_category, "score", "desc")) == [1, 3, 2]
+
+
+def test_ties_keep_category_order():
+    by_category = {
+        "Finance": [article(1, "2024-01-01"), article(2, "2024-01-01")],
+        "Sports": [article(3, "2024-01-01")],
+    }
+    assert ids_of(merge_categories(by_category, "updated_at", "desc")) == [1, 2, 3]
+    assert ids_of(merge_categories(by_category, "updated_at", "asc")) == [1, 2, 3]
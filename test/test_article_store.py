@@ -0,0 +1,160 @@
+import pytest
+
+from utils.article_store import ArticleStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "store" / "articles.db")
+
+
+@pytest.fixture
+def store(path):
+    store = ArticleStore(path)
+    yield store
+    store.close()
+
+
+def article(article_id, **fields):
+    return dict({"article_id": article_id, "title": f"标题{article_id}", "content": f"正文{article_id}"}, **fields)
+
+
+def test_article_list_round_trip(store):
+    data = {"articles": [article(2), article(1)], "total": 2}
+    store.save_response("k", "get_articles/", {"user_id": 1, "task_id": 7}, data)
+    assert store.load_response("k") == data
+    assert store.load_response("missing") is None
+
+
+def test_category_and_task_responses(store):
+    data = {"articles_by_category": {"Finance": [article(1, category="Finance")], "Tech": []}, "total_count": 1}
+    store.save_response("c", "get_filtered_articles/", {"user_id": 1}, data)
+    assert store.load_response("c") == data
+
+    tasks = {"tasks": [{"task_id": 3, "status": "执行中"}, {"task_id": 1, "status": "完成"}], "total": 2}
+    store.save_response("t", "api/tasks/1/", {"task_target": "crawl"}, tasks)
+    assert store.load_response("t") == tasks
+
+
+def test_same_article_stored_once_per_kind(store):
+    store.save_response("a", "get_articles/", {"user_id": 1, "task_id": 7}, {"articles": [article(1)]})
+    store.save_response("b", "get_articles/", {"user_id": 1, "task_id": 7, "page": 2},
+                        {"articles": [article(1, title="新标题")]})
+    # 两个快照引用同一条记录，读到的是最新的
+    assert store.load_response("a")["articles"][0]["title"] == "新标题"
+    # 分类文章是另一条记录
+    store.save_response("c", "get_filtered_articles/", {"user_id": 1},
+                        {"articles_by_category": {"Finance": [article(1, title="分类")]}})
+    assert store.load_response("a")["articles"][0]["title"] == "新标题"
+
+
+def test_deleted_articles_skipped_in_snapshots(store):
+    store.save_response("a", "get_articles/", {"user_id": 1}, {"articles": [article(1), article(2), article(3)]})
+    store.delete_articles("task", [2])
+    store.delete_articles("keyword", [1])
+    assert [a["article_id"] for a in store.load_response("a")["articles"]] == [1, 3]
+
+
+def test_persists_across_reopen(path):
+    store = ArticleStore(path)
+    store.save_response("a", "get_articles/", {"user_id": 1}, {"articles": [article(1)]})
+    store.save_quick_task(1, "http://x", {"summary": "s"})
+    store.close()
+
+    store = ArticleStore(path)
+    try:
+        assert store.load_response("a") == {"articles": [article(1)]}
+        assert store.load_quick_task(1, "http://x") == {"summary": "s"}
+        assert store.load_quick_task(2, "http://x") is None
+    finally:
+        store.close()
+
+
+def test_header_list_keeps_saved_body(store):
+    store.save_response("a", "get_articles/", {"user_id": 1}, {"articles": [article(1, content_summary="摘要")]})
+    # 摘要模式的列表没有正文，之前保存的正文保留
+    store.save_response("a", "get_articles/", {"user_id": 1}, {"articles": [{"article_id": 1, "title": "新"}]})
+    saved = store.load_response("a")["articles"][0]
+    assert saved == {"article_id": 1, "title": "新", "content": "正文1", "content_summary": "摘要"}
+
+
+def test_save_and_load_body(store):
+    store.save_response("a", "get_articles/", {"user_id": 1}, {"articles": [{"article_id": 1, "title": "t"}]})
+    assert store.load_body("task", 1) is None
+
+    store.save_body("task", 1, {"content": "单独获取的正文"})
+    assert store.load_body("task", 1) == {"content": "单独获取的正文"}
+    assert store.load_body("category", 1) is None
+    assert store.load_response("a")["articles"][0]["content"] == "单独获取的正文"
+
+    store.save_body("task", 1, None)
+    assert store.load_body("task", 1) is None
+    assert store.load_response("a")["articles"][0] == {"article_id": 1, "title": "t"}
+    # 没有保存的文章不受影响
+    store.save_body("task", 99, {"content": "x"})
+    assert store.load_body("task", 99) is None
+
+
+def save_category(store, *articles, user_id=1):
+    store.save_response(f"c{user_id}", "get_filtered_articles/", {"user_id": user_id},
+                        {"articles_by_category": {"Finance": list(articles)}})
+
+
+def hit_ids(hits):
+    return [hit["article"]["article_id"] for hit in hits]
+
+
+def test_search_cjk_and_title_weight(store):
+    save_category(store,
+                  article(1, title="体育新闻", content="中国经济增长放缓", category="Finance"),
+                  article(2, title="中国经济观察", content="无关内容", category="Finance"),
+                  article(3, title="Economy", content="Global ECONOMY news", category="Tech"))
+    assert hit_ids(store.search_articles("中国经济")) == [2, 1]
+    assert hit_ids(store.search_articles("经")) == [2, 1]
+    # 英文不区分大小写，最后一个词按前缀匹配
+    assert hit_ids(store.search_articles("econ")) == [3]
+    assert store.search_articles("") == []
+    assert store.search_articles("不存在的词") == []
+
+
+def test_search_spans_and_filters(store):
+    save_category(store, article(1, title="中国经济", content="关于中国经济的报道", category="Finance"))
+    save_category(store, article(2, title="中国经济", category="Tech"), user_id=2)
+    store.save_response("t", "get_articles/", {"user_id": 1}, {"articles": [article(3, title="中国经济")]})
+
+    hits = store.search_articles("中国经济", kind="category", user_id=1)
+    assert hit_ids(hits) == [1]
+    assert hits[0]["kind"] == "category"
+    assert hits[0]["title_spans"] == [(0, 4)]
+    assert hits[0]["content_spans"] == [(2, 6)]
+    assert hit_ids(store.search_articles("中国经济", categories=["Tech"])) == [2]
+    assert hit_ids(store.search_articles("中国经济", kind="task")) == [3]
+    assert len(store.search_articles("中国经济", limit=2)) == 2
+
+
+def test_index_follows_updates_and_deletes(store):
+    save_category(store, article(1, title="旧标题", content="x"))
+    save_category(store, article(1, title="新标题", content="x"))
+    assert store.search_articles("旧标题") == []
+    assert hit_ids(store.search_articles("新标题")) == [1]
+
+    store.save_body("category", 1, {"content": "补充的正文段落"})
+    assert hit_ids(store.search_articles("正文段落")) == [1]
+
+    store.delete_articles("category", [1])
+    assert store.search_articles("新标题") == []
+
+
+def test_index_backfilled_for_old_database(path):
+    store = ArticleStore(path)
+    save_category(store, article(1, title="中国经济"))
+    # 模拟没有全文索引的旧数据库
+    store._conn.execute("DELETE FROM articles_fts")
+    store._conn.commit()
+    store.close()
+
+    store = ArticleStore(path)
+    try:
+        assert hit_ids(store.search_articles("中国")) == [1]
+    finally:
+        store.close()
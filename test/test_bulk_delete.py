@@ -0,0 +1,86 @@
+import pytest
+
+from fake_engine import FakeEngine
+from utils.bulk_delete import BulkDelete
+
+
+class FakeDelete:
+    """替身删除接口，记录每批ID，failing 中的ID所在批次失败"""
+
+    def __init__(self):
+        self.calls = []
+        self.failing = set()
+
+    def __call__(self, user_id, article_ids):
+        self.calls.append((user_id, list(article_ids)))
+        if self.failing.intersection(article_ids):
+            raise OSError("delete failed")
+        return {"deleted": len(article_ids)}
+
+
+@pytest.fixture
+def engine():
+    return FakeEngine()
+
+
+@pytest.fixture
+def delete_fn():
+    return FakeDelete()
+
+
+def make_bulk(engine, delete_fn, count, **kwargs):
+    bulk = BulkDelete(engine, delete_fn, "u1", list(range(count)), **kwargs)
+    bulk.progress_log, bulk.results = [], []
+    bulk.progress.connect(lambda done, total: bulk.progress_log.append((done, total)))
+    bulk.finished.connect(lambda deleted, failed, error: bulk.results.append((deleted, failed, error)))
+    return bulk
+
+
+def test_splits_into_chunks_with_limited_concurrency(qapp, engine, delete_fn):
+    bulk = make_bulk(engine, delete_fn, 120, chunk_size=50, concurrency=2)
+    bulk.start()
+    assert len(engine.pending()) == 2
+
+    engine.run(engine.pending()[0])
+    # 一批返回后补上下一批，同时进行的仍不超过 2
+    assert len(engine.pending()) == 2
+    engine.run_all()
+
+    assert [len(ids) for _, ids in delete_fn.calls] == [50, 50, 20]
+    assert all(user_id == "u1" for user_id, _ in delete_fn.calls)
+    assert bulk.progress_log == [(50, 120), (100, 120), (120, 120)]
+    assert bulk.results == [(list(range(120)), [], None)]
+
+
+def test_failed_chunks_are_reported(qapp, engine, delete_fn):
+    delete_fn.failing = {60}
+    bulk = make_bulk(engine, delete_fn, 120, chunk_size=50, concurrency=2)
+    bulk.start()
+    engine.run_all()
+
+    deleted, failed, error = bulk.results[0]
+    assert sorted(deleted) == list(range(50)) + list(range(100, 120))
+    assert failed == list(range(50, 100))
+    assert isinstance(error, OSError)
+
+
+def test_cancel_waits_for_running_chunks(qapp, engine, delete_fn):
+    bulk = make_bulk(engine, delete_fn, 200, chunk_size=50, concurrency=2)
+    bulk.start()
+    bulk.cancel()
+    assert bulk.results == []
+
+    engine.run_all()
+    # 取消后不再发出新批次，在途的两批照常完成
+    assert len(delete_fn.calls) == 2
+    deleted, failed, error = bulk.results[0]
+    assert sorted(deleted) == list(range(100))
+    assert sorted(failed) == list(range(100, 200))
+    assert len(bulk.results) == 1
+
+
+def test_empty_list_finishes_immediately(qapp, engine, delete_fn):
+    bulk = make_bulk(engine, delete_fn, 0)
+    bulk.start()
+    assert bulk.results == [([], [], None)]
+    assert engine.handles == []
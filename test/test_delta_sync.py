@@ -0,0 +1,41 @@
+from utils.delta_sync import merge_delta
+
+
+def article(article_id, updated_at="2024-01-01"):
+    return {"article_id": article_id, "updated_at": updated_at}
+
+
+def test_merge_delta_reuses_unchanged_records():
+    previous = {"articles": [article(1), article(2), article(3)], "total": 3}
+    changed = article(2, "2024-01-02")
+    delta = {"delta": True, "ids": [4, 2, 1], "articles": [article(4), changed], "total": 3}
+
+    merged = merge_delta(previous, delta, "articles", "article_id")
+    assert [record["article_id"] for record in merged["articles"]] == [4, 2, 1]
+    assert merged["articles"][1] is changed
+    assert merged["articles"][2] is previous["articles"][0]
+    assert merged["total"] == 3
+    assert "delta" not in merged and "ids" not in merged
+
+
+def test_merge_delta_unchanged_returns_previous():
+    previous = {"articles": [article(1), article(2)], "total": 2}
+    delta = {"delta": True, "ids": [1, 2], "articles": [], "total": 2}
+    assert merge_delta(previous, delta, "articles", "article_id") is previous
+
+
+def test_merge_delta_grouped_ids():
+    previous = {"articles_by_category": {"Finance": [article(1)], "Tech": [article(2)]}, "total_count": 2}
+    delta = {"delta": True, "ids": {"Finance": [1]}, "articles_by_category": {}, "total_count": 1}
+    merged = merge_delta(previous, delta, "articles_by_category", "article_id")
+    assert merged == {"articles_by_category": {"Finance": [article(1)]}, "total_count": 1}
+
+
+def test_merge_delta_unknown_record_needs_full_download():
+    previous = {"articles": [article(1)]}
+    delta = {"delta": True, "ids": [1, 9], "articles": []}
+    assert merge_delta(previous, delta, "articles", "article_id") is None
+
+
+def test_merge_delta_without_ids():
+    assert merge_delta({"articles": []}, {"articles": [article(1)]}, "articles", "article_id") is None
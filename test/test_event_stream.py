@@ -0,0 +1,102 @@
+import time
+
+import pytest
+from event_server import EventServer
+from utils.event_stream import EventStream, sse_lines
+
+
+@pytest.fixture
+def server():
+    server = EventServer(keepalive=0.2).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stream(qapp, server):
+    stream = EventStream(server.url, base_delay=0.05, max_delay=0.2, jitter=0, read_timeout=5)
+    stream.received = []
+    stream.states = []
+    stream.event_received.connect(lambda event_type, data: stream.received.append((event_type, data)))
+    stream.connection_changed.connect(stream.states.append)
+    yield stream
+    stream.close()
+
+
+def wait_for(qapp, predicate, timeout=5):
+    """处理事件直到条件成立，信号从后台线程排队送到这里"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_receives_events_for_user(qapp, server, stream):
+    stream.start(7)
+    assert wait_for(qapp, stream.is_connected)
+    server.publish("task_status", {"task_id": 1, "status": "完成"}, user_id=7)
+    server.publish("task_status", {"task_id": 2}, user_id=8)
+    server.publish("articles_added", {"task_id": 3})
+    assert wait_for(qapp, lambda: len(stream.received) == 2)
+    assert stream.received == [("task_status", {"task_id": 1, "status": "完成"}),
+                               ("articles_added", {"task_id": 3})]
+    assert stream.last_event_id == "3"
+
+
+def test_reconnects_and_replays_missed_events(qapp, server, stream):
+    stream.start(7)
+    assert wait_for(qapp, stream.is_connected)
+    server.publish("task_status", {"task_id": 1})
+    assert wait_for(qapp, lambda: len(stream.received) == 1)
+
+    # 断线期间发布的事件在重连后按 Last-Event-ID 补发，已收到的不再重复
+    server.drop_connections()
+    assert wait_for(qapp, lambda: False in stream.states)
+    server.publish("task_status", {"task_id": 2})
+    assert wait_for(qapp, lambda: len(stream.received) >= 2)
+    assert wait_for(qapp, stream.is_connected)
+    time.sleep(0.3)
+    qapp.processEvents()
+    assert stream.received == [("task_status", {"task_id": 1}), ("task_status", {"task_id": 2})]
+    assert stream.states[:3] == [True, False, True]
+
+
+def test_new_user_starts_without_last_event_id(qapp, server, stream):
+    server.publish("task_status", {"task_id": 1})
+    stream.start(7)
+    assert wait_for(qapp, lambda: len(stream.received) == 1)
+    stream.start(8)
+    assert stream.last_event_id is None
+    assert wait_for(qapp, lambda: len(stream.received) == 2)
+    stream.start(8)
+    time.sleep(0.3)
+    qapp.processEvents()
+    assert len(stream.received) == 2
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\r"])
+def test_other_line_endings(qapp, newline):
+    server = EventServer(keepalive=0.2, newline=newline).start()
+    stream = EventStream(server.url, base_delay=0.05, jitter=0, read_timeout=5)
+    received = []
+    stream.event_received.connect(lambda event_type, data: received.append((event_type, data)))
+    try:
+        stream.start(7)
+        assert wait_for(qapp, stream.is_connected)
+        server.publish("task_status", {"task_id": 1, "status": "完成"})
+        server.publish("articles_added", {"task_id": 2})
+        assert wait_for(qapp, lambda: len(received) == 2)
+        assert received == [("task_status", {"task_id": 1, "status": "完成"}),
+                            ("articles_added", {"task_id": 2})]
+        assert stream.last_event_id == "2"
+    finally:
+        stream.close()
+        server.stop()
+
+
+def test_sse_lines_split_crlf_across_chunks():
+    chunks = [b"event: a\r", b"\ndata: 1\r\n\r", b"\n:x\rdata: \xe4\xb8", b"\xad\n\nlast"]
+    assert list(sse_lines(chunks)) == ["event: a", "data: 1", "", ":x", "data: 中", "", "last"]
@@ -0,0 +1,81 @@
+import pytest
+
+from fake_engine import FakeEngine
+from utils.job_manager import (JOB_CANCELLED, JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING,
+                               JobManager)
+
+
+@pytest.fixture
+def engine():
+    return FakeEngine()
+
+
+@pytest.fixture
+def manager(qapp, engine):
+    manager = JobManager(max_workers=3)
+    manager.engine = engine
+    return manager
+
+
+def work(value):
+    return value
+
+
+def fail():
+    raise OSError("down")
+
+
+def statuses(jobs):
+    return [job.status for job in jobs]
+
+
+def test_runs_at_most_max_workers(manager, engine):
+    jobs = [manager.submit(f"作业 {i}", work, i) for i in range(5)]
+    assert statuses(jobs) == [JOB_RUNNING] * 3 + [JOB_QUEUED] * 2
+
+    engine.run(jobs[0].handle)
+    assert jobs[0].status == JOB_DONE and jobs[0].result == 0
+    assert jobs[3].status == JOB_RUNNING and jobs[4].status == JOB_QUEUED
+
+    engine.run_all()
+    assert statuses(jobs) == [JOB_DONE] * 5
+
+
+def test_group_limit_lets_other_groups_pass(manager, engine):
+    manager.set_group_limit("translate", 2)
+    translations = [manager.submit(f"翻译 {i}", work, i, group="translate") for i in range(4)]
+    other = manager.submit("分类", work, "x", group="classify")
+
+    # 翻译分组只占两个名额，后提交的其他作业不必等它们
+    assert statuses(translations) == [JOB_RUNNING, JOB_RUNNING, JOB_QUEUED, JOB_QUEUED]
+    assert other.status == JOB_RUNNING
+
+    engine.run(translations[1].handle)
+    assert translations[2].status == JOB_RUNNING
+    assert translations[3].status == JOB_QUEUED
+
+    engine.run_all()
+    assert statuses(translations) == [JOB_DONE] * 4
+
+
+def test_failed_job_keeps_error_and_frees_slot(manager, engine):
+    manager.set_group_limit("translate", 1)
+    failing = manager.submit("翻译 1", fail, group="translate")
+    queued = manager.submit("翻译 2", work, 2, group="translate")
+    engine.run(failing.handle)
+    assert failing.status == JOB_FAILED and isinstance(failing.error, OSError)
+    assert queued.status == JOB_RUNNING
+
+
+def test_cancel_group_drops_queued_and_running_jobs(manager, engine):
+    manager.set_group_limit("translate", 1)
+    translations = [manager.submit(f"翻译 {i}", work, i, group="translate") for i in range(3)]
+    other = manager.submit("分类", work, "x", group="classify")
+    manager.cancel_group("translate")
+
+    assert statuses(translations) == [JOB_CANCELLED] * 3
+    assert manager.active_jobs("translate") == []
+    engine.run_all()
+    # 已取消作业的结果被丢弃
+    assert translations[0].result is None
+    assert other.status == JOB_DONE
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from utils.json_codec import ArrayStream
+
+DOCUMENT = {
+    "total": 3,
+    "articles": [
+        {"article_id": 1, "title": "中国经济", "score": 9.5},
+        {"article_id": 2, "title": "Économie \"quoted\" [x]", "tags": [1, 2, {"a": "}"}]},
+        {"article_id": 3, "title": "", "score": 10},
+    ],
+    "next_cursor": None,
+}
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64, 100000])
+def test_array_stream_chunk_boundaries(size):
+    # 分块可能切在多字节字符、字符串、数字的中间
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    stream = ArrayStream(split(data, size), "articles")
+    assert list(stream) == DOCUMENT["articles"]
+    assert stream.fields == {"total": 3, "next_cursor": None}
+
+
+def test_array_stream_number_at_chunk_end():
+    stream = ArrayStream([b'{"articles": [12', b'34, 5', b'6]}'], "articles")
+    assert list(stream) == [1234, 56]
+
+
+def test_array_stream_without_list():
+    stream = ArrayStream([b'{"error": "x", "code": 3}'], "articles")
+    assert list(stream) == []
+    assert stream.fields == {"error": "x", "code": 3}
+
+
+def test_array_stream_empty_list_and_object():
+    stream = ArrayStream([b'{"articles": [] }'], "articles")
+    assert list(stream) == []
+    assert list(ArrayStream([b" {}"], "articles")) == []
+
+
+def test_array_stream_truncated():
+    with pytest.raises(ValueError):
+        list(ArrayStream([b'{"articles": [{"article_id": 1}'], "articles"))
@@ -0,0 +1,34 @@
+from utils.page_cursor import PageCursor
+
+
+def test_offset_pages():
+    cursor = PageCursor()
+    cursor.record(1, {"articles": []})
+    assert not cursor.is_keyset()
+    assert cursor.params(2) == {"page": 2, "cursor": None}
+    assert cursor.has_next(1, 10, 25)
+    assert cursor.has_next(2, 10, 25)
+    assert not cursor.has_next(3, 10, 25)
+    assert not cursor.has_next(1, 10, None)
+
+
+def test_keyset_pages():
+    cursor = PageCursor()
+    cursor.record(1, {"next_cursor": "abc"})
+    assert cursor.is_keyset()
+    assert cursor.params(2) == {"page": None, "cursor": "abc"}
+    # 游标分页不看 total
+    assert cursor.has_next(1, 10, 5)
+    cursor.record(2, {"next_cursor": None})
+    assert cursor.last_page == 2
+    assert not cursor.has_next(2, 10, 1000)
+
+
+def test_bind_resets_on_new_context():
+    cursor = PageCursor()
+    cursor.bind(("Finance",))
+    cursor.record(1, {"next_cursor": "abc"})
+    cursor.bind(("Finance",))
+    assert cursor.is_keyset()
+    cursor.bind(("Tech",))
+    assert not cursor.is_keyset()
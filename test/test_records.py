@@ -0,0 +1,44 @@
+import pickle
+import sys
+
+import pytest
+
+from utils.records import ArticleRecord, LAZY_MIN_LENGTH
+
+
+def test_long_body_is_compressed():
+    content = "正文" * LAZY_MIN_LENGTH
+    record = ArticleRecord({"article_id": 1, "content": content, "content_summary": "短"})
+    assert isinstance(record._raw("content"), bytes)
+    assert len(record._raw("content")) < len(content.encode("utf-8"))
+    assert record["content"] == content
+    assert record._raw("content_summary") == "短"
+
+
+def test_interned_fields_and_dict_compatibility():
+    category = "".join(["Fin", "ance"])
+    data = {"article_id": 1, "category": category, "extra_field": [1]}
+    record = ArticleRecord(data)
+    assert record["category"] is sys.intern("Finance")
+    assert record == data and dict(record) == data
+    assert record.get("title") is None and "title" not in record
+    assert record["extra_field"] == [1]
+    with pytest.raises(KeyError):
+        record["title"]
+    with pytest.raises(AttributeError):
+        record.title = "x"
+
+
+def test_replace_returns_new_record():
+    content = "a" * LAZY_MIN_LENGTH
+    record = ArticleRecord({"article_id": 1, "title": "old", "content": "short"})
+    replaced = record.replace(title="new", content=content)
+    assert record["title"] == "old" and record["content"] == "short"
+    assert replaced["title"] == "new" and replaced["content"] == content
+    assert isinstance(replaced._raw("content"), bytes)
+    assert replaced != record
+
+
+def test_record_pickles():
+    record = ArticleRecord({"article_id": 1, "content": "b" * LAZY_MIN_LENGTH})
+    assert pickle.loads(pickle.dumps(record)) == record
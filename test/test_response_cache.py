@@ -0,0 +1,67 @@
+import pytest
+
+from utils import response_cache
+from utils.response_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl_by_longest_prefix(clock):
+    cache = ResponseCache(ttls={"api/": 10, "api/tasks/": 60}, default_ttl=5)
+    cache.put("api/tasks/1/", {"page": 1}, "tasks")
+    cache.put("api/other/", None, "other")
+    cache.put("get_articles/", None, "articles")
+
+    clock[0] += 6
+    assert cache.get("get_articles/") is None
+    assert cache.get("get_articles/", allow_stale=True) == "articles"
+    assert cache.get("api/other/") == "other"
+    clock[0] += 5
+    assert cache.get("api/other/") is None
+    assert cache.get("api/tasks/1/", {"page": 1}) == "tasks"
+
+
+def test_key_ignores_param_order_and_empty_values():
+    cache = ResponseCache()
+    cache.put("get_filtered_articles/", {"category_names": ["b", "a"], "page": 1, "cursor": None}, "data")
+    assert cache.get("get_filtered_articles/", {"page": "1", "category_names": ("a", "b")}) == "data"
+
+
+def test_stale_entry_only_with_allow_stale(clock):
+    cache = ResponseCache()
+    cache.put("get_articles/", None, "old", stale=True)
+    assert cache.get("get_articles/") is None
+    assert cache.get("get_articles/", allow_stale=True) == "old"
+
+
+def test_validator_dropped_when_data_changes_locally():
+    cache = ResponseCache()
+    cache.put("get_articles/", {"user_id": 1}, {"articles": [1, 2]}, validator='"v1"')
+    assert cache.validator("get_articles/", {"user_id": 1}) == '"v1"'
+    assert cache.validator("get_articles/", {"user_id": 2}) is None
+
+    cache.update("get_articles/", lambda data: data, user_id=1)
+    assert cache.validator("get_articles/", {"user_id": 1}) == '"v1"'
+    cache.update("get_articles/", lambda data: {"articles": [1]}, user_id=1)
+    assert cache.get("get_articles/", {"user_id": 1}) == {"articles": [1]}
+    assert cache.validator("get_articles/", {"user_id": 1}) is None
+
+
+def test_invalidate_by_params_and_lru():
+    cache = ResponseCache(max_entries=2)
+    cache.put("get_articles/", {"user_id": 1, "task_id": 1}, "a")
+    cache.put("get_articles/", {"user_id": 1, "task_id": 2}, "b")
+    cache.invalidate("get_articles/", task_id=1)
+    assert cache.get("get_articles/", {"user_id": 1, "task_id": 1}) is None
+    assert cache.get("get_articles/", {"user_id": 1, "task_id": 2}) == "b"
+
+    cache.put("c/", None, "c")
+    cache.get("get_articles/", {"user_id": 1, "task_id": 2})
+    cache.put("d/", None, "d")
+    assert cache.get("c/") is None
+    assert cache.get("get_articles/", {"user_id": 1, "task_id": 2}) == "b"
@@ -0,0 +1,34 @@
+from utils.search_index import tokenize, build_match_query
+
+
+def words(text, **kwargs):
+    return [token for token, _, _ in tokenize(text, **kwargs)]
+
+
+def test_tokenize_cjk_bigrams():
+    assert words("中国经济") == ["中国", "国经", "经济", "济"]
+    assert tokenize("中国") == [("中国", 0, 2), ("国", 1, 2)]
+
+
+def test_tokenize_mixed_text():
+    assert words("AI 改变, Economy2024!") == ["ai", "改变", "变", "economy2024"]
+    assert tokenize("x 中文")[1:] == [("中文", 2, 4), ("文", 3, 4)]
+
+
+def test_tokenize_for_query_drops_trailing_single():
+    assert words("中国经济", for_query=True) == ["中国", "国经", "经济"]
+    assert words("中", for_query=True) == ["中"]
+    # 只有最后一段不追加单字
+    assert words("中国 经济", for_query=True) == ["中国", "国", "经济"]
+
+
+def test_build_match_query():
+    assert build_match_query("中国经济") == '"中国 国经 经济" *'
+    assert build_match_query("中国  Econ") == '"中国" * AND "econ" *'
+    assert build_match_query("中") == '"中" *'
+
+
+def test_build_match_query_nothing_searchable():
+    assert build_match_query("") is None
+    assert build_match_query(None) is None
+    assert build_match_query(" ,.!？ ") is None
@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def run_collapsed(flight, fn, followers):
+    """准备 followers + 1 个相同的调用线程，返回 (线程列表, 结果列表)，异常也作为结果"""
+    results = []
+
+    def call():
+        try:
+            results.append(flight.do("key", fn, endpoint="get_articles/"))
+        except Exception as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(followers + 1)]
+    return threads, results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return {"articles": []}
+
+    threads, results = run_collapsed(flight, fn, followers=4)
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.stats().get("get_articles/", 0) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert flight.in_flight() == 1
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 5 and all(result is results[0] for result in results)
+    assert flight.stats() == {"get_articles/": 4}
+    assert flight.in_flight() == 0
+
+
+def test_followers_share_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ValueError("boom")
+
+    threads, results = run_collapsed(flight, fn, followers=2)
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.stats().get("get_articles/", 0) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(results) == 3 and all(isinstance(result, ValueError) for result in results)
+
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    with pytest.raises(KeyError):
+        flight.do("key", lambda: {}["missing"])
+    assert flight.stats() == {}
@@ -0,0 +1,114 @@
+import pytest
+
+from fake_engine import FakeEngine
+from utils.status_poller import StatusPoller
+
+
+@pytest.fixture
+def engine():
+    return FakeEngine()
+
+
+@pytest.fixture
+def poller(qapp, engine):
+    poller = StatusPoller(engine, base_interval=1, max_interval=8, factor=2, jitter=0)
+    poller.changed, poller.completed = [], []
+    poller.task_changed.connect(poller.changed.append)
+    poller.task_completed.connect(poller.completed.append)
+    yield poller
+    poller.timer.stop()
+
+
+def tasks(*statuses):
+    return {"tasks": [{"task_id": i, "status": status} for i, status in enumerate(statuses, 1)]}
+
+
+def poll_once(poller, engine):
+    poller.poll()
+    engine.run_all()
+
+
+def test_watches_only_active_tasks(poller):
+    server = tasks("执行中", "完成", "排队中")
+    poller.watch(lambda: server, server["tasks"])
+    assert poller.watched == {1: "执行中", 3: "排队中"}
+    assert poller.timer.isActive() and poller.timer.interval() == 1000
+
+
+def test_backoff_and_reset_on_change(poller, engine):
+    server = tasks("执行中", "排队中")
+    poller.watch(lambda: server, server["tasks"])
+    intervals = []
+    for _ in range(5):
+        poll_once(poller, engine)
+        intervals.append(poller.timer.interval())
+    assert intervals == [2000, 4000, 8000, 8000, 8000]
+
+    server["tasks"][1]["status"] = "执行中"
+    poll_once(poller, engine)
+    assert poller.timer.interval() == 1000
+    assert [task["task_id"] for task in poller.changed] == [2]
+
+
+def test_completion_stops_watching(poller, engine):
+    server = tasks("执行中")
+    poller.watch(lambda: server, server["tasks"])
+    server["tasks"][0]["status"] = "完成"
+    poll_once(poller, engine)
+    assert poller.completed == [{"task_id": 1, "status": "完成"}]
+    assert poller.watched == {} and not poller.timer.isActive()
+
+
+def test_failed_poll_backs_off(poller, engine):
+    def fetch():
+        raise OSError("down")
+
+    poller.watch(fetch, tasks("执行中")["tasks"])
+    poll_once(poller, engine)
+    poll_once(poller, engine)
+    assert poller.timer.interval() == 4000
+
+
+def test_background_keeps_polling_and_notifies(poller, engine):
+    server = tasks("执行中")
+    poller.watch(lambda: server, server["tasks"])
+    poller.set_background(True)
+    assert poller.timer.isActive() and poller.timer.interval() == 8000
+    poll_once(poller, engine)
+    assert poller.timer.interval() == 8000
+
+    server["tasks"][0]["status"] = "完成"
+    poll_once(poller, engine)
+    assert len(poller.completed) == 1
+
+
+def test_foreground_polls_immediately(poller, engine):
+    server = tasks("执行中")
+    poller.watch(lambda: server, server["tasks"])
+    poller.set_background(True)
+    poller.set_background(False)
+    assert len(engine.pending("poll")) == 1
+    engine.run_all()
+    assert poller.timer.interval() == 2000
+
+
+def test_push_pauses_polling(poller, engine):
+    server = tasks("执行中")
+    poller.watch(lambda: server, server["tasks"])
+    poller.set_push_active(True)
+    assert not poller.timer.isActive()
+    # 推送来的状态走同样的比对
+    assert poller.apply([{"task_id": 1, "status": "完成"}])
+    assert len(poller.completed) == 1
+    poller.set_background(False)
+    assert not engine.pending()
+
+
+def test_stop_discards_in_flight_poll(poller, engine):
+    server = tasks("执行中")
+    poller.watch(lambda: server, server["tasks"])
+    poller.poll()
+    poller.stop()
+    engine.run_all()
+    assert not poller.timer.isActive()
+    assert poller.changed == []
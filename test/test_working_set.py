@@ -0,0 +1,76 @@
+import pytest
+
+from utils import working_set
+from utils.working_set import ArticleWorkingSet
+
+ARTICLES = [
+    {"article_id": 1, "category": "Finance", "score": 3, "updated_at": "2024-01-03"},
+    {"article_id": 2, "category": "Tech", "score": 5, "updated_at": "2024-01-01"},
+    {"article_id": 3, "category": "Finance", "score": 5, "updated_at": "2024-01-02"},
+    {"article_id": 4, "category": "Sports", "score": None, "updated_at": None},
+    {"article_id": 5, "category": "Finance", "score": 1, "updated_at": "2024-01-03"},
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(working_set, "numpy", None)
+    elif working_set.numpy is None:
+        pytest.skip("没有安装 numpy")
+    return request.param
+
+
+def make(articles=ARTICLES, complete=True):
+    return ArticleWorkingSet(articles, ["Finance", "Tech", "Sports"], complete)
+
+
+def ids(data):
+    return [article["article_id"] for group in data["articles_by_category"].values() for article in group]
+
+
+def selected_ids(ws, *args):
+    return [ws.articles[row]["article_id"] for row in ws.select(*args)]
+
+
+def test_select_sorts_stably(backend):
+    ws = make()
+    assert selected_ids(ws, ["Finance", "Tech"], "score", "desc") == [2, 3, 1, 5]
+    assert selected_ids(ws, ["Finance"], "score", "asc") == [5, 1, 3]
+    # 更新时间相同的保持原顺序
+    assert selected_ids(ws, ["Finance"], "updated_at", "desc") == [1, 5, 3]
+    assert selected_ids(ws, ["Sports", "Tech"], "updated_at", "asc") == [4, 2]
+
+
+def test_page_matches_server_format(backend):
+    ws = make()
+    first = ws.page(["Finance", "Tech"], "score", "desc", 1, 3)
+    assert first["total_count"] == 4
+    assert ids(first) == [2, 3, 1]
+    assert list(first["articles_by_category"]) == ["Tech", "Finance"]
+    assert ids(ws.page(["Finance", "Tech"], "score", "desc", 2, 3)) == [5]
+
+
+def test_covers_only_complete_known_categories(backend):
+    ws = make()
+    assert ws.covers(["Finance"], "score")
+    assert not ws.covers(["Finance", "Health"], "score")
+    assert not ws.covers([], "score")
+    assert not ws.covers(["Finance"], "title")
+    assert not make(complete=False).covers(["Finance"], "score")
+
+
+def test_from_response_completeness():
+    data = {"articles_by_category": {"Finance": ARTICLES[:2], "Tech": ARTICLES[2:]}, "total_count": 5}
+    assert ArticleWorkingSet.from_response(data, ["Finance", "Tech"]).complete
+    assert not ArticleWorkingSet.from_response(dict(data, total_count=6), ["Finance"]).complete
+    assert not ArticleWorkingSet.from_response(dict(data, next_cursor="x"), ["Finance"]).complete
+    assert not ArticleWorkingSet.from_response({"articles_by_category": {}}, ["Finance"]).complete
+
+
+def test_discard_rebuilds_selection(backend):
+    ws = make(list(ARTICLES))
+    assert selected_ids(ws, ["Finance"], "score", "desc") == [3, 1, 5]
+    assert ws.discard(3)
+    assert not ws.discard(3)
+    assert selected_ids(ws, ["Finance"], "score", "desc") == [1, 5]
@@ -1 +1,2 @@
-from .path_tool import resource_path
\ No newline at end of file
+from .path_tool import resource_path
+from .api_client import ApiClient, ApiError
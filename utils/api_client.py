@@ -0,0 +1,623 @@
+import json
+import threading
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin
+from urllib3.util.request import ACCEPT_ENCODING
+
+from utils.response_cache import ResponseCache
+from utils.single_flight import SingleFlight
+from utils.delta_sync import delta_spec, sync_cursor, merge_delta
+from utils.transfer_stats import TransferStats
+from utils.json_codec import loads, ArrayStream
+from utils.records import ArticleRecord, BODY_FIELDS, compact_response, record_type
+
+# 各列表接口的缓存有效期（秒），任务状态变化较快所以最短
+CACHE_TTLS = {
+    "api/tasks/": 15,
+    "get_filtered_articles/": 60,
+    "get_articles/": 120,
+    "get_keyword_articles/": 120,
+    "api/get_keyword_report/": 300,
+}
+
+# 流式下载时每次读取的字节数，以及每解析出多少条记录交给页面一次
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_BATCH_SIZE = 50
+
+# 文章列表的摘要模式：列表只返回显示需要的字段，正文和摘要由 get_article_bodies/ 按需获取
+HEADER_FIELDS = "headers"
+BODY_PATH = "get_article_bodies/"
+BODY_CACHE_SIZE = 200  # 内存中最多保留多少篇文章的正文
+BODY_TTL = 600
+
+# 删除文章时受影响的列表接口，以及本地存储中要一起删除的文章类别
+DELETE_SCOPES = {
+    "task": (("get_articles/",), ("task",)),
+    "category": (("get_filtered_articles/",), ("category",)),
+    "keyword": (("get_keyword_articles/",), ("keyword",)),
+}
+DROP_LOG_SIZE = 200  # 记住最近多少次乐观删除，用来过滤删除确认之前服务器返回的列表
+
+
+def has_body(article):
+    """列表中的文章是否带有正文（服务器不支持摘要模式时照常返回正文）"""
+    return any(field in article for field in BODY_FIELDS)
+
+
+def without_articles(data, article_ids):
+    """返回去掉指定文章后的响应副本，原响应不变（页面可能还持有它）"""
+    result = dict(data)
+    removed = 0
+    if "articles" in data:
+        result["articles"] = [a for a in data["articles"] if a.get("article_id") not in article_ids]
+        removed += len(data["articles"]) - len(result["articles"])
+    if "articles_by_category" in data:
+        result["articles_by_category"] = {}
+        for category, articles in data["articles_by_category"].items():
+            kept = [a for a in articles if a.get("article_id") not in article_ids]
+            removed += len(articles) - len(kept)
+            result["articles_by_category"][category] = kept
+    if not removed:
+        return data
+    for total_key in ("total", "total_count"):
+        if isinstance(result.get(total_key), int):
+            result[total_key] = max(result[total_key] - removed, 0)
+    return result
+
+
+def validator_of(response):
+    """响应中的 ETag/Last-Modified，都没有时返回 None"""
+    validator = {}
+    if response.headers.get("ETag"):
+        validator["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validator["last_modified"] = response.headers["Last-Modified"]
+    return validator or None
+
+
+def conditional_headers(validator):
+    """条件请求头，服务器据此在数据未变时返回 304"""
+    headers = {}
+    if validator and validator.get("etag"):
+        headers["If-None-Match"] = validator["etag"]
+    if validator and validator.get("last_modified"):
+        headers["If-Modified-Since"] = validator["last_modified"]
+    return headers
+
+
+def wire_size(response, body_bytes):
+    """响应体实际传输的字节数（压缩后），无法获取时按解压后的大小计"""
+    tell = getattr(response.raw, "tell", None)
+    try:
+        size = tell() if tell else None
+    except Exception:
+        size = None
+    return size if size else body_bytes
+
+
+def error_payload(response):
+    """错误响应体不一定是JSON"""
+    try:
+        return loads(response.content)
+    except ValueError:
+        return None
+
+
+class ApiError(Exception):
+    """服务器返回了非预期的状态码"""
+
+    def __init__(self, status_code, text, payload=None):
+        super().__init__(text)
+        self.status_code = status_code
+        self.text = text
+        # 错误响应体不一定是JSON，统一成字典方便页面取 error/message 字段
+        self.payload = payload if isinstance(payload, dict) else {}
+
+
+class ApiClient:
+    """应用级HTTP客户端，所有页面共享同一个连接池"""
+
+    def __init__(self, base_url="http://127.0.0.1:8000/", pool_size=10, timeout=5, store=None,
+                 header_lists=False):
+        self.base_url = base_url
+        self.timeout = timeout
+        # 文章列表只请求摘要字段，正文在详情页需要时再获取
+        self.header_lists = header_lists
+
+        # 保持长连接，避免每次点击都重新握手
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # 接受压缩的响应；安装了 brotli 时 urllib3 还能解压 br
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        # 列表接口的响应缓存，增删改操作会使相关条目失效
+        self.cache = ResponseCache(ttls=CACHE_TTLS)
+        # 文章正文缓存，与列表缓存分开，正文多了不会挤掉列表
+        self.bodies = ResponseCache(max_entries=BODY_CACHE_SIZE, default_ttl=BODY_TTL)
+        # 相同的GET同时只发一次，后到的调用共享结果
+        self.flight = SingleFlight()
+        # 可选的本地持久化存储(ArticleStore)，用于冷启动和离线浏览
+        self.store = store
+        # 各接口的传输量统计，用于确认压缩和条件请求节省的流量
+        self.transfer = TransferStats()
+        # 乐观删除记录 (序号, 删除范围, 用户ID, {文章ID: 确认时的序号，未确认为 None})
+        self._drops = deque(maxlen=DROP_LOG_SIZE)
+        self._drop_seq = 0
+        self._drop_lock = threading.Lock()
+
+    def close(self):
+        """关闭连接池和本地存储"""
+        self.session.close()
+        if self.store:
+            self.store.close()
+
+    def _send(self, method, path, expected=(200,), timeout=None, **kwargs):
+        """发送请求并统计传输量，状态码不符时抛出 ApiError"""
+        response = self.session.request(
+            method,
+            urljoin(self.base_url, path),
+            timeout=timeout or self.timeout,
+            **kwargs
+        )
+        body_bytes = len(response.content)
+        self.transfer.record(path, wire_size(response, body_bytes), body_bytes,
+                             not_modified=response.status_code == 304)
+
+        if response.status_code not in expected:
+            raise ApiError(response.status_code, response.text, error_payload(response))
+
+        return response
+
+    def _request(self, method, path, expected=(200,), timeout=None, **kwargs):
+        """发送请求并返回解析后的JSON，状态码不符时抛出 ApiError"""
+        return loads(self._send(method, path, expected, timeout, **kwargs).content)
+
+    def _get(self, path, params=None, cached_only=False, fresh=False):
+        """带缓存的GET
+
+        cached_only=True 时不访问网络，返回缓存中的数据（即使已过期），内存中没有时
+        再查本地存储，都没有则返回 None。页面可以先用它立即渲染，再在后台请求最新数据。
+        fresh=True 时跳过缓存直接请求服务器（用于状态轮询），结果照常写回缓存。
+        """
+        if fresh:
+            return self.flight.do(self.cache.make_key(path, params),
+                                  lambda: self._fetch(path, params, fresh=True), endpoint=path)
+
+        data = self.cache.get(path, params, allow_stale=cached_only)
+        if data is None and cached_only and self.store:
+            data = compact_response(path, self.store.load_response(self._store_key(path, params)))
+            if data is not None:
+                # 标记为过期，后台刷新时照常访问服务器
+                self.cache.put(path, params, data, stale=True)
+        if data is not None or cached_only:
+            return data
+
+        return self.flight.do(self.cache.make_key(path, params),
+                              lambda: self._fetch(path, params), endpoint=path)
+
+    def _fetch(self, path, params, fresh=False):
+        """请求服务器并写入缓存和本地存储"""
+        # 等待进入时前一个相同请求可能刚刚写入缓存
+        data = None if fresh else self.cache.get(path, params)
+        if data is not None:
+            return data
+        since = self._drop_mark()
+        data, changed, validator = self._sync(path, params)
+        hidden = self._hidden_articles(path, params, since)
+        if hidden:
+            filtered = without_articles(data, hidden)
+            changed = changed or filtered is not data
+            data = filtered
+        if changed:
+            # 缓存中保存紧凑记录；没有变化时数据就是缓存中的旧数据，已经转换过
+            data = compact_response(path, data)
+        self.cache.put(path, params, data, validator=validator)
+        if self.store and changed:
+            self.store.save_response(self._store_key(path, params), path, params, data)
+        return data
+
+    def _sync(self, path, params):
+        """请求最新数据
+
+        缓存中有服务器给过验证器的旧数据时做条件请求，304 表示旧数据仍然有效；
+        支持增量的列表接口再带上 since，只下载变化的记录。
+        返回 (数据, 是否有变化, 验证器)，没有变化时数据就是旧数据本身。
+        """
+        spec = delta_spec(path)
+        validator = self.cache.validator(path, params)
+        previous = self._previous(path, params) if spec or validator else None
+        query = dict(params or {})
+        headers = {}
+        if previous is not None:
+            headers = conditional_headers(validator)
+            since = sync_cursor(previous, spec[0]) if spec else None
+            if since is not None:
+                query["since"] = since
+
+        response = self._send("GET", path, expected=(200, 304) if headers else (200,),
+                              params=query, headers=headers)
+        if response.status_code == 304:
+            return previous, False, validator
+
+        data = loads(response.content)
+        if "since" in query and data.get("delta"):
+            merged = merge_delta(previous, data, *spec)
+            if merged is None:
+                # 增量引用了本地没有的记录，重新完整下载
+                response = self._send("GET", path, params=params)
+                return loads(response.content), True, validator_of(response)
+            return merged, merged is not previous, validator_of(response)
+        # 服务器不支持增量时返回的就是完整数据
+        return data, True, validator_of(response)
+
+    def _get_streaming(self, path, params, list_key, on_partial):
+        """流式GET：列表记录边下载边解析，每 STREAM_BATCH_SIZE 条交给 on_partial 一次
+
+        缓存有效时直接返回缓存，不调用 on_partial。返回完整数据，与 _get 一样写入缓存和本地存储。
+        不经过 SingleFlight：合并的请求拿不到部分结果，发起的请求被取消时还会一起失败。
+        """
+        data = self.cache.get(path, params)
+        if data is not None:
+            return data
+        return self._fetch_streaming(path, params, list_key, on_partial)
+
+    def _fetch_streaming(self, path, params, list_key, on_partial):
+        since = self._drop_mark()
+        response = self.session.get(urljoin(self.base_url, path), params=params,
+                                    stream=True, timeout=self.timeout)
+        with response:
+            if response.status_code != 200:
+                raise ApiError(response.status_code, response.text, error_payload(response))
+
+            body_bytes = 0
+
+            def chunks():
+                nonlocal body_bytes
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    body_bytes += len(chunk)
+                    yield chunk
+
+            stream = ArrayStream(chunks(), list_key)
+            records, batch = [], []
+            cls = record_type(path)[1]
+            hidden = self._hidden_articles(path, params, since)
+            for record in stream:
+                if hidden and record.get("article_id") in hidden:
+                    continue
+                if cls is not None:
+                    record = cls(record)
+                records.append(record)
+                batch.append(record)
+                if len(batch) >= STREAM_BATCH_SIZE:
+                    on_partial(batch)
+                    batch = []
+            if batch:
+                on_partial(batch)
+            self.transfer.record(path, wire_size(response, body_bytes), body_bytes)
+
+        data = dict(stream.fields)
+        data[list_key] = records
+        hidden = self._hidden_articles(path, params, since)
+        if hidden:
+            # 下载期间又有文章被乐观删除
+            data = without_articles(data, hidden)
+        self.cache.put(path, params, data, validator=validator_of(response))
+        if self.store:
+            self.store.save_response(self._store_key(path, params), path, params, data)
+        return data
+
+    def _previous(self, path, params):
+        """增量同步的基准：缓存中的旧数据（即使已过期），没有时查本地存储"""
+        data = self.cache.get(path, params, allow_stale=True)
+        if data is None and self.store:
+            data = compact_response(path, self.store.load_response(self._store_key(path, params)))
+        return data
+
+    def collapsed_requests(self):
+        """各接口因重复而被合并掉的请求数"""
+        return self.flight.stats()
+
+    def transfer_stats(self):
+        """各接口的请求数、传输字节数（压缩前后）和 304 次数"""
+        return self.transfer.stats()
+
+    def _store_key(self, path, params):
+        return json.dumps(self.cache.make_key(path, params), ensure_ascii=False)
+
+    # 用户
+    def login(self, useraccount, password):
+        return self._request("POST", "api/login/",
+                             json={"useraccount": useraccount, "userpwd": password})
+
+    def register(self, username, password):
+        return self._request("POST", "api/register/", expected=(201,),
+                             json={"username": username, "userpwd": password})
+
+    # 任务
+    def get_tasks(self, user_id, page, per_page, task_target, search=None, cached_only=False, fresh=False):
+        params = {
+            "page": page,
+            "per_page": per_page,
+            "task_target": task_target
+        }
+        if search:
+            params["search"] = search
+        return self._get(f"api/tasks/{user_id}/", params, cached_only, fresh)
+
+    def process_articles(self, user_id, task_id):
+        # 处理可能需要更长时间
+        result = self._request("POST", "api/process-articles/", timeout=30,
+                               json={"user_id": user_id, "task_id": task_id})
+        # 分类结果会改变任务下的文章和分类文章列表
+        self.cache.invalidate("get_articles/", task_id=task_id)
+        self.cache.invalidate("get_filtered_articles/", user_id=user_id)
+        self.cache.invalidate(f"api/tasks/{user_id}/")
+        return result
+
+    def get_keyword_report(self, user_id, task_id, cached_only=False):
+        return self._get("api/get_keyword_report/",
+                         {"user_id": user_id, "task_id": task_id}, cached_only)
+
+    def quick_task(self, user_id, url):
+        result = self._request("POST", "desktop/quick_task/", timeout=30,
+                               json={"user_id": user_id, "url": url})
+        if self.store:
+            self.store.save_quick_task(user_id, url, result)
+        return result
+
+    def cached_quick_task(self, user_id, url):
+        """本地保存的快速任务结果，没有时返回 None"""
+        return self.store.load_quick_task(user_id, url) if self.store else None
+
+    # 文章
+    def get_articles(self, user_id, task_id, page=None, per_page=None, cached_only=False, on_partial=None):
+        """任务下的文章，指定 page/per_page 时只取一页
+
+        给出 on_partial 时流式下载，文章边解析边分批交给 on_partial。
+        """
+        params = self._list_params({"user_id": user_id, "task_id": task_id, "page": page, "per_page": per_page})
+        if on_partial is not None and not cached_only:
+            return self._get_streaming("get_articles/", params, "articles", on_partial)
+        return self._get("get_articles/", params, cached_only)
+
+    def list_article_ids(self, user_id, task_id, per_page=100):
+        """任务下全部文章的ID，逐页获取"""
+        article_ids = []
+        page = 1
+        while True:
+            data = self.get_articles(user_id, task_id, page=page, per_page=per_page)
+            articles = data.get("articles", [])
+            total = data.get("total")
+            if total is None and len(articles) > per_page:
+                # 服务器忽略了分页参数，一次返回了全部文章
+                return [article["article_id"] for article in articles]
+            article_ids.extend(article["article_id"] for article in articles)
+            if not articles or len(articles) < per_page or (total is not None and len(article_ids) >= total):
+                return article_ids
+            page += 1
+
+    def get_keyword_articles(self, user_id, task_id, page=None, per_page=None, cached_only=False, on_partial=None):
+        """关键词任务下的文章，指定 page/per_page 时只取一页，给出 on_partial 时流式下载"""
+        params = self._list_params({"user_id": user_id, "task_id": task_id, "page": page, "per_page": per_page})
+        if on_partial is not None and not cached_only:
+            return self._get_streaming("get_keyword_articles/", params, "articles", on_partial)
+        return self._get("get_keyword_articles/", params, cached_only)
+
+    def get_filtered_articles(self, user_id, category_names, page, per_page,
+                              sort_by, sort_order, search=None, cursor=None, cached_only=False):
+        """按分类筛选文章
+
+        cursor 是上一页响应中的 next_cursor，给出时按游标（keyset）取下一页，page 可以为 None。
+        """
+        params = {
+            "user_id": user_id,
+            "category_names": category_names,
+            "page": page,
+            "per_page": per_page,
+            "sort_by": sort_by,
+            "sort_order": sort_order
+        }
+        if search:
+            params["search"] = search
+        if cursor:
+            params["cursor"] = cursor
+        self._list_params(params)
+        return self._get("get_filtered_articles/", params, cached_only)
+
+    def _list_params(self, params):
+        """摘要模式下文章列表请求带上 fields，不支持的服务器会忽略它"""
+        if self.header_lists:
+            params["fields"] = HEADER_FIELDS
+        return params
+
+    # 正文
+    def article_body(self, user_id, kind, article, cached_only=False):
+        """文章的正文和摘要（只含 BODY_FIELDS 的记录）
+
+        kind 是文章在本地存储中的类别（"task"、"category" 或 "keyword"），与列表接口对应。
+        列表中的文章带有正文时直接取用，否则依次查正文缓存、
+        本地存储，最后请求服务器；cached_only=True 时不访问网络，没有时返回 None。
+        不是摘要模式时列表返回的就是完整文章，没有正文说明文章本身没有，返回空记录。
+        """
+        if has_body(article):
+            return ArticleRecord({field: article[field] for field in BODY_FIELDS if field in article})
+        article_id = article["article_id"]
+        body = self.cached_body(kind, article_id)
+        if body is not None or cached_only:
+            return body
+        if not self.header_lists:
+            return ArticleRecord({})
+        return self.get_article_bodies(user_id, kind, [article_id]).get(article_id)
+
+    def cached_body(self, kind, article_id):
+        """缓存或本地存储中的正文，都没有时返回 None"""
+        key = {"kind": kind, "article_id": article_id}
+        body = self.bodies.get(BODY_PATH, key)
+        if body is None and self.store:
+            body = self.store.load_body(kind, article_id)
+            if body is not None:
+                body = ArticleRecord(body)
+                self.bodies.put(BODY_PATH, key, body)
+        return body
+
+    def get_article_bodies(self, user_id, kind, article_ids):
+        """批量获取正文，已缓存的不再请求，返回 {文章ID: 正文}
+
+        服务器返回 {"bodies": [{"article_id", "content", "content_summary"}, ...]}。
+        不是摘要模式时服务器不一定有这个接口，只返回已缓存的。
+        """
+        bodies = {}
+        missing = []
+        for article_id in article_ids:
+            body = self.cached_body(kind, article_id)
+            if body is not None:
+                bodies[article_id] = body
+            else:
+                missing.append(article_id)
+        if not missing or not self.header_lists:
+            return bodies
+
+        params = {"user_id": user_id, "kind": kind, "article_ids": missing}
+        data = self.flight.do(self.cache.make_key(BODY_PATH, params),
+                              lambda: self._request("GET", BODY_PATH, params=params), endpoint=BODY_PATH)
+        for item in data.get("bodies", []):
+            article_id = item.get("article_id")
+            body = ArticleRecord({field: item[field] for field in BODY_FIELDS if field in item})
+            self.bodies.put(BODY_PATH, {"kind": kind, "article_id": article_id}, body)
+            if self.store:
+                self.store.save_body(kind, article_id, body.to_dict())
+            bodies[article_id] = body
+        return bodies
+
+    def invalidate_body(self, kind, article_id):
+        """文章内容变化（例如翻译完成）后丢弃缓存的正文
+
+        摘要模式下本地存储中单独保存的正文也要删除，下次重新获取；
+        否则正文是列表数据的一部分，随列表刷新更新，不能删掉。
+        """
+        self.bodies.invalidate(BODY_PATH, kind=kind, article_id=article_id)
+        if self.store and self.header_lists:
+            self.store.save_body(kind, article_id, None)
+
+    def search_local(self, user_id, query, kind="category", categories=None, limit=50):
+        """在本地存储的文章中全文检索，不访问网络，没有本地存储时返回空列表"""
+        if not self.store:
+            return []
+        hits = self.store.search_articles(query, kind=kind, user_id=user_id,
+                                          categories=categories, limit=limit)
+        for hit in hits:
+            hit["article"] = ArticleRecord(hit["article"])
+        return hits
+
+    def translate_article(self, user_id, article_id):
+        result = self._request("POST", "api/translate-article/", timeout=30,
+                               json={"article_id": article_id, "user_id": user_id})
+        self.invalidate_articles(user_id)
+        self.invalidate_body("task", article_id)
+        return result
+
+    def delete_articles(self, user_id, article_ids):
+        return self._delete("delete_articles/", "task", user_id, article_ids)
+
+    def delete_keyword_articles(self, user_id, article_ids):
+        result = self._delete("delete_keyword_articles/", "keyword", user_id, article_ids)
+        # 简报由剩下的文章生成
+        self.cache.invalidate("api/get_keyword_report/", user_id=user_id)
+        return result
+
+    def delete_category_articles(self, user_id, article_ids):
+        return self._delete("delete_category_articles/", "category", user_id, article_ids)
+
+    def _delete(self, path, scope, user_id, article_ids):
+        """删除文章：先在本地移除，服务器返回后丢弃本地修改过的列表缓存
+
+        本地只能修改包含这些文章的那几页，其他页的总数和分页位置要以服务器为准，
+        已经显示的页面保留自己的状态，之后加载的页会重新获取。
+        """
+        self.drop_articles(scope, user_id, article_ids)
+        try:
+            result = self._request("DELETE", path,
+                                   json={"article_ids": article_ids, "user_id": user_id})
+        except Exception:
+            self._settle_drop(scope, user_id, article_ids, deleted=False)
+            raise
+        else:
+            self._settle_drop(scope, user_id, article_ids, deleted=True)
+            return result
+        finally:
+            self.invalidate_dropped(scope, user_id)
+
+    def drop_articles(self, scope, user_id, article_ids):
+        """乐观删除：立即从缓存的列表和本地存储中移除文章，不等服务器确认
+
+        页面在GUI线程中先调用它再发出删除请求，返回列表页时看到的就是删除后的缓存。
+        服务器确认之前（以及确认前发出的请求）返回的列表中也会去掉这些文章，
+        页面这时刷新不会把文章加回来。重复调用没有副作用。
+        """
+        endpoints, kinds = DELETE_SCOPES[scope]
+        ids = set(article_ids)
+        with self._drop_lock:
+            self._drop_seq += 1
+            self._drops.append((self._drop_seq, scope, user_id, dict.fromkeys(ids)))
+        for endpoint in endpoints:
+            self.cache.update(endpoint, lambda data: without_articles(data, ids), user_id=user_id)
+        if self.store:
+            for kind in kinds:
+                self.store.delete_articles(kind, list(article_ids))
+
+    def _settle_drop(self, scope, user_id, article_ids, deleted):
+        """删除请求返回：成功时记下确认的序号，失败时不再隐藏这些文章"""
+        ids = set(article_ids)
+        with self._drop_lock:
+            self._drop_seq += 1
+            for _, drop_scope, drop_user, states in self._drops:
+                if drop_scope != scope or drop_user != user_id:
+                    continue
+                for article_id in ids & states.keys():
+                    if deleted:
+                        if states[article_id] is None:
+                            states[article_id] = self._drop_seq
+                    else:
+                        del states[article_id]
+
+    def _drop_mark(self):
+        """请求开始时的删除序号，交给 _hidden_articles()"""
+        with self._drop_lock:
+            return self._drop_seq
+
+    def _hidden_articles(self, path, params, since):
+        """在序号 since 时发出的列表请求，其响应中要去掉的文章ID
+
+        包括还没确认删除的，以及请求发出之后才被删除或确认删除的
+        （服务器可能在删除生效之前就生成了响应）。
+        """
+        user_id = (params or {}).get("user_id")
+        hidden = set()
+        with self._drop_lock:
+            for seq, scope, drop_user, states in self._drops:
+                if drop_user != user_id or not path.startswith(DELETE_SCOPES[scope][0]):
+                    continue
+                hidden.update(article_id for article_id, settled in states.items()
+                              if seq > since or settled is None or settled > since)
+        return hidden
+
+    def invalidate_dropped(self, scope, user_id):
+        """撤销 drop_articles()：丢弃本地修改过的列表缓存，下次重新获取"""
+        for endpoint in DELETE_SCOPES[scope][0]:
+            self.cache.invalidate(endpoint, user_id=user_id)
+
+    def invalidate_task_articles(self, user_id, task_id):
+        """任务有新文章时使它的文章列表和分类文章列表的缓存失效"""
+        self.cache.invalidate("get_articles/", task_id=task_id)
+        self.cache.invalidate("get_keyword_articles/", task_id=task_id)
+        self.cache.invalidate("get_filtered_articles/", user_id=user_id)
+
+    def invalidate_articles(self, user_id):
+        """文章内容变化后使普通任务文章和分类文章列表的缓存失效"""
+        self.cache.invalidate("get_articles/", user_id=user_id)
+        self.cache.invalidate("get_filtered_articles/", user_id=user_id)
@@ -0,0 +1,285 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+_UNSET = object()
+
+
+class ArticleCursor(QObject):
+    """按页懒加载的文章游标，用于详情页逐篇浏览
+
+    fetch(page=, per_page=, cached_only=) 返回一页响应 {"articles": [...], "total": n}。
+    只请求当前文章所在的页，朝浏览方向提前 prefetch 篇预取下一页，
+    离当前页较远的文章会被丢弃，内存中只保留附近几页的正文。
+    服务器忽略分页参数、一次返回全部文章时，退化为整表模式。
+    """
+    current_changed = pyqtSignal()  # 当前文章或加载状态发生变化
+    load_failed = pyqtSignal(object)  # 当前页加载失败
+
+    def __init__(self, engine, owner, per_page=20, prefetch=5, keep_distance=2, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.owner = owner
+        self.per_page = per_page
+        self.prefetch = prefetch
+        self.keep_distance = keep_distance  # 保留与当前页相距不超过该页数的数据
+
+        self.fetch = None
+        self.generation = 0  # 切换任务后丢弃旧任务的迟到响应
+        self.items = {}  # 位置 -> 文章
+        self.sources = {}  # 页码 -> 填充该页的响应列表，同一份缓存不重复处理
+        self.loading = set()  # 正在请求的页码
+        self.pending = set()  # 本地已移除、服务器还没确认删除的文章ID
+        self.needs_reload = False  # 删除确认后是否需要重新加载（移除了位置未知的文章）
+        self.total = None  # 文章总数，未知时为 None
+        self.paged = True  # 服务器是否支持分页
+        self.index = 0
+        self.direction = 1
+        self._shown = (_UNSET, None)  # 上一次通知的 (文章, 是否加载中)
+
+    # 状态
+    def page_of(self, index):
+        return index // self.per_page + 1
+
+    def article(self, index):
+        """指定位置的文章，尚未加载时返回 None"""
+        return self.items.get(index)
+
+    def current(self):
+        return self.article(self.index)
+
+    def is_loading(self):
+        """当前文章所在页是否正在加载"""
+        return self.current() is None and self.page_of(self.index) in self.loading
+
+    def has_prev(self):
+        return self.index > 0
+
+    def has_next(self):
+        return self.total is None or self.index < self.total - 1
+
+    # 操作
+    def reset(self, fetch):
+        """切换到新的文章来源，从第一篇开始"""
+        self.fetch = fetch
+        self.pending = set()
+        self.needs_reload = False
+        self.index = 0
+        self.direction = 1
+        self._shown = (_UNSET, None)
+        self._clear()
+        self.load(1)
+        self._notify()
+
+    def reload(self):
+        """重新加载当前位置，用于数据被修改之后，阅读位置保持不变"""
+        if self.fetch is None:
+            return
+        self._clear()
+        self.load(self.page_of(self.index))
+        self._notify()
+
+    def move(self, step):
+        """向前或向后移动，返回是否移动成功"""
+        target = self.index + step
+        if target < 0 or (self.total is not None and target >= self.total):
+            return False
+        self.index = target
+        self.direction = 1 if step > 0 else -1
+        if self.current() is None:
+            self.load(self.page_of(target))
+        self._evict()
+        self._prefetch()
+        self._notify()
+        return True
+
+    def remove_current(self):
+        """在本地移除当前文章，后面的文章前移一位，阅读位置不变
+
+        服务器确认删除之前它返回的分页仍包含这篇文章，与本地位置对不上，
+        所以这期间不再加载新的页，由 confirm() 或 restore() 继续。
+        返回撤销用的 (文章, 位置)，服务器删除失败时交给 restore()。
+        """
+        article = self.current()
+        if article is None:
+            return None
+        snapshot = (article, self.index)
+
+        self.pending.add(article.get("article_id"))
+        self._drop(self.index)
+        if self.total is not None:
+            self.total -= 1
+            if self.index >= self.total:
+                self.index = max(self.total - 1, 0)
+        if self.total and self.current() is None:
+            self.load(self.page_of(self.index))
+        self._notify()
+        return snapshot
+
+    def restore(self, snapshot):
+        """撤销 remove_current()：把文章放回原位置并显示它，之后的其他删除不受影响"""
+        article, index = snapshot
+        self.pending.discard(article.get("article_id"))
+        self.items = {(position if position < index else position + 1): item
+                      for position, item in self.items.items()}
+        self.items[index] = article
+        self.sources = {}
+        if self.total is not None:
+            self.total += 1
+        self.index = index
+        self._settle()
+        self._notify()
+
+    def remove_ids(self, article_ids):
+        """在本地移除一批文章（不一定已加载），确认之前不再加载新的页"""
+        ids = set(article_ids)
+        self.pending.update(ids)
+        # 没加载的文章不知道位置，确认后整体重新加载
+        self.needs_reload = True
+        for position in sorted((position for position, item in self.items.items()
+                                if item.get("article_id") in ids), reverse=True):
+            self._drop(position)
+        if self.total is not None:
+            self.total = max(self.total - len(ids), 0)
+            if self.index >= self.total:
+                self.index = max(self.total - 1, 0)
+        self._notify()
+
+    def restore_ids(self, article_ids):
+        """批量删除结束后调用：未能删除的文章重新显示，并与服务器同步"""
+        self.pending.difference_update(article_ids)
+        self._settle()
+
+    def confirm(self, article_ids):
+        """服务器已删除这些文章：之后的分页与本地位置一致，继续加载"""
+        self.pending.difference_update(article_ids)
+        self._settle()
+
+    def load(self, page, background=False):
+        """加载一页：先用缓存立即填充，再在后台刷新"""
+        if page in self.loading:
+            return
+        if self.pending:
+            # 删除确认之前先记下，由 _settle() 请求
+            self.loading.add(page)
+            return
+        generation = self.generation
+
+        cached = self.fetch(page=page, per_page=self.per_page, cached_only=True)
+        if cached is not None:
+            self._on_page(generation, page, cached)
+
+        self.loading.add(page)
+        handle = self.engine.submit(
+            self.fetch,
+            page=page,
+            per_page=self.per_page,
+            owner=self.owner,
+            key=f"article_page_{page}"
+        )
+        handle.succeeded.connect(lambda data: self._on_page(generation, page, data))
+        handle.failed.connect(lambda error: self._on_page_failed(generation, page, error, background))
+
+    def _clear(self):
+        self.generation += 1
+        self.items = {}
+        self.sources = {}
+        self.loading = set()
+        self.total = None
+        self.paged = True
+
+    def _drop(self, index):
+        """移除一个位置上的文章，后面的文章前移一位"""
+        self.items = {(position if position < index else position - 1): item
+                      for position, item in self.items.items() if position != index}
+        self.sources = {}
+
+    def _settle(self):
+        """没有待确认的删除时，请求期间暂缓的页；移除过位置未知的文章时整体重新加载"""
+        if self.pending:
+            return
+        if self.needs_reload:
+            self.needs_reload = False
+            self.reload()
+            return
+        deferred, self.loading = self.loading, set()
+        for page in sorted(deferred):
+            self.load(page)
+        self._notify()
+
+    def _on_page(self, generation, page, data):
+        if generation != self.generation:
+            return
+        if self.pending:
+            # 删除前发出的请求，分页与本地位置对不上，等 _settle() 重新请求
+            return
+        self.loading.discard(page)
+        articles = data.get("articles", [])
+        total = data.get("total")
+        if self.sources.get(page) is articles:
+            # 后台刷新命中了同一份缓存
+            self._notify()
+            return
+        self.sources[page] = articles
+
+        if total is None and len(articles) > self.per_page:
+            # 服务器忽略了分页参数，整份列表一次放入
+            self.paged = False
+            self.loading = set()
+            self.items = dict(enumerate(articles))
+            self.total = len(articles)
+        else:
+            start = (page - 1) * self.per_page
+            for offset, article in enumerate(articles):
+                self.items[start + offset] = article
+            if total is not None:
+                self.total = total
+            elif len(articles) < self.per_page:
+                self.total = start + len(articles)
+
+        # 文章被删除后总数可能变少
+        if self.total is not None and self.index >= self.total:
+            self.index = max(self.total - 1, 0)
+            if self.total and self.current() is None:
+                self.load(self.page_of(self.index))
+
+        self._evict()
+        self._prefetch()
+        self._notify()
+
+    def _on_page_failed(self, generation, page, error, background):
+        if generation != self.generation:
+            return
+        self.loading.discard(page)
+        # 预取失败不打扰用户，翻到那一页时会重新请求
+        if not background and page == self.page_of(self.index):
+            self.load_failed.emit(error)
+        self._notify()
+
+    def _prefetch(self):
+        """朝浏览方向预取 prefetch 篇之后的文章所在页"""
+        if not self.paged:
+            return
+        target = self.index + self.direction * self.prefetch
+        if self.total is not None:
+            target = min(target, self.total - 1)
+        target = max(target, 0)
+        if target not in self.items:
+            self.load(self.page_of(target), background=True)
+
+    def _evict(self):
+        """丢弃离当前页较远的文章"""
+        if not self.paged:
+            return
+        current_page = self.page_of(self.index)
+        for position in [position for position in self.items
+                         if abs(self.page_of(position) - current_page) > self.keep_distance]:
+            del self.items[position]
+        for page in [page for page in self.sources if abs(page - current_page) > self.keep_distance]:
+            del self.sources[page]
+
+    def _notify(self):
+        """当前文章或加载状态变化时才发出信号，同一份数据不会重复渲染"""
+        article, loading = self.current(), self.is_loading()
+        if article is self._shown[0] and loading == self._shown[1]:
+            return
+        self._shown = (article, loading)
+        self.current_changed.emit()
@@ -0,0 +1,348 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from utils.search_index import index_text, build_match_query, highlight_spans
+from utils.json_codec import loads
+from utils.records import BODY_FIELDS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY,
+    user_id TEXT,
+    task_target TEXT,
+    status TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_user ON tasks (user_id, task_target);
+
+CREATE TABLE IF NOT EXISTS articles (
+    kind TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    user_id TEXT,
+    task_id INTEGER,
+    category TEXT,
+    score REAL,
+    updated_at TEXT,
+    title TEXT,
+    content TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, article_id)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_task ON articles (kind, task_id);
+CREATE INDEX IF NOT EXISTS idx_articles_user ON articles (user_id, category);
+
+CREATE TABLE IF NOT EXISTS keyword_reports (
+    user_id TEXT NOT NULL,
+    task_id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, task_id)
+);
+
+CREATE TABLE IF NOT EXISTS quick_tasks (
+    user_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL,
+    PRIMARY KEY (user_id, url)
+);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL
+);
+
+-- 标题和正文的全文索引，写入的是切分后的索引词，rowid 由文章类别和ID计算
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, content, tokenize = 'unicode61'
+);
+"""
+
+# 各接口响应中文章记录所属的类别
+ARTICLE_KINDS = {
+    "get_articles/": "task",
+    "get_keyword_articles/": "keyword",
+    "get_filtered_articles/": "category",
+}
+
+# 全文索引 rowid = article_id * 4 + 类别编号
+KIND_CODES = {"task": 0, "keyword": 1, "category": 2}
+
+# 排序权重：标题命中比正文命中重要得多
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+
+class ArticleStore:
+    """本地SQLite存储，按ID保存任务、文章、简报和快速任务结果
+
+    列表响应只保存记录ID组成的快照，读取时再按ID拼回完整响应，
+    同一篇文章出现在多个列表中也只存一份。
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 后台线程和GUI线程共用一个连接，由锁串行化访问
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            # 旧版本的数据库只有文章表，第一次打开时补建全文索引
+            indexed = self._conn.execute("SELECT count(*) FROM articles_fts").fetchone()[0]
+            if not indexed:
+                with self._conn:
+                    self._index_articles(self._conn.execute(
+                        "SELECT kind, article_id, title, content FROM articles"
+                    ).fetchall())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # 响应快照
+    def save_response(self, key, endpoint, params, data):
+        """保存一次GET响应：记录按ID写入各表，列表只保存ID"""
+        params = params or {}
+        user_id = str(params.get("user_id", ""))
+        snapshot = dict(data)
+
+        with self._lock, self._conn:
+            if endpoint.startswith("api/tasks/"):
+                user_id = endpoint.rstrip("/").rsplit("/", 1)[-1]
+                tasks = data.get("tasks", [])
+                self._put_tasks(user_id, params.get("task_target"), tasks)
+                snapshot["tasks"] = [task["task_id"] for task in tasks]
+            elif endpoint in ARTICLE_KINDS and "articles_by_category" in data:
+                kind = ARTICLE_KINDS[endpoint]
+                snapshot["articles_by_category"] = {}
+                for category, articles in data["articles_by_category"].items():
+                    self._put_articles(kind, user_id, None, articles)
+                    snapshot["articles_by_category"][category] = [a["article_id"] for a in articles]
+            elif endpoint in ARTICLE_KINDS:
+                kind = ARTICLE_KINDS[endpoint]
+                articles = data.get("articles", [])
+                self._put_articles(kind, user_id, params.get("task_id"), articles)
+                snapshot["articles"] = [a["article_id"] for a in articles]
+            elif endpoint == "api/get_keyword_report/":
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO keyword_reports (user_id, task_id, data) VALUES (?, ?, ?)",
+                    (user_id, params.get("task_id"), json.dumps(data.get("report", {}), ensure_ascii=False))
+                )
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (key, endpoint, data, stored_at) VALUES (?, ?, ?, ?)",
+                (key, endpoint, json.dumps(snapshot, ensure_ascii=False), time.time())
+            )
+
+    def load_response(self, key):
+        """按快照重建响应，没有快照时返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT endpoint, data FROM snapshots WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            endpoint, raw = row
+            data = loads(raw)
+            if endpoint.startswith("api/tasks/"):
+                data["tasks"] = self._fetch_by_ids("tasks", None, data.get("tasks", []))
+            elif endpoint in ARTICLE_KINDS and "articles_by_category" in data:
+                kind = ARTICLE_KINDS[endpoint]
+                data["articles_by_category"] = {
+                    category: self._fetch_by_ids("articles", kind, ids)
+                    for category, ids in data["articles_by_category"].items()
+                }
+            elif endpoint in ARTICLE_KINDS:
+                data["articles"] = self._fetch_by_ids("articles", ARTICLE_KINDS[endpoint], data.get("articles", []))
+            return data
+
+    # 记录
+    def delete_articles(self, kind, article_ids):
+        """删除文章记录，引用它们的快照在读取时会自动跳过"""
+        if not article_ids:
+            return
+        placeholders = ",".join("?" * len(article_ids))
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"DELETE FROM articles WHERE kind = ? AND article_id IN ({placeholders})",
+                [kind, *article_ids]
+            )
+            self._conn.execute(
+                f"DELETE FROM articles_fts WHERE rowid IN ({placeholders})",
+                [self._fts_rowid(kind, article_id) for article_id in article_ids]
+            )
+
+    # 正文
+    def load_body(self, kind, article_id):
+        """保存过的文章正文 {"content", "content_summary"}，没有时返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM articles WHERE kind = ? AND article_id = ?", (kind, article_id)
+            ).fetchone()
+        if row is None:
+            return None
+        data = loads(row[0])
+        if not any(field in data for field in BODY_FIELDS):
+            return None
+        return {field: data[field] for field in BODY_FIELDS if field in data}
+
+    def save_body(self, kind, article_id, body):
+        """把单独获取的正文写入已保存的文章，body 为 None 时删除保存的正文"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT title, content, data FROM articles WHERE kind = ? AND article_id = ?", (kind, article_id)
+            ).fetchone()
+            if row is None:
+                return
+            title, content, raw = row
+            data = {key: value for key, value in loads(raw).items() if key not in BODY_FIELDS}
+            if body:
+                data.update(body)
+                content = body.get("content", content)
+            self._conn.execute(
+                "UPDATE articles SET content = ?, data = ? WHERE kind = ? AND article_id = ?",
+                (content, json.dumps(data, ensure_ascii=False), kind, article_id)
+            )
+            if body:
+                self._index_articles([(kind, article_id, title, content)])
+
+    # 全文检索
+    def search_articles(self, query, kind=None, user_id=None, categories=None, limit=50):
+        """在本地文章的标题和正文中检索，按相关度排序
+
+        返回 [{"article", "kind", "rank", "title_spans", "content_spans"}]，
+        spans 是查询词在原文中的 (起始偏移, 结束偏移)，用于高亮。
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        sql = (
+            "SELECT a.kind, a.data, bm25(articles_fts, ?, ?) AS rank "
+            "FROM articles_fts JOIN articles a "
+            "ON a.article_id = articles_fts.rowid / 4 AND a.kind = CASE articles_fts.rowid % 4 "
+            + " ".join(f"WHEN {code} THEN '{name}'" for name, code in KIND_CODES.items())
+            + " END WHERE articles_fts MATCH ?"
+        )
+        args = [TITLE_WEIGHT, CONTENT_WEIGHT, match]
+        if kind is not None:
+            sql += " AND a.kind = ?"
+            args.append(kind)
+        if user_id is not None:
+            sql += " AND a.user_id = ?"
+            args.append(str(user_id))
+        if categories:
+            sql += f" AND a.category IN ({','.join('?' * len(categories))})"
+            args.extend(categories)
+        sql += " ORDER BY rank LIMIT ?"
+        args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+
+        results = []
+        for row_kind, raw, rank in rows:
+            article = loads(raw)
+            results.append({
+                "article": article,
+                "kind": row_kind,
+                "rank": rank,
+                "title_spans": highlight_spans(article.get("title"), query),
+                "content_spans": highlight_spans(article.get("content"), query, limit=20),
+            })
+        return results
+
+    def save_quick_task(self, user_id, url, data):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quick_tasks (user_id, url, data, fetched_at) VALUES (?, ?, ?, ?)",
+                (str(user_id), url, json.dumps(data, ensure_ascii=False), time.time())
+            )
+
+    def load_quick_task(self, user_id, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM quick_tasks WHERE user_id = ? AND url = ?", (str(user_id), url)
+            ).fetchone()
+        return loads(row[0]) if row else None
+
+    def _put_tasks(self, user_id, task_target, tasks):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO tasks (task_id, user_id, task_target, status, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(task["task_id"], user_id, task_target, task.get("status"), task.get("created_at"),
+              json.dumps(dict(task), ensure_ascii=False)) for task in tasks]
+        )
+
+    def _put_articles(self, kind, user_id, task_id, articles):
+        articles = self._keep_bodies(kind, articles)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO articles "
+            "(kind, article_id, user_id, task_id, category, score, updated_at, title, content, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(kind, article["article_id"], user_id, article.get("task_id", task_id),
+              article.get("category"), article.get("score"), article.get("updated_at"),
+              article.get("title"), article.get("content"),
+              json.dumps(dict(article), ensure_ascii=False)) for article in articles]
+        )
+        self._index_articles([(kind, article["article_id"], article.get("title"), article.get("content"))
+                              for article in articles])
+
+    def _keep_bodies(self, kind, articles):
+        """摘要模式的列表中没有正文，保留之前保存的正文，返回要写入的文章字典"""
+        articles = [dict(article) for article in articles]
+        headers = {article["article_id"]: article for article in articles
+                   if not any(field in article for field in BODY_FIELDS)}
+        ids = list(headers)
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            for article_id, raw in self._conn.execute(
+                    f"SELECT article_id, data FROM articles WHERE kind = ? AND article_id IN ({placeholders})",
+                    [kind, *batch]):
+                stored = loads(raw)
+                headers[article_id].update((field, stored[field]) for field in BODY_FIELDS if field in stored)
+        return articles
+
+    @staticmethod
+    def _fts_rowid(kind, article_id):
+        return int(article_id) * 4 + KIND_CODES[kind]
+
+    def _index_articles(self, rows):
+        """更新全文索引，rows 为 [(类别, 文章ID, 标题, 正文)]"""
+        rows = [(self._fts_rowid(kind, article_id), index_text(title), index_text(content))
+                for kind, article_id, title, content in rows]
+        # 先删除旧的索引行再写入
+        self._conn.executemany("DELETE FROM articles_fts WHERE rowid = ?", [(row[0],) for row in rows])
+        self._conn.executemany(
+            "INSERT INTO articles_fts (rowid, title, content) VALUES (?, ?, ?)", rows
+        )
+
+    def _fetch_by_ids(self, table, kind, ids):
+        """按ID取记录并保持原顺序，已删除的记录直接跳过"""
+        if not ids:
+            return []
+        id_column = "task_id" if table == "tasks" else "article_id"
+        records = {}
+        # SQLite 单条语句的参数个数有限，分批查询
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            sql = f"SELECT {id_column}, data FROM {table} WHERE {id_column} IN ({placeholders})"
+            args = list(batch)
+            if kind is not None:
+                sql += " AND kind = ?"
+                args.append(kind)
+            for record_id, raw in self._conn.execute(sql, args):
+                records[record_id] = loads(raw)
+        return [records[record_id] for record_id in ids if record_id in records]
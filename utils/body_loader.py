@@ -0,0 +1,58 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class BodyLoader(QObject):
+    """详情页按需加载文章正文
+
+    列表以摘要模式请求时文章中没有正文。load() 在正文已在列表数据、缓存或本地存储中时
+    立即发出 body_ready，否则在后台请求；同时只保留最后一篇文章的请求，切换文章后旧请求被取消。
+    prefetch() 批量预取相邻文章的正文，翻到它们时不必等待网络。
+    """
+    body_ready = pyqtSignal(object, object)  # 文章ID, 正文
+    body_failed = pyqtSignal(object, object)  # 文章ID, 错误
+
+    def __init__(self, api, engine, kind, owner, parent=None):
+        super().__init__(parent)
+        self.api = api
+        self.engine = engine
+        self.kind = kind  # "task"、"category" 或 "keyword"，与文章所在的列表接口对应
+        self.owner = owner
+
+    def load(self, user_id, article):
+        """加载一篇文章的正文，返回正文是否已经立即可用"""
+        article_id = article.get("article_id")
+        body = self.api.article_body(user_id, self.kind, article, cached_only=True)
+        if body is not None:
+            self.engine.cancel_owner(self.owner, "article_body")
+            self.body_ready.emit(article_id, body)
+            return True
+        handle = self.engine.submit(
+            self.api.article_body,
+            user_id,
+            self.kind,
+            article,
+            owner=self.owner,
+            key="article_body"
+        )
+        handle.succeeded.connect(lambda body, article_id=article_id: self.body_ready.emit(article_id, body))
+        handle.failed.connect(lambda error, article_id=article_id: self.body_failed.emit(article_id, error))
+        return False
+
+    def prefetch(self, user_id, articles):
+        """在后台批量获取还没有正文的文章，articles 中可以有 None；不是摘要模式时无需预取"""
+        if not self.api.header_lists:
+            return
+        article_ids = [
+            article["article_id"] for article in articles
+            if article is not None and self.api.article_body(user_id, self.kind, article, cached_only=True) is None
+        ]
+        if not article_ids:
+            return
+        self.engine.submit(
+            self.api.get_article_bodies,
+            user_id,
+            self.kind,
+            article_ids,
+            owner=self.owner,
+            key="prefetch_bodies"
+        )
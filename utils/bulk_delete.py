@@ -0,0 +1,76 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# 每个删除请求携带的文章数，以及同时进行的请求数
+BULK_CHUNK_SIZE = 50
+BULK_CONCURRENCY = 2
+
+
+class BulkDelete(QObject):
+    """把大量文章ID分批删除
+
+    delete_fn(user_id, article_ids) 是 ApiClient 的某个删除接口，接口本身接受ID列表。
+    每批 chunk_size 个ID，最多 concurrency 批同时进行，每批返回时发出 progress，
+    全部结束（或取消后在途的批次返回）时发出一次 finished。
+    """
+    progress = pyqtSignal(int, int)  # 已处理数, 总数
+    finished = pyqtSignal(list, list, object)  # 已删除的ID, 未删除的ID, 最后一个错误
+
+    def __init__(self, engine, delete_fn, user_id, article_ids,
+                 chunk_size=BULK_CHUNK_SIZE, concurrency=BULK_CONCURRENCY, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.delete_fn = delete_fn
+        self.user_id = user_id
+        self.total = len(article_ids)
+        self.concurrency = max(concurrency, 1)
+        self.chunks = [list(article_ids[start:start + chunk_size])
+                       for start in range(0, len(article_ids), max(chunk_size, 1))]
+        self.running = 0
+        self.cancelled = False
+        self.done = False
+        self.deleted = []
+        self.failed = []
+        self.last_error = None
+
+    def start(self):
+        if not self.chunks:
+            self._finish()
+            return
+        self._submit_next()
+
+    def cancel(self):
+        """不再发出新的批次，已发出的批次照常返回"""
+        self.cancelled = True
+        for chunk in self.chunks:
+            self.failed.extend(chunk)
+        self.chunks = []
+        if self.running == 0:
+            self._finish()
+
+    def _submit_next(self):
+        while self.chunks and self.running < self.concurrency:
+            chunk = self.chunks.pop(0)
+            self.running += 1
+            # 不设置 owner：离开页面时批次也要跑完，结果用于回滚
+            handle = self.engine.submit(self.delete_fn, self.user_id, chunk)
+            handle.succeeded.connect(lambda result, chunk=chunk: self._on_chunk_done(chunk, None))
+            handle.failed.connect(lambda error, chunk=chunk: self._on_chunk_done(chunk, error))
+
+    def _on_chunk_done(self, chunk, error):
+        self.running -= 1
+        if error is None:
+            self.deleted.extend(chunk)
+        else:
+            self.failed.extend(chunk)
+            self.last_error = error
+        self.progress.emit(len(self.deleted) + len(self.failed), self.total)
+
+        if self.chunks:
+            self._submit_next()
+        elif self.running == 0:
+            self._finish()
+
+    def _finish(self):
+        if not self.done:
+            self.done = True
+            self.finished.emit(self.deleted, self.failed, self.last_error)
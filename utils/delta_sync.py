@@ -0,0 +1,68 @@
+"""列表接口的增量同步
+
+已有旧数据时请求带上 since=<旧数据中最大的 updated_at>。支持增量的服务器返回
+{"delta": true, "ids": [...], <列表字段>: [变化或新增的记录], ...其他字段}：
+ids 是这一页现在的完整ID顺序（分类列表为 {分类: [ID...]}），未变化的记录从旧数据中取，
+不在 ids 中的记录即已删除。不支持的服务器会忽略 since，照常返回完整数据。
+"""
+
+# 接口前缀 -> (列表字段, ID字段)
+DELTA_LISTS = {
+    "get_articles/": ("articles", "article_id"),
+    "get_keyword_articles/": ("articles", "article_id"),
+    "get_filtered_articles/": ("articles_by_category", "article_id"),
+    "api/tasks/": ("tasks", "task_id"),
+}
+
+
+def delta_spec(path):
+    """接口对应的 (列表字段, ID字段)，不支持增量时返回 None"""
+    for prefix, spec in DELTA_LISTS.items():
+        if path.startswith(prefix):
+            return spec
+    return None
+
+
+def records_of(data, list_key):
+    """响应中的全部记录，分类列表会被展开"""
+    records = data.get(list_key) or []
+    if isinstance(records, dict):
+        return [record for group in records.values() for record in group]
+    return records
+
+
+def sync_cursor(data, list_key):
+    """旧数据中最新的 updated_at，记录没有该字段时返回 None（无法增量同步）"""
+    stamps = [record.get("updated_at") for record in records_of(data, list_key)]
+    if not stamps or not all(stamps):
+        return None
+    return max(stamps)
+
+
+def merge_delta(previous, delta, list_key, id_key):
+    """用旧数据和增量响应拼出完整响应
+
+    未变化的记录沿用旧数据中的同一个对象；什么都没变时直接返回 previous，
+    页面据此跳过重新渲染。增量中引用了旧数据里没有的记录时返回 None，需要完整下载。
+    """
+    ids = delta.get("ids")
+    if ids is None:
+        return None
+    known = {record.get(id_key): record for record in records_of(previous, list_key)}
+    changed = records_of(delta, list_key)
+    known.update((record.get(id_key), record) for record in changed)
+
+    try:
+        if isinstance(ids, dict):
+            records = {group: [known[record_id] for record_id in group_ids]
+                       for group, group_ids in ids.items()}
+        else:
+            records = [known[record_id] for record_id in ids]
+    except KeyError:
+        return None
+
+    merged = {key: value for key, value in delta.items() if key not in ("delta", "ids")}
+    merged[list_key] = records
+    if not changed and merged == previous:
+        return previous
+    return merged
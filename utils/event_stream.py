@@ -0,0 +1,188 @@
+import random
+import threading
+from urllib.parse import urljoin
+
+import requests
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from utils.json_codec import loads
+
+# 服务器没有推送接口时返回的状态码，此时不再重连，页面继续轮询
+UNSUPPORTED_STATUS = (404, 405, 501)
+
+
+def sse_lines(chunks):
+    """把字节块切成文本行：CR、LF、CRLF 都算一个行结束（SSE 规范），CRLF 可以被分在两块中"""
+    buffer = bytearray()
+    after_cr = False
+    for chunk in chunks:
+        for byte in chunk:
+            if byte == 0x0A and after_cr:
+                # CRLF 的 LF，上一行已在 CR 处结束
+                after_cr = False
+                continue
+            after_cr = byte == 0x0D
+            if byte in (0x0A, 0x0D):
+                yield buffer.decode("utf-8", errors="replace")
+                buffer.clear()
+            else:
+                buffer.append(byte)
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace")
+
+
+class PushUnsupported(Exception):
+    """服务器不支持事件推送"""
+
+
+class EventStream(QObject):
+    """订阅服务器推送的事件（Server-Sent Events）
+
+    在后台线程中保持一个长连接，收到的事件通过 event_received 送到GUI线程：
+    task_status（任务状态变化）、articles_added（任务有新文章）、article_translated（文章翻译完成）。
+    连接断开后按指数退避加随机抖动重连，并带上 Last-Event-ID 让服务器补发离线期间的事件。
+    connection_changed 报告推送是否可用，不可用期间页面退回轮询。
+    """
+    event_received = pyqtSignal(str, object)  # 事件类型, 数据
+    connection_changed = pyqtSignal(bool)  # 推送是否可用
+
+    def __init__(self, base_url, path="api/events/{user_id}/", base_delay=1, max_delay=60,
+                 jitter=0.2, read_timeout=60, parent=None):
+        super().__init__(parent)
+        self.base_url = base_url
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.read_timeout = read_timeout  # 服务器应定期发送注释行保活，超时视为断线
+
+        self.session = requests.Session()
+        self.user_id = None
+        self.last_event_id = None
+        self.connected = False
+        self._stop = None
+        self._thread = None
+        self._response = None
+
+    def start(self, user_id):
+        """开始订阅，切换用户时从头开始"""
+        self.stop()
+        if user_id != self.user_id:
+            self.last_event_id = None
+        self.user_id = user_id
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop, user_id), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._stop is None:
+            return
+        self._stop.set()
+        response = self._response
+        if response is not None:
+            # 关闭连接使阻塞中的读取立即返回
+            response.close()
+        self._stop = None
+        self._thread = None
+        self._set_connected(False)
+
+    def close(self):
+        self.stop()
+        self.session.close()
+
+    def is_connected(self):
+        return self.connected
+
+    def reconnect_delay(self, attempts):
+        """第 attempts 次重连前等待的秒数"""
+        delay = min(self.base_delay * 2 ** attempts, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _run(self, stop, user_id):
+        attempts = 0
+        while not stop.is_set():
+            try:
+                if self._listen(stop, user_id):
+                    attempts = 0
+            except PushUnsupported:
+                self._set_connected(False, stop)
+                return
+            except Exception:
+                # 网络异常、读取超时或连接被关闭，稍后重连
+                pass
+            self._set_connected(False, stop)
+            if stop.wait(self.reconnect_delay(attempts)):
+                return
+            attempts += 1
+
+    def _listen(self, stop, user_id):
+        """保持一次连接直到断开，返回是否曾经连接成功"""
+        headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+
+        url = urljoin(self.base_url, self.path.format(user_id=user_id))
+        with self.session.get(url, headers=headers, stream=True, timeout=(5, self.read_timeout)) as response:
+            if response.status_code in UNSUPPORTED_STATUS:
+                raise PushUnsupported(response.status_code)
+            response.raise_for_status()
+            self._response = response
+            try:
+                self._set_connected(True, stop)
+                self._read_events(stop, response)
+            finally:
+                self._response = None
+        return True
+
+    def _read_events(self, stop, response):
+        """按 SSE 格式逐行解析，空行表示一个事件结束"""
+        event_type, data_lines, event_id = None, [], None
+        # 逐字节读取，事件很小，按块读取会等满一块才返回；
+        # 不用 iter_lines()，它会把 CRLF 切成一行加一个空行，空行又表示事件结束
+        for line in sse_lines(response.iter_content(chunk_size=1)):
+            if stop.is_set():
+                return
+            if not line:
+                if data_lines:
+                    self._dispatch(event_type, "\n".join(data_lines), event_id)
+                event_type, data_lines, event_id = None, [], None
+                continue
+            if line.startswith(":"):
+                # 注释行，服务器用于保活
+                continue
+
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "event":
+                event_type = value
+            elif field == "data":
+                data_lines.append(value)
+            elif field == "id":
+                event_id = value
+            elif field == "retry" and value.isdigit():
+                self.base_delay = int(value) / 1000
+
+    def _dispatch(self, event_type, data, event_id):
+        if event_id is not None:
+            self.last_event_id = event_id
+        try:
+            payload = loads(data)
+        except ValueError:
+            return
+        self._emit(self.event_received, event_type or "message", payload)
+
+    def _set_connected(self, connected, stop=None):
+        # 已停止的旧连接线程不再改变状态
+        if stop is not None and stop.is_set():
+            return
+        if connected != self.connected:
+            self.connected = connected
+            self._emit(self.connection_changed, connected)
+
+    def _emit(self, signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # 应用退出时接收方可能已被销毁
+            pass
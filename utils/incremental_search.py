@@ -0,0 +1,64 @@
+import time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class IncrementalSearch(QObject):
+    """搜索框的边输入边搜索
+
+    按键停顿 delay 毫秒后才发出 triggered 信号，按回车或点击搜索按钮时立即发出。
+    页面把每次拿到的结果交给 remember()，如果那是第1页且已包含全部匹配项，
+    之后输入的查询只要包含上一次的查询（只会缩小结果），narrow() 就直接在本地过滤，不再访问服务器。
+    """
+    triggered = pyqtSignal(str)
+
+    def __init__(self, line_edit, delay=300, max_age=30, parent=None):
+        super().__init__(parent)
+        self.line_edit = line_edit
+        self.max_age = max_age  # 完整结果可复用的秒数，超过后重新请求服务器
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.flush)
+        line_edit.textEdited.connect(self.timer.start)
+        line_edit.returnPressed.connect(self.flush)
+
+        self.last_query = None
+        self.last_context = None
+        self.last_records = None  # 上一次的完整结果，不完整时为 None
+        self.last_time = 0
+        self.emitted_query = None
+
+    def flush(self):
+        """立即发出当前的查询"""
+        self.timer.stop()
+        self.emitted_query = self.line_edit.text().strip()
+        self.triggered.emit(self.emitted_query)
+
+    def remember(self, query, records, complete, context=None):
+        """记录一次结果，complete 表示 records 已包含该查询的全部匹配项"""
+        if not complete:
+            self.last_records = None
+            return
+        self.last_query = query
+        self.last_context = context
+        self.last_records = list(records)
+        self.last_time = time.monotonic()
+
+    def narrow(self, query, matches, context=None):
+        """用上一次的完整结果回答 query，无法复用时返回 None
+
+        matches(record, query) 判断单条记录是否匹配，需要和服务器的搜索规则一致（包含关系）。
+        """
+        if self.last_records is None or context != self.last_context:
+            return None
+        if time.monotonic() - self.last_time > self.max_age:
+            return None
+        if self.last_query.lower() not in query.lower():
+            return None
+        return [record for record in self.last_records if matches(record, query)]
+
+    def reset(self):
+        """丢弃已记录的结果，例如数据被删除或修改之后"""
+        self.last_records = None
@@ -0,0 +1,140 @@
+import itertools
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from utils.request_engine import RequestEngine
+
+# 作业状态，沿用任务列表的状态名称
+JOB_QUEUED = "排队中"
+JOB_RUNNING = "执行中"
+JOB_DONE = "完成"
+JOB_FAILED = "失败"
+JOB_CANCELLED = "已取消"
+
+# 同时执行的长耗时作业数，以及"全部翻译"时同一任务最多同时翻译的文章数
+JOB_WORKERS = 3
+TRANSLATE_PARALLELISM = 2
+
+
+class Job(QObject):
+    """一个后台作业，例如一次分类处理或一篇文章的翻译"""
+    finished = pyqtSignal(object)  # 作业自身，完成、失败或取消时发出
+
+    def __init__(self, job_id, title, fn, args, kwargs, group=None):
+        super().__init__()
+        self.job_id = job_id
+        self.title = title
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.group = group
+        self.status = JOB_QUEUED
+        self.result = None
+        self.error = None
+        self.handle = None
+        self.created_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+
+    def is_active(self):
+        return self.status in (JOB_QUEUED, JOB_RUNNING)
+
+    def elapsed(self):
+        """执行耗时（秒），尚未开始时为 None"""
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+
+class JobManager(QObject):
+    """应用级的长耗时作业队列
+
+    作业先进入队列，最多 max_workers 个同时执行，同一分组还可以单独限制并发数。
+    队列属于应用而不是页面，离开页面不会取消作业。
+    执行中的作业被取消时，已发出的HTTP请求会在后台跑完，但结果被丢弃。
+    """
+    job_added = pyqtSignal(object)
+    job_changed = pyqtSignal(object)
+
+    def __init__(self, max_workers=JOB_WORKERS, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.engine = RequestEngine(max_threads=max_workers, parent=self)
+        self.jobs = []  # 所有作业，按提交顺序
+        self.queue = []  # 等待执行的作业
+        self.running = []
+        self.group_limits = {}  # 分组 -> 最大并发数
+        self._ids = itertools.count(1)
+
+    def submit(self, title, fn, *args, group=None, **kwargs):
+        """把 fn(*args, **kwargs) 加入队列，返回 Job"""
+        job = Job(next(self._ids), title, fn, args, kwargs, group)
+        self.jobs.append(job)
+        self.queue.append(job)
+        self.job_added.emit(job)
+        self._dispatch()
+        return job
+
+    def set_group_limit(self, group, limit):
+        self.group_limits[group] = max(limit, 1)
+
+    def cancel(self, job):
+        """取消排队中或执行中的作业"""
+        if not job.is_active():
+            return
+        if job in self.queue:
+            self.queue.remove(job)
+        if job in self.running:
+            self.running.remove(job)
+            job.handle.cancel()
+        self._finish(job, JOB_CANCELLED)
+        self._dispatch()
+
+    def cancel_group(self, group):
+        for job in self.active_jobs(group):
+            self.cancel(job)
+
+    def active_jobs(self, group=None):
+        """排队中和执行中的作业，可按分组过滤"""
+        return [job for job in self.jobs
+                if job.is_active() and (group is None or job.group == group)]
+
+    def clear_finished(self):
+        """从列表中移除已经结束的作业"""
+        self.jobs = [job for job in self.jobs if job.is_active()]
+
+    def _dispatch(self):
+        """按提交顺序启动作业，直到达到总并发数或分组并发数"""
+        for job in list(self.queue):
+            if len(self.running) >= self.max_workers:
+                break
+            limit = self.group_limits.get(job.group)
+            if limit is not None and sum(1 for other in self.running if other.group == job.group) >= limit:
+                continue
+            self.queue.remove(job)
+            self._start(job)
+
+    def _start(self, job):
+        job.status = JOB_RUNNING
+        job.started_at = time.monotonic()
+        self.running.append(job)
+        job.handle = self.engine.submit(job.fn, *job.args, owner=self, **job.kwargs)
+        job.handle.succeeded.connect(lambda result, job=job: self._on_job_done(job, result, None))
+        job.handle.failed.connect(lambda error, job=job: self._on_job_done(job, None, error))
+        self.job_changed.emit(job)
+
+    def _on_job_done(self, job, result, error):
+        if job in self.running:
+            self.running.remove(job)
+        job.result = result
+        job.error = error
+        self._finish(job, JOB_FAILED if error is not None else JOB_DONE)
+        self._dispatch()
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished_at = time.monotonic()
+        self.job_changed.emit(job)
+        job.finished.emit(job)
@@ -0,0 +1,114 @@
+"""JSON 解码
+
+安装了 orjson 时用它解码整个响应，否则使用标准库。
+ArrayStream 用于很大的列表响应：边接收边解析，列表中的每条记录解析完就交出，
+不必等整个响应体下载完，也不需要同时在内存中保留完整的响应文本和解析结果。
+"""
+import codecs
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DECODER = "orjson" if orjson is not None else "json"
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def loads(data):
+    """解码 bytes 或 str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ArrayStream:
+    """从分块到达的 JSON 对象中逐条取出 list_key 对应列表的元素
+
+    遍历得到列表中的每条记录，遍历结束后 fields 是对象中的其他字段。
+    响应中没有该列表时不产生记录，整个对象都在 fields 中。
+    """
+
+    def __init__(self, chunks, list_key):
+        self.chunks = iter(chunks)
+        self.list_key = list_key
+        self.fields = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == self.list_key and self._peek() == "[":
+                self._pos += 1
+                yield from self._items()
+            else:
+                self.fields[key] = self._value()
+            if self._expect(",}") == "}":
+                return
+
+    def _items(self):
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _fill(self):
+        """读入下一块数据，丢弃已经解析过的部分，返回是否读到了数据"""
+        if self._eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self._eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(chunk)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """跳过空白，返回下一个字符"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("JSON 数据不完整")
+
+    def _expect(self, allowed):
+        char = self._peek()
+        if char not in allowed:
+            raise ValueError(f"JSON 格式错误: 位置 {self._pos} 处应为 {allowed!r}，实际为 {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """解析一个完整的值，数据不够时继续读入"""
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 值恰好在缓冲区末尾时（例如数字）可能还没有读完
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
@@ -0,0 +1,51 @@
+class PageCursor:
+    """列表的翻页方式：偏移分页或游标（keyset）分页
+
+    服务器在响应中给出 next_cursor 时，下一页改用游标请求，深翻页不再需要按偏移量扫描，
+    也不依赖服务器每次重新计算 total；next_cursor 为空表示已经是最后一页。
+    没有游标的页（包括第1页）仍按 page 偏移请求，不支持游标的服务器不受影响。
+    """
+
+    def __init__(self):
+        self.context = None  # 游标所属的筛选条件
+        self.tokens = {}  # 页码 -> 请求该页的游标
+        self.last_page = None  # 游标分页下已知的最后一页
+
+    def bind(self, context):
+        """游标只在相同的筛选条件下有效，条件变化时重新开始"""
+        if context != self.context:
+            self.context = context
+            self.reset()
+
+    def reset(self):
+        self.tokens = {}
+        self.last_page = None
+
+    def params(self, page):
+        """请求第 page 页的参数"""
+        token = self.tokens.get(page)
+        if token is not None:
+            return {"page": None, "cursor": token}
+        return {"page": page, "cursor": None}
+
+    def record(self, page, data):
+        """记录第 page 页响应中的下一页游标"""
+        if "next_cursor" not in data:
+            return
+        token = data.get("next_cursor")
+        if token:
+            self.tokens[page + 1] = token
+            if self.last_page is not None and self.last_page <= page:
+                self.last_page = None
+        else:
+            self.tokens.pop(page + 1, None)
+            self.last_page = page
+
+    def is_keyset(self):
+        return bool(self.tokens) or self.last_page is not None
+
+    def has_next(self, page, per_page, total):
+        """第 page 页之后是否还有数据"""
+        if self.is_keyset():
+            return page + 1 in self.tokens
+        return total is not None and page * per_page < total
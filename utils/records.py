@@ -0,0 +1,180 @@
+"""紧凑的文章和任务记录
+
+列表接口返回的每篇文章、每个任务原本都是一个完整的字典，缓存、模型和页面都持有它们。
+这里的记录类用 __slots__ 保存已知字段，分类、状态等取值很少的字符串做驻留（sys.intern），
+正文和摘要较长时压缩保存，读取时才解压。记录兼容字典的读取方式，页面代码无需改动。
+"""
+import sys
+import zlib
+
+from utils.delta_sync import delta_spec
+
+LAZY_MIN_LENGTH = 256  # 正文、摘要至少这么长时才压缩保存
+BODY_FIELDS = ("content", "content_summary")  # 文章的正文字段，列表的摘要模式中没有
+
+_MISSING = object()
+
+
+class Record:
+    """字典兼容的只读记录
+
+    FIELDS 中的字段保存在同名的槽中，缺少的字段槽位保持未赋值，其他未知字段放入 _extra；
+    支持 get / [] / in / len / keys / items / dict(record) / {**record}，与字典比较时按内容比较。
+    """
+
+    __slots__ = ("_extra",)
+    FIELDS = ()
+    _field_set = frozenset()
+    INTERNED = ()  # 取值重复很多的字符串字段
+    LAZY = ()  # 压缩保存的长文本字段
+
+    def __init__(self, data):
+        extra = None
+        for key, value in data.items():
+            if key not in self._field_set:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if isinstance(value, str):
+                if key in self.INTERNED:
+                    value = sys.intern(value)
+                elif key in self.LAZY and len(value) >= LAZY_MIN_LENGTH:
+                    value = zlib.compress(value.encode("utf-8"), 1)
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, "_extra", extra)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+    @classmethod
+    def of(cls, data):
+        """字典转换为记录，已经是记录时原样返回"""
+        return data if isinstance(data, Record) else cls(data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 是只读的")
+
+    def _raw(self, key):
+        """槽中保存的原始值，不存在时抛出 KeyError"""
+        if key in self._field_set:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        value = self._raw(key)
+        if key in self.LAZY and isinstance(value, bytes):
+            return zlib.decompress(value).decode("utf-8")
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self._raw(key)
+        except KeyError:
+            return False
+        return True
+
+    def keys(self):
+        keys = [key for key in self.FIELDS if key in self]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def replace(self, **changes):
+        """返回修改了部分字段的新记录"""
+        data = self.to_dict()
+        data.update(changes)
+        return type(self)(data)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return all(self._raw_or_missing(key) == other._raw_or_missing(key) for key in self.FIELDS) \
+                and self._extra == other._extra
+        if isinstance(other, (dict, Record)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def _raw_or_missing(self, key):
+        try:
+            return self._raw(key)
+        except KeyError:
+            return _MISSING
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return type(self), (self.to_dict(),)
+
+
+class ArticleRecord(Record):
+    FIELDS = ("article_id", "task_id", "title", "category", "keyword", "score", "updated_at",
+              "source_url", "summary", "content_summary", "content")
+    INTERNED = ("category", "keyword")
+    LAZY = BODY_FIELDS
+    __slots__ = FIELDS
+
+
+class TaskRecord(Record):
+    FIELDS = ("task_id", "status", "task_target", "created_at", "updated_at", "config")
+    INTERNED = ("status", "task_target")
+    __slots__ = FIELDS
+
+
+# 列表字段 -> 记录类型
+RECORD_TYPES = {
+    "articles": ArticleRecord,
+    "articles_by_category": ArticleRecord,
+    "tasks": TaskRecord,
+}
+
+
+def record_type(path):
+    """接口列表字段中记录的类型，不是列表接口时返回 (None, None)"""
+    spec = delta_spec(path)
+    if spec is None:
+        return None, None
+    return spec[0], RECORD_TYPES.get(spec[0])
+
+
+def compact_response(path, data):
+    """把列表响应中的记录字典转换为紧凑记录，返回新的响应；不是列表接口时原样返回"""
+    list_key, cls = record_type(path)
+    if cls is None or not isinstance(data, dict) or list_key not in data:
+        return data
+    records = data[list_key]
+    result = dict(data)
+    if isinstance(records, dict):
+        result[list_key] = {group: [cls.of(record) for record in items] for group, items in records.items()}
+    else:
+        result[list_key] = [cls.of(record) for record in records]
+    return result
@@ -0,0 +1,140 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class RequestCancelled(Exception):
+    """请求已被取消，流式请求借此提前结束"""
+
+
+class _TaskSignals(QObject):
+    done = pyqtSignal(bool, object)  # 是否成功, 结果或异常
+    partial = pyqtSignal(object)  # 流式请求的部分结果
+
+
+class _RequestTask(QRunnable):
+    """在线程池中执行一次阻塞调用"""
+
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            # 排队期间已被取消，不再发出请求
+            ok, payload = False, None
+        else:
+            ok, payload = self._call()
+
+        try:
+            self.signals.done.emit(ok, payload)
+        except RuntimeError:
+            # 应用退出时接收方可能已被销毁
+            pass
+
+    def emit_partial(self, value):
+        """流式请求每得到一部分结果时调用，已取消时抛出 RequestCancelled 中止请求"""
+        if self.cancelled:
+            raise RequestCancelled()
+        self.signals.partial.emit(value)
+
+    def _call(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            ok, payload = False, e
+        else:
+            ok, payload = True, result
+        return ok, payload
+
+
+class RequestHandle(QObject):
+    """一次异步请求的句柄，结果总是在GUI线程中通过信号送达"""
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    finished = pyqtSignal()
+    partial = pyqtSignal(object)  # 流式请求的部分结果，在 succeeded 之前送达
+
+    def __init__(self, engine, task, owner, key):
+        super().__init__()
+        self.engine = engine
+        self.task = task
+        self.owner = owner
+        self.key = key
+        self.cancelled = False
+        self.done = False
+        task.signals.done.connect(self._on_done)
+        task.signals.partial.connect(self._on_partial)
+
+    def cancel(self):
+        """取消请求：还在排队的不再执行，已发出的HTTP调用会在后台跑完，但结果不再送达"""
+        self.cancelled = True
+        self.task.cancelled = True
+
+    @pyqtSlot(object)
+    def _on_partial(self, value):
+        if not self.cancelled:
+            self.partial.emit(value)
+
+    @pyqtSlot(bool, object)
+    def _on_done(self, ok, payload):
+        self.done = True
+        self.engine._forget(self)
+        if self.cancelled:
+            return
+        if ok:
+            self.succeeded.emit(payload)
+        else:
+            self.failed.emit(payload)
+        self.finished.emit()
+
+
+class RequestEngine(QObject):
+    """基于 QThreadPool 的异步请求引擎，避免网络调用阻塞GUI线程"""
+
+    def __init__(self, max_threads=4, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._handles = []
+
+    def submit(self, fn, *args, owner=None, key=None, streaming=False, **kwargs):
+        """在后台执行 fn(*args, **kwargs)
+
+        owner 通常是发起请求的页面，离开页面时可以一并取消；
+        同一 owner 下相同 key 的新请求会取消尚未返回的旧请求。
+        streaming=True 时 fn 会收到 on_partial 回调，每次调用都通过 handle.partial 送达GUI线程。
+        """
+        if key is not None:
+            for handle in self._pending(owner):
+                if handle.key == key:
+                    handle.cancel()
+
+        task = _RequestTask(fn, args, kwargs)
+        if streaming:
+            kwargs["on_partial"] = task.emit_partial
+        handle = RequestHandle(self, task, owner, key)
+        self._handles.append(handle)
+        self.pool.start(task)
+        return handle
+
+    def cancel_owner(self, owner, key=None):
+        """取消某个页面发起的所有请求，指定 key 时只取消这一类"""
+        for handle in self._pending(owner):
+            if key is None or handle.key == key:
+                handle.cancel()
+
+    def is_busy(self, owner, key=None):
+        """owner 是否还有未返回的请求"""
+        return any(key is None or handle.key == key for handle in self._pending(owner))
+
+    def _pending(self, owner):
+        return [handle for handle in self._handles
+                if handle.owner is owner and not handle.cancelled]
+
+    def _forget(self, handle):
+        # 已取消的句柄也要保留到任务结束，任务对象由它持有
+        if handle in self._handles:
+            self._handles.remove(handle)
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """线程安全的LRU响应缓存，按接口前缀设置过期时间"""
+
+    def __init__(self, max_entries=256, ttls=None, default_ttl=30):
+        self.max_entries = max_entries
+        self.ttls = ttls or {}  # 接口前缀 -> 秒
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (写入时间, 数据, 验证器)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint, params=None):
+        """接口 + 规范化后的参数，参数顺序和列表顺序不影响命中"""
+        items = []
+        for name, value in (params or {}).items():
+            if value is None or value == "":
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = tuple(sorted(str(v) for v in value))
+            else:
+                value = str(value)
+            items.append((name, value))
+        return endpoint, tuple(sorted(items))
+
+    def ttl_for(self, endpoint):
+        """取最长匹配前缀的过期时间"""
+        best = None
+        for prefix in self.ttls:
+            if endpoint.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.ttls[best] if best is not None else self.default_ttl
+
+    def get(self, endpoint, params=None, allow_stale=False):
+        """读取缓存，过期条目只在 allow_stale 时返回"""
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, data, validator = entry
+            if not allow_stale and time.monotonic() - stored_at > self.ttl_for(endpoint):
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, endpoint, params, data, stale=False, validator=None):
+        """写入缓存，stale=True 的条目只能通过 allow_stale 读到
+
+        validator 是服务器给出的 ETag/Last-Modified，下次刷新时用于条件请求。
+        """
+        key = self.make_key(endpoint, params)
+        stored_at = float("-inf") if stale else time.monotonic()
+        with self._lock:
+            self._entries[key] = (stored_at, data, validator)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def validator(self, endpoint, params=None):
+        """条目的验证器，没有条目或没有验证器时返回 None"""
+        with self._lock:
+            entry = self._entries.get(self.make_key(endpoint, params))
+            return entry[2] if entry is not None else None
+
+    def invalidate(self, endpoint_prefix, **match):
+        """删除接口前缀匹配、且参数包含 match 中所有键值的条目"""
+        wanted = self.make_key(endpoint_prefix, match)[1]
+        with self._lock:
+            for key in list(self._entries):
+                endpoint, items = key
+                if endpoint.startswith(endpoint_prefix) and set(wanted) <= set(items):
+                    del self._entries[key]
+
+    def update(self, endpoint_prefix, fn, **match):
+        """用 fn(旧数据) 的返回值替换匹配条目的数据，写入时间不变，用于本地修改缓存
+
+        数据被本地修改后与服务器的版本不再一致，验证器随之作废。
+        """
+        wanted = self.make_key(endpoint_prefix, match)[1]
+        with self._lock:
+            for key, (stored_at, data, validator) in list(self._entries.items()):
+                endpoint, items = key
+                if endpoint.startswith(endpoint_prefix) and set(wanted) <= set(items):
+                    updated = fn(data)
+                    self._entries[key] = (stored_at, updated, validator if updated is data else None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,98 @@
+import re
+
+# 连续的中日韩字符 / 连续的字母数字，其余字符（空白、标点）都作为分隔
+_RUN_PATTERN = re.compile(
+    r"[぀-ヿ㐀-䶿一-鿿豈-﫿가-힯]+|[0-9A-Za-zÀ-ɏ]+"
+)
+
+
+def _is_cjk(run):
+    return run[0] > "ɏ"
+
+
+def tokenize(text, for_query=False):
+    """把文本切成索引词，返回 [(词, 起始偏移, 结束偏移)]
+
+    中文没有空格分词，连续的中文按二元组切分("中国经济" -> 中国 国经 经济)，
+    每段的最后一个字单独成词，这样单字查询和跨段短语都能命中。英文和数字按整词并转小写。
+
+    for_query=True 时最后一段中文不追加单字：查询可能只是文档中某段文字的一部分，
+    单字后面在文档里紧跟的是下一个二元组而不是单字。
+    """
+    runs = list(_RUN_PATTERN.finditer(text or ""))
+    tokens = []
+    for number, match in enumerate(runs):
+        run, start = match.group(), match.start()
+        if not _is_cjk(run):
+            tokens.append((run.lower(), start, match.end()))
+            continue
+        for offset in range(len(run) - 1):
+            tokens.append((run[offset:offset + 2], start + offset, start + offset + 2))
+        is_last = number == len(runs) - 1
+        if len(run) == 1 or not (for_query and is_last):
+            tokens.append((run[-1], match.end() - 1, match.end()))
+    return tokens
+
+
+def index_text(text):
+    """写入FTS5表的文本：空格分隔的索引词，由 unicode61 分词器按空格再切开"""
+    # 与 tokenize 的切分结果相同，但不计算偏移，建索引时快得多
+    # run[i:i + 2] 在最后一个位置正好是单字
+    parts = []
+    for match in _RUN_PATTERN.finditer(text or ""):
+        run = match.group()
+        if _is_cjk(run):
+            parts.extend(run[offset:offset + 2] for offset in range(len(run)))
+        else:
+            parts.append(run.lower())
+    return " ".join(parts)
+
+
+def build_match_query(query):
+    """把用户输入转换成FTS5 MATCH表达式，无法检索时返回 None
+
+    空格分隔的每个词是一个短语（词内的索引词必须相邻），多个词之间是 AND；
+    每个短语的最后一个索引词按前缀匹配，边输入边搜索时输入到一半的词也能命中。
+    """
+    phrases = []
+    for term in (query or "").split():
+        tokens = [token for token, _, _ in tokenize(term, for_query=True)]
+        if tokens:
+            # 索引词只包含字母数字和中文，放进双引号不需要转义
+            phrases.append('"' + " ".join(tokens) + '" *')
+    return " AND ".join(phrases) if phrases else None
+
+
+def highlight_spans(text, query, limit=None):
+    """查询词在原文中的位置，返回合并后的 [(起始偏移, 结束偏移)]
+
+    优先按整个查询词查找（忽略大小写），找不到时退回到其中的每一段中英文。
+    """
+    if not text or not query:
+        return []
+
+    lowered = text.lower()
+    needles = []
+    for term in query.lower().split():
+        if term in lowered:
+            needles.append(term)
+        else:
+            needles.extend(match.group() for match in _RUN_PATTERN.finditer(term))
+
+    spans = []
+    for needle in set(needles):
+        start = lowered.find(needle)
+        while start >= 0:
+            spans.append((start, start + len(needle)))
+            start = lowered.find(needle, start + len(needle))
+
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+            if limit is not None and len(merged) > limit:
+                merged.pop()
+                break
+    return merged
@@ -0,0 +1,52 @@
+import threading
+from collections import Counter
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """相同的请求同一时间只发出一次
+
+    第一个调用方真正执行请求，请求返回前到达的相同调用直接等待同一个 Future，
+    共享它的结果或异常。被合并的调用按接口计数，用来观察重复请求的情况。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> 进行中的 Future
+        self.collapsed = Counter()  # 接口 -> 被合并的调用次数
+
+    def do(self, key, fn, endpoint=None):
+        """执行 fn()，key 相同的并发调用共用一次执行"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self.collapsed[endpoint] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self):
+        """当前正在进行的请求数"""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        """各接口被合并的调用次数"""
+        with self._lock:
+            return dict(self.collapsed)
@@ -0,0 +1,129 @@
+import random
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# 还会变化的任务状态，只有处于这些状态的任务需要轮询
+ACTIVE_STATUSES = ("执行中", "排队中")
+DONE_STATUS = "完成"
+
+
+class StatusPoller(QObject):
+    """在后台轮询未结束任务的状态
+
+    fetch() 直接向服务器请求当前列表页（不走缓存），返回 {"tasks": [...]}。
+    只关注 watch() 时处于 ACTIVE_STATUSES 的任务，状态变化时逐条发出 task_changed，
+    任务结束后不再关注；没有需要关注的任务时停止轮询。
+    连续没有变化时间隔按 factor 倍增长到 max_interval，有变化后回到 base_interval，
+    每次间隔再加上 ±jitter 的随机抖动，避免大量客户端同时请求。
+    服务器推送可用时暂停轮询，推送来的任务状态通过 apply() 走同样的比对。
+    页面隐藏时 set_background(True)，按 max_interval 继续轮询，任务完成的通知照常发出；
+    再次显示时立即轮询一次，补上这段时间的变化。
+    """
+    task_changed = pyqtSignal(object)  # 状态变化的任务
+    task_completed = pyqtSignal(object)  # 变为"完成"的任务
+
+    def __init__(self, engine, base_interval=3, max_interval=60, factor=2, jitter=0.2, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+
+        self.fetch = None
+        self.watched = {}  # task_id -> 最近一次看到的状态
+        self.idle_polls = 0  # 连续没有变化的轮询次数
+        self.generation = 0  # 列表切换后丢弃旧的轮询结果
+        self.push_active = False  # 推送可用时不轮询
+        self.background = False  # 页面隐藏时只按最长间隔轮询
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.poll)
+
+    def watch(self, fetch, tasks):
+        """列表刷新后调用：重新确定要关注的任务，并从最短间隔开始轮询"""
+        self.fetch = fetch
+        self.generation += 1
+        self.watched = {task["task_id"]: task.get("status") for task in tasks
+                        if task.get("status") in ACTIVE_STATUSES}
+        self.idle_polls = 0
+        self._schedule()
+
+    def stop(self):
+        self.timer.stop()
+        self.generation += 1
+        self.engine.cancel_owner(self)
+
+    def set_background(self, background):
+        """页面隐藏时改为按最长间隔轮询；重新显示时立即轮询一次，之后从最短间隔开始"""
+        if background == self.background:
+            return
+        self.background = background
+        self.idle_polls = 0
+        if background:
+            self._schedule()
+        elif self.watched and self.fetch is not None and not self.push_active:
+            self.timer.stop()
+            self.poll()
+
+    def set_push_active(self, active):
+        """推送连接建立时暂停轮询，断开后立即从最短间隔恢复"""
+        self.push_active = active
+        if active:
+            self.timer.stop()
+        else:
+            self.idle_polls = 0
+            self._schedule()
+
+    def next_interval(self):
+        """下一次轮询前等待的秒数"""
+        if self.background:
+            interval = self.max_interval
+        else:
+            interval = min(self.base_interval * self.factor ** self.idle_polls, self.max_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _schedule(self):
+        if not self.watched or self.fetch is None or self.push_active:
+            self.timer.stop()
+            return
+        self.timer.start(int(self.next_interval() * 1000))
+
+    def poll(self):
+        generation = self.generation
+        handle = self.engine.submit(self.fetch, owner=self, key="poll")
+        handle.succeeded.connect(lambda data: self._on_polled(generation, data))
+        handle.failed.connect(lambda error: self._on_poll_failed(generation))
+
+    def apply(self, tasks):
+        """比对一批任务的最新状态，返回是否有关注的任务发生变化"""
+        changed = False
+        for task in tasks:
+            task_id = task.get("task_id")
+            if task_id not in self.watched or task.get("status") == self.watched[task_id]:
+                continue
+            changed = True
+            status = task.get("status")
+            if status in ACTIVE_STATUSES:
+                self.watched[task_id] = status
+            else:
+                del self.watched[task_id]
+            self.task_changed.emit(task)
+            if status == DONE_STATUS:
+                self.task_completed.emit(task)
+        return changed
+
+    def _on_polled(self, generation, data):
+        if generation != self.generation:
+            return
+        changed = self.apply(data.get("tasks", []))
+        self.idle_polls = 0 if changed else self.idle_polls + 1
+        self._schedule()
+
+    def _on_poll_failed(self, generation):
+        # 服务器繁忙或网络异常时同样退避，下次再试
+        if generation != self.generation:
+            return
+        self.idle_polls += 1
+        self._schedule()
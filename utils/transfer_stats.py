@@ -0,0 +1,40 @@
+import re
+import threading
+
+
+class TransferStats:
+    """按接口统计网络传输量
+
+    wire_bytes 是实际传输的响应体字节数（压缩后），body_bytes 是解压后的字节数，
+    两者之差即压缩节省的流量；not_modified 是服务器返回 304、没有传输响应体的次数。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}  # 接口 -> 统计
+
+    @staticmethod
+    def endpoint_of(path):
+        """路径中的数字ID统一替换，同一接口的请求合并统计"""
+        return re.sub(r"(^|/)\d+(?=/|$)", r"\1<id>", path)
+
+    def record(self, path, wire_bytes, body_bytes, not_modified=False):
+        endpoint = self.endpoint_of(path)
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {
+                "requests": 0, "wire_bytes": 0, "body_bytes": 0, "not_modified": 0
+            })
+            stats["requests"] += 1
+            stats["wire_bytes"] += wire_bytes
+            stats["body_bytes"] += body_bytes
+            if not_modified:
+                stats["not_modified"] += 1
+
+    def stats(self):
+        """各接口的统计副本"""
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
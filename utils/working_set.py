@@ -0,0 +1,96 @@
+"""文章工作集
+
+保存最近从服务器取得的一批文章，按分类筛选、按评分或更新时间排序都在内存中完成，
+切换分类和排序时不必访问服务器。每个字段保存为一列，安装了 numpy 时用向量化的
+比较和 argsort，否则逐条处理。
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SORT_KEYS = ("score", "updated_at")
+
+
+class ArticleWorkingSet:
+    """一批文章及其按列保存的分类、评分、更新时间
+
+    complete 表示这批文章是 categories 下的全部文章，只有这时本地的筛选结果才与服务器一致。
+    """
+
+    def __init__(self, articles, categories, complete):
+        self.articles = list(articles)
+        self.categories = frozenset(categories)
+        self.complete = complete
+        self._selections = {}  # (分类, 排序字段, 排序方向) -> 行号列表
+        self._build_columns()
+
+    @classmethod
+    def from_response(cls, data, categories):
+        """由 get_filtered_articles 的响应创建，响应包含全部匹配项时为完整的工作集"""
+        articles = []
+        for group in data.get("articles_by_category", {}).values():
+            articles.extend(group)
+        total = data.get("total_count")
+        complete = total is not None and total <= len(articles) and not data.get("next_cursor")
+        return cls(articles, categories, complete)
+
+    def _build_columns(self):
+        category = [article.get("category") or "" for article in self.articles]
+        score = [float(article.get("score") or 0) for article in self.articles]
+        # 更新时间换成名次，和评分一样取负数即可降序
+        times = [str(article.get("updated_at") or "") for article in self.articles]
+        rank = {value: i for i, value in enumerate(sorted(set(times)))}
+        updated = [rank[value] for value in times]
+        if numpy is not None:
+            self.columns = {
+                "category": numpy.array(category, dtype=str),
+                "score": numpy.array(score, dtype=float),
+                "updated_at": numpy.array(updated, dtype=numpy.int64)
+            }
+        else:
+            self.columns = {"category": category, "score": score, "updated_at": updated}
+
+    def covers(self, categories, sort_by):
+        """能否在本地回答这些分类、这种排序的筛选"""
+        return (self.complete and sort_by in SORT_KEYS
+                and bool(categories) and set(categories) <= self.categories)
+
+    def select(self, categories, sort_by, sort_order):
+        """筛选并排序，返回行号列表；相同的值保持原来的先后顺序"""
+        key = (frozenset(categories), sort_by, sort_order)
+        rows = self._selections.get(key)
+        if rows is not None:
+            return rows
+        descending = sort_order == "desc"
+        if numpy is not None:
+            index = numpy.flatnonzero(numpy.isin(self.columns["category"], list(categories)))
+            keys = self.columns[sort_by][index]
+            if descending:
+                keys = -keys
+            rows = index[numpy.argsort(keys, kind="stable")].tolist()
+        else:
+            wanted = set(categories)
+            index = [row for row, category in enumerate(self.columns["category"]) if category in wanted]
+            rows = sorted(index, key=self.columns[sort_by].__getitem__, reverse=descending)
+        self._selections[key] = rows
+        return rows
+
+    def page(self, categories, sort_by, sort_order, page, per_page):
+        """第 page 页，格式与 get_filtered_articles 的响应相同"""
+        rows = self.select(categories, sort_by, sort_order)
+        articles_by_category = {}
+        for row in rows[(page - 1) * per_page:page * per_page]:
+            article = self.articles[row]
+            articles_by_category.setdefault(article.get("category"), []).append(article)
+        return {"articles_by_category": articles_by_category, "total_count": len(rows)}
+
+    def discard(self, article_id):
+        """移除一篇文章（本地删除后），返回是否存在"""
+        for row, article in enumerate(self.articles):
+            if article.get("article_id") == article_id:
+                del self.articles[row]
+                self._selections.clear()
+                self._build_columns()
+                return True
+        return False
@@ -1,21 +1,25 @@
 # article_detail.py
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea, QMessageBox, QLineEdit, \
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox, QLineEdit, \
     QComboBox, QListWidget, QListWidgetItem, QGridLayout, QGroupBox, QCheckBox, QSizePolicy, QFrame
 from PyQt5.QtGui import QIcon, QFont
 from PyQt5.QtCore import Qt, QSize
 import os
-from urllib.parse import urljoin
-import requests
 
 from utils.path_tool import resource_path
+from utils.api_client import ApiError
+from utils.body_loader import BodyLoader
+from widgets.content_viewer import ContentViewer
 
 
 class ArticleDetailPage(QWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.base_url = "http://127.0.0.1:8000/"
+        # 列表为摘要模式时正文单独获取
+        self.bodies = BodyLoader(app.api, app.engine, "category", owner=self, parent=self)
+        self.bodies.body_ready.connect(self.on_body_ready)
+        self.bodies.body_failed.connect(self.on_body_failed)
         self.init_ui()
 
     def showEvent(self, event):
@@ -80,19 +84,17 @@ class ArticleDetailPage(QWidget):
         main_layout.addLayout(top_bar)
 
         # 文章内容区域
-        self.article_scroll = QScrollArea()
-        self.article_scroll.setWidgetResizable(True)
-        self.article_scroll.setStyleSheet("""
-            QScrollArea {
+        # 正文由 ContentViewer 自己滚动，外面不再套一层滚动区域
+        self.article_frame = QFrame()
+        self.article_frame.setObjectName("article_frame")
+        self.article_frame.setStyleSheet("""
+            QFrame#article_frame {
                 border: 1px solid #ddd;
                 border-radius: 5px;
                 background-color: white;
             }
         """)
-
-        # 文章内容容器
-        self.article_container = QWidget()
-        self.article_layout = QVBoxLayout(self.article_container)
+        self.article_layout = QVBoxLayout(self.article_frame)
         self.article_layout.setContentsMargins(20, 20, 20, 20)
         self.article_layout.setSpacing(15)
 
@@ -154,23 +156,18 @@ class ArticleDetailPage(QWidget):
         separator.setStyleSheet("color: #eee;")
         self.article_layout.addWidget(separator)
 
-        # 文章内容
-        self.content_label = QLabel()
-        self.content_label.setWordWrap(True)
+        # 文章内容，长文章分段写入，只排版可见部分
+        self.content_label = ContentViewer()
         self.content_label.setFont(QFont("Arial", 12))
-        self.content_label.setStyleSheet("color: #444;")
-        self.article_layout.addWidget(self.content_label)
-
-        # 添加拉伸项使内容顶部对齐
-        self.article_layout.addStretch()
+        self.content_label.setStyleSheet("color: #444; background-color: white;")
+        self.article_layout.addWidget(self.content_label, 1)
 
-        self.article_scroll.setWidget(self.article_container)
-        main_layout.addWidget(self.article_scroll)
+        main_layout.addWidget(self.article_frame)
 
         # 删除按钮
-        delete_btn = QPushButton("删除文章")
-        delete_btn.setFixedHeight(40)
-        delete_btn.setStyleSheet("""
+        self.delete_btn = QPushButton("删除文章")
+        self.delete_btn.setFixedHeight(40)
+        self.delete_btn.setStyleSheet("""
             QPushButton {
                 background-color: #ea4335;
                 color: white;
@@ -183,8 +180,8 @@ class ArticleDetailPage(QWidget):
                 background-color: #d33426;
             }
         """)
-        delete_btn.clicked.connect(self.delete_article)
-        main_layout.addWidget(delete_btn)
+        self.delete_btn.clicked.connect(self.delete_article)
+        main_layout.addWidget(self.delete_btn)
 
         self.setLayout(main_layout)
 
@@ -218,8 +215,11 @@ class ArticleDetailPage(QWidget):
 
         self.meta_label.setText(" | ".join(meta_parts) if meta_parts else "无来源信息")
 
-        # 显示内容 (使用简写后的内容)
-        self.content_label.setText(article.get("content_summary", article.get("content", "无内容")))
+        # 显示内容 (使用简写后的内容)，正文不在列表数据中时先显示加载提示
+        user_id = self.app.user_info["userid"]
+        if not self.bodies.load(user_id, article):
+            self.content_label.setText("正文加载中...")
+        self.bodies.prefetch(user_id, self.list_neighbors(article))
 
         # 显示评分
         score = article.get("score", 0)
@@ -233,6 +233,27 @@ class ArticleDetailPage(QWidget):
             else:
                 self.rating_stars[i].setPixmap(QIcon(resource_path("imgs/star_empty.png")).pixmap(20, 20))
 
+    def list_neighbors(self, article):
+        """文章列表中前后相邻的文章，返回详情页时可能会打开它们"""
+        if not self.app.is_page_built("article_list_page"):
+            return []
+        articles = self.app.article_list_page.articles
+        for row, item in enumerate(articles):
+            if item.get("article_id") == article.get("article_id"):
+                return [articles[i] for i in (row - 1, row + 1) if 0 <= i < len(articles)]
+        return []
+
+    def on_body_ready(self, article_id, body):
+        """正文返回，仍是当前文章时显示"""
+        if self.app.current_article and self.app.current_article.get("article_id") == article_id:
+            self.content_label.setText(body.get("content_summary", body.get("content", "无内容")))
+
+    def on_body_failed(self, article_id, error):
+        """正文加载失败，只在正文区域提示"""
+        if self.app.current_article and self.app.current_article.get("article_id") == article_id:
+            message = error.text if isinstance(error, ApiError) else str(error)
+            self.content_label.setText(f"正文加载失败: {message}")
+
     def delete_article(self):
         """删除当前文章"""
         if not hasattr(self.app, 'current_article'):
@@ -244,22 +265,26 @@ class ArticleDetailPage(QWidget):
             QMessageBox.warning(self, "错误", "无法获取文章ID")
             return
 
-        try:
-            response = requests.delete(
-                urljoin(self.base_url, "delete_category_articles/"),
-                json={
-                    "article_ids": [article_id],
-                    "user_id": self.app.user_info["userid"]
-                },
-                timeout=5
-            )
-
-            if response.status_code == 200:
-                QMessageBox.information(self, "成功", response.json().get("message", "文章删除成功"))
-                # 返回文章列表
-                self.app.navigate_to(self.app.article_list_page)
-            else:
-                QMessageBox.warning(self, "错误", response.json().get("error", "删除文章失败"))
-
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
\ No newline at end of file
+        # 乐观删除：先从缓存和列表页中移除并返回列表，后台通知服务器，失败时恢复
+        user_id = self.app.user_info["userid"]
+        self.app.api.drop_articles("category", user_id, [article_id])
+        removed = None
+        if self.app.is_page_built("article_list_page"):
+            removed = self.app.article_list_page.remove_article(article_id)
+
+        handle = self.app.engine.submit(
+            self.app.api.delete_category_articles,
+            user_id,
+            [article_id]
+        )
+        handle.failed.connect(lambda error: self.on_delete_failed(error, removed))
+        self.app.navigate_to(self.app.article_list_page)
+
+    def on_delete_failed(self, error, removed):
+        """文章删除失败，把文章放回列表"""
+        if removed is not None:
+            self.app.article_list_page.restore_article(removed)
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", error.payload.get("error", "删除文章失败"))
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
\ No newline at end of file
@@ -1,35 +1,55 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
-                             QListWidgetItem, QPushButton, QLabel, QMessageBox,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView,
+                             QPushButton, QLabel, QMessageBox,
                              QSpacerItem, QSizePolicy, QLineEdit, QComboBox,
                              QScrollArea, QFrame, QCheckBox, QGroupBox,
                              QCompleter, QStyledItemDelegate, QGridLayout)
-from PyQt5.QtCore import Qt, QSize, QStringListModel
+from PyQt5.QtCore import Qt, QSize, QStringListModel, QSignalBlocker
 from PyQt5.QtGui import QFont, QColor, QPixmap, QIcon
-import requests
-from urllib.parse import urljoin
 import os
+import time
 
 from utils.path_tool import resource_path
+from utils.api_client import ApiError
+from utils.incremental_search import IncrementalSearch
+from utils.page_cursor import PageCursor
+from utils.working_set import ArticleWorkingSet
+from widgets.article_model import (ArticleListModel, ArticleItemDelegate, CATEGORY_MAP, article_matches,
+                                   merge_categories)
+from widgets.bulk_delete_dialog import confirm_bulk_delete, run_bulk_delete
+
+WORKING_SET_SIZE = 1000  # 工作集最多取多少篇文章，超过时筛选仍由服务器完成
+WORKING_SET_TTL = 300  # 工作集请求后多少秒内不再重新获取
 
 
 class ArticleListPage(QWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.base_url = "http://127.0.0.1:8000/"
         self.current_page = 1
         self.per_page = 10
         self.selected_categories = []
         self.articles = []
         self.sort_by = "updated_at"  # 默认按更新时间排序
+        self.shown_data = None  # 当前显示的响应，避免重复渲染同一份缓存
+        self.total_count = 0
+        self.search_query = ""  # 当前结果对应的搜索词，用于标题高亮
+        self.search_context = None  # 当前结果对应的分类和排序
+        self.page_cursor = PageCursor()  # 服务器支持时按游标翻页
+        self.infinite_scroll = False  # 连续滚动：滚动到底部时追加下一页
+        self.loading_more = False
+        self.working_set = None  # 本地筛选排序用的文章工作集
+        self.working_set_source = None  # 工作集对应的响应，响应没变时不重建
+        self.working_set_requested_at = None  # 上次请求工作集的时间（time.monotonic）
+        self.shown_local = False  # 当前结果是否来自工作集
         self.init_ui()
 
     def showEvent(self, event):
-        """页面显示时加载数据"""
+        """页面显示时加载数据，停留在原来的页码，有缓存时不访问网络即可显示"""
         super().showEvent(event)
-        if not hasattr(self, 'initialized'):
-            self.load_articles()
-            self.initialized = True
+        # 连续滚动已追加了后续页时保留现有列表，重新加载会回到第1页
+        if self.infinite_scroll and self.current_page > 1:
+            return
+        self.load_articles()
 
     def init_ui(self):
         # 主布局
@@ -74,16 +94,7 @@ class ArticleListPage(QWidget):
         filter_layout.setSpacing(15)
 
         # 分类映射 (英文: 中文)
-        self.category_map = {
-            "Foreign Affairs": "外交",
-            "Finance": "金融",
-            "Military": "军事",
-            "Technology": "科技",
-            "Domestic": "国内",
-            "Culture": "文化",
-            "Entertainment": "娱乐",
-            "Sports": "体育"
-        }
+        self.category_map = dict(CATEGORY_MAP)
 
         # 分类选择 (复选框组)
         category_group = QGroupBox("分类")
@@ -97,6 +108,7 @@ class ArticleListPage(QWidget):
             check = QCheckBox(chi)
             check.setChecked(True)  # 默认全选
             check.category = eng  # 保存英文分类名
+            check.toggled.connect(self.on_filter_changed)
             self.category_checks[eng] = check
             category_layout.addWidget(check, row, col)
             col += 1
@@ -157,6 +169,10 @@ class ArticleListPage(QWidget):
             }
         """)
 
+        # 工作集能回答时，切换分类和排序立即生效
+        self.sort_combo.currentIndexChanged.connect(self.on_filter_changed)
+        self.sort_order_combo.currentIndexChanged.connect(self.on_filter_changed)
+
         sort_group.addWidget(sort_label)
         sort_group.addWidget(self.sort_combo)
         filter_layout.addLayout(sort_group)
@@ -210,15 +226,42 @@ class ArticleListPage(QWidget):
                 background-color: #3367d6;
             }
         """)
-        search_btn.clicked.connect(self.on_search)
+        # 边输入边搜索：按键防抖，回车和搜索按钮立即搜索
+        self.incremental_search = IncrementalSearch(self.search_input, parent=self)
+        self.incremental_search.triggered.connect(self.on_search)
+        search_btn.clicked.connect(self.incremental_search.flush)
+        # 删除列表中选中的文章（Ctrl/Shift 多选）
+        self.delete_selected_btn = QPushButton("删除所选")
+        self.delete_selected_btn.setFont(QFont("Arial", 10))
+        self.delete_selected_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #ea4335;
+                color: white;
+                padding: 8px 15px;
+                border: none;
+                border-radius: 5px;
+                min-width: 80px;
+            }
+            QPushButton:hover {
+                background-color: #d33426;
+            }
+        """)
+        self.delete_selected_btn.clicked.connect(self.delete_selected_articles)
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(search_btn)
+        search_layout.addWidget(self.delete_selected_btn)
         main_layout.addLayout(search_layout)
 
-        # 文章列表
-        self.article_list = QListWidget()
+        # 文章列表（模型/视图，行由委托直接绘制）
+        self.article_model = ArticleListModel(self)
+        self.article_list = QListView()
+        self.article_list.setModel(self.article_model)
+        self.article_list.setItemDelegate(ArticleItemDelegate(self.category_map, self.article_list))
+        self.article_list.setUniformItemSizes(True)
+        self.article_list.setSelectionMode(QListView.ExtendedSelection)
+        self.article_list.setEditTriggers(QListView.NoEditTriggers)
         self.article_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: white;
                 border: 1px solid #ddd;
                 border-radius: 5px;
@@ -226,14 +269,17 @@ class ArticleListPage(QWidget):
                 min-width: 600px;
                 min-height: 400px;
             }
-            QListWidget::item {
+            QListView::item {
                 border-bottom: 1px solid #eee;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f5f5f5;
             }
         """)
-        self.article_list.itemDoubleClicked.connect(self.on_article_selected)
+        self.article_list.doubleClicked.connect(self.on_article_selected)
+        scroll_bar = self.article_list.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.check_load_more)
+        scroll_bar.rangeChanged.connect(self.check_load_more)
         main_layout.addWidget(self.article_list)
 
         # 分页控件
@@ -269,9 +315,15 @@ class ArticleListPage(QWidget):
         self.next_btn.setStyleSheet(self.prev_btn.styleSheet())
         self.next_btn.clicked.connect(self.next_page)
 
+        # 连续滚动：代替翻页按钮，滚动到底部时自动加载下一页
+        self.infinite_check = QCheckBox("连续滚动")
+        self.infinite_check.setFont(QFont("Arial", 10))
+        self.infinite_check.toggled.connect(self.set_infinite_scroll)
+
         page_layout.addWidget(self.prev_btn)
         page_layout.addWidget(self.page_label)
         page_layout.addWidget(self.next_btn)
+        page_layout.addWidget(self.infinite_check)
         main_layout.addLayout(page_layout)
 
         self.setLayout(main_layout)
@@ -289,12 +341,23 @@ class ArticleListPage(QWidget):
     def apply_filters(self):
         """应用筛选条件"""
         self.current_page = 1  # 重置为第一页
-        self.sort_by = self.sort_combo.currentData()
+        sort_by = self.sort_combo.currentData()
+        # 刚选择评分时，自动设为降序；之后仍可改为升序
+        if sort_by == "score" and self.sort_by != "score":
+            # 不触发 on_filter_changed，避免同一次筛选加载两遍
+            with QSignalBlocker(self.sort_order_combo):
+                self.sort_order_combo.setCurrentIndex(0)  # 0 = "desc"
+        self.sort_by = sort_by
         self.load_articles()  # 重新加载文章
-        # 若选择评分，自动设为降序
-        if self.sort_by == "score":
-            self.sort_order_combo.setCurrentIndex(0)  # 0 = "desc"
-        self.load_articles()
+
+    def on_filter_changed(self, *args):
+        """分类或排序改变：工作集能在本地回答时直接应用，否则等待点击筛选"""
+        if not self.isVisible() or self.search_input.text().strip():
+            return
+        if self.working_set is not None and self.working_set.covers(
+                self.get_selected_categories(), self.sort_combo.currentData()):
+            self.apply_filters()
+
     def load_articles(self):
         """加载文章数据"""
         if not self.app.user_info:
@@ -302,141 +365,237 @@ class ArticleListPage(QWidget):
             self.app.navigate_to(self.app.login_page)
             return
 
-        try:
-            selected_categories = self.get_selected_categories()
-            if not selected_categories:  # 如果没有选中任何分类
-                QMessageBox.information(self, "提示", "请至少选择一个分类")
-                return
-
-            params = {
-                "user_id": self.app.user_info["userid"],
-                "category_names": selected_categories,
-                "page": self.current_page,
-                "per_page": self.per_page,
-                "sort_by": self.sort_by,
-                "sort_order": self.sort_order_combo.currentData()
-            }
+        selected_categories = self.get_selected_categories()
+        if not selected_categories:  # 如果没有选中任何分类
+            QMessageBox.information(self, "提示", "请至少选择一个分类")
+            return
 
-            search_text = self.search_input.text().strip()
-            if search_text:
-                params["search"] = search_text
+        user_id = self.app.user_info["userid"]
+        page = self.current_page
+        request = self.page_request(page)
+        self.search_query = request["search"]
+        self.search_context = self.filter_context()
+
+        # 工作集包含全部匹配项时在本地筛选排序，不访问服务器
+        local = self.local_page(page)
+        self.shown_local = local is not None
+        if local is not None:
+            self.app.engine.cancel_owner(self, "load_articles")
+            self.on_page_loaded(page, local)
+            self.refresh_working_set()
+            return
 
-            response = requests.get(
-                urljoin(self.base_url, "get_filtered_articles/"),
-                params=params,
-                timeout=5
+        # 有缓存时先立即渲染，再在后台刷新
+        cached = self.app.api.get_filtered_articles(user_id, cached_only=True, **request)
+        if cached is not None:
+            self.on_page_loaded(page, cached)
+
+        self.set_loading(True)
+        handle = self.app.engine.submit(
+            self.app.api.get_filtered_articles,
+            user_id,
+            owner=self,
+            key="load_articles",
+            **request
+        )
+        handle.succeeded.connect(lambda data, page=page: self.on_page_loaded(page, data, prefetch=True))
+        handle.failed.connect(self.on_articles_failed)
+        self.refresh_working_set()
+
+    def refresh_working_set(self):
+        """在后台取最近更新的一批文章作为工作集，有缓存时先用缓存
+
+        只在还没有请求过或上次请求已超过 WORKING_SET_TTL 时访问服务器，不随每次加载重新获取。
+        """
+        if not self.app.user_info:
+            return
+        requested_at = self.working_set_requested_at
+        if requested_at is not None and time.monotonic() - requested_at < WORKING_SET_TTL:
+            return
+        user_id = self.app.user_info["userid"]
+        request = dict(
+            category_names=list(self.category_map),
+            page=1,
+            per_page=WORKING_SET_SIZE,
+            sort_by="updated_at",
+            sort_order="desc"
+        )
+        if self.working_set is None:
+            # 本地存储中的工作集有上千篇文章，读取和解码也放在后台
+            handle = self.app.engine.submit(
+                self.fetch_working_set,
+                user_id,
+                request,
+                None,
+                cached_only=True,
+                owner=self,
+                key="working_set_cached"
             )
+            handle.succeeded.connect(self.on_cached_working_set_loaded)
+        self.working_set_requested_at = time.monotonic()
+        handle = self.app.engine.submit(
+            self.fetch_working_set,
+            user_id,
+            request,
+            self.working_set_source,
+            owner=self,
+            key="working_set"
+        )
+        handle.succeeded.connect(self.on_working_set_loaded)
+        handle.failed.connect(self.on_working_set_failed)
+
+    def fetch_working_set(self, user_id, request, source, cached_only=False):
+        """在后台线程中获取工作集并建好各列，返回 (响应, 工作集)
+
+        响应仍是 source 时不重建，工作集为 None；cached_only 时没有缓存返回 None。
+        """
+        data = self.app.api.get_filtered_articles(user_id, cached_only=cached_only, **request)
+        if data is None:
+            return None
+        if data is source:
+            return data, None
+        return data, ArticleWorkingSet.from_response(data, self.category_map)
+
+    def on_cached_working_set_loaded(self, result):
+        """缓存中的工作集读出，服务器的数据已经先到时不再使用"""
+        if self.working_set_source is None:
+            self.on_working_set_loaded(result)
+
+    def on_working_set_loaded(self, result):
+        """工作集返回，数据有变化时替换；当前显示的是本地结果时按新数据重新显示"""
+        if result is None:
+            return
+        data, working_set = result
+        if working_set is None or data is self.working_set_source:
+            return
+        self.working_set_source = data
+        self.working_set = working_set
+        if self.shown_local and not self.infinite_scroll:
+            self.load_articles()
 
-            if response.status_code == 200:
-                data = response.json()
-                self.display_articles(
-                    data.get("articles_by_category", {}),
-                    data.get("total_count", 0)
-                )
-            else:
-                QMessageBox.warning(self, "错误", f"获取文章失败: {response.text}")
-
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
+    def on_working_set_failed(self, error):
+        """工作集获取失败时不影响列表，下次加载时重试"""
+        self.working_set_requested_at = None
+
+    def local_page(self, page):
+        """工作集能回答当前筛选时返回第 page 页，否则返回 None"""
+        if self.working_set is None or self.search_input.text().strip():
+            return None
+        categories = self.get_selected_categories()
+        if not self.working_set.covers(categories, self.sort_by):
+            return None
+        # 本地结果按偏移分页，服务器给出的游标不再适用
+        self.page_cursor.reset()
+        return self.working_set.page(
+            categories, self.sort_by, self.sort_order_combo.currentData(), page, self.per_page
+        )
+
+    def page_request(self, page):
+        """第 page 页的请求参数，已知该页的游标时按游标请求"""
+        request = dict(
+            category_names=self.get_selected_categories(),
+            per_page=self.per_page,
+            sort_by=self.sort_by,
+            sort_order=self.sort_order_combo.currentData(),
+            search=self.search_input.text().strip()
+        )
+        self.page_cursor.bind((self.filter_context(), request["search"]))
+        request.update(self.page_cursor.params(page))
+        return request
+
+    def on_page_loaded(self, page, data, prefetch=False):
+        """第 page 页返回，记录下一页的游标；服务器的结果显示后在后台预取下一页"""
+        # 连续滚动已经追加了后续页时，第1页的刷新结果不再替换整个列表
+        if page != self.current_page:
+            return
+        self.page_cursor.record(page, data)
+        self.on_articles_loaded(data)
+        if prefetch:
+            self.prefetch_page(page + 1)
+
+    def prefetch_page(self, page):
+        """预取第 page 页写入缓存，翻到该页时不必等待网络"""
+        if not self.app.user_info or not self.has_next_page(page - 1):
+            return
+        if self.local_page(page) is not None:
+            return
+        request = self.page_request(page)
+        context = self.page_cursor.context
+        handle = self.app.engine.submit(
+            self.app.api.get_filtered_articles,
+            self.app.user_info["userid"],
+            owner=self,
+            key="prefetch",
+            **request
+        )
+        handle.succeeded.connect(
+            lambda data, page=page, context=context: self.on_page_prefetched(page, context, data)
+        )
+
+    def on_page_prefetched(self, page, context, data):
+        """预取的页返回，记录它给出的下一页游标"""
+        if context == self.page_cursor.context:
+            self.page_cursor.record(page, data)
+
+    def has_next_page(self, page=None):
+        """第 page 页（默认当前页）之后是否还有数据"""
+        page = self.current_page if page is None else page
+        return self.page_cursor.has_next(page, self.per_page, self.total_count)
+
+    def on_articles_loaded(self, data):
+        """文章数据返回"""
+        self.initialized = True
+        total = data.get("total_count")
+        if data is self.shown_data:
+            self.update_pagination(total)
+            return
+        self.shown_data = data
+        self.display_articles(data.get("articles_by_category", {}), total)
+        # 第1页已包含全部匹配项时，后续更精确的搜索可以直接在本地过滤
+        complete = self.current_page == 1 and not self.page_cursor.has_next(1, len(self.articles), total)
+        self.incremental_search.remember(self.search_query, self.articles, complete, self.search_context)
+        # 行数不变时滚动条范围不会变化，需要主动检查是否已经到底
+        self.check_load_more()
+
+    def on_articles_failed(self, error):
+        """文章数据加载失败"""
+        self.set_loading(False)
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", f"获取文章失败: {error.text}")
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
+
+    def set_loading(self, loading):
+        """切换加载状态，翻页按钮保持可用以便随时改变请求"""
+        suffix = " 加载中..." if loading else ""
+        self.page_label.setText(f"{self.position_text()}{suffix}")
+
+    def position_text(self):
+        """分页标签的前半部分：当前页码，连续滚动时为已加载的条数"""
+        if self.infinite_scroll:
+            return f"已加载 {len(self.articles)} 条"
+        return f"第 {self.current_page} 页"
+
+    def merged_articles(self, articles_by_category):
+        """各分类的文章按结果的排序方式归并，保持跨分类的整体顺序"""
+        categories, sort_by, sort_order = self.search_context or self.filter_context()
+        return merge_categories(articles_by_category, sort_by, sort_order)
 
     def display_articles(self, articles_by_category, total_count):
         """显示文章列表"""
-        self.article_list.clear()
-        self.articles = []
-
-        for articles in articles_by_category.values():
-            for article in articles:
-                self.articles.append(article)
-
-        # 显示当前页的文章
-        for article in self.articles:
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 90))  # 增加高度以显示更多信息
-
-            # 创建自定义widget
-            widget = QWidget()
-            layout = QVBoxLayout(widget)
-            layout.setContentsMargins(10, 5, 10, 5)
-
-            # 标题和分类
-            top_layout = QHBoxLayout()
-
-            # 分类标签
-            category_label = QLabel(self.category_map.get(article["category"], article["category"]))
-            category_label.setFont(QFont("Arial", 10, QFont.Bold))
-            category_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background-color: #4285f4;
-                    padding: 2px 8px;
-                    border-radius: 10px;
-                }
-            """)
-
-            # 文章标题
-            title_label = QLabel(article["title"])
-            title_label.setFont(QFont("Arial", 12))
-            title_label.setStyleSheet("color: #333;")
-
-            top_layout.addWidget(category_label)
-            top_layout.addWidget(title_label, stretch=1)
-            layout.addLayout(top_layout)
-
-            # 评分显示
-            if "score" in article and article["score"] is not None:
-                score_layout = QHBoxLayout()
-                score_label = QLabel("评分:")
-                score_label.setFont(QFont("Arial", 9))
-
-                score_value = QLabel(str(article["score"]))
-                score_value.setFont(QFont("Arial", 9, QFont.Bold))
-                score_value.setStyleSheet("color: #FFA500;")
-
-                score_layout.addWidget(score_label)
-                score_layout.addWidget(score_value)
-                score_layout.addStretch()
-                layout.addLayout(score_layout)
-
-            # 来源和时间
-            meta_layout = QHBoxLayout()
-
-            # 更新时间
-            if article.get("updated_at"):
-                update_label = QLabel(f"更新: {article['updated_at']}")
-                update_label.setFont(QFont("Arial", 9))
-                update_label.setStyleSheet("color: #666;")
-                meta_layout.addWidget(update_label)
-
-            # 来源
-            if article.get("source_url"):
-                source_label = QLabel(f"来源: {article['source_url']}")
-                source_label.setFont(QFont("Arial", 9))
-                source_label.setStyleSheet("color: #666;")
-                meta_layout.addWidget(source_label)
-
-            meta_layout.addStretch()
-            layout.addLayout(meta_layout)
-
-            widget.setStyleSheet("""
-                QWidget {
-                    background-color: white;
-                    border-radius: 5px;
-                }
-            """)
-
-            item.setData(Qt.UserRole, article["article_id"])  # 保存article_id
-            item.setData(Qt.UserRole + 1, article)  # 保存完整文章数据
-
-            self.article_list.addItem(item)
-            self.article_list.setItemWidget(item, widget)
-
+        self.articles = list(self.merged_articles(articles_by_category))
+        self.article_model.sync_articles(self.articles, self.search_query)
         self.update_pagination(total_count)
 
     def update_pagination(self, total):
-        """更新分页控件状态"""
+        """更新分页控件状态，按游标翻页的服务器可能不返回总数（total 为 None）"""
+        self.total_count = total
         self.prev_btn.setDisabled(self.current_page <= 1)
-        self.next_btn.setDisabled(self.current_page * self.per_page >= total)
-        self.page_label.setText(f"第 {self.current_page} 页 (共 {total} 条)")
+        self.next_btn.setDisabled(not self.has_next_page())
+        text = self.position_text()
+        if total is not None:
+            text += f" (共 {total} 条)"
+        self.page_label.setText(text)
 
     def prev_page(self):
         """上一页"""
@@ -449,18 +608,181 @@ class ArticleListPage(QWidget):
         self.current_page += 1
         self.load_articles()
 
-    def on_search(self):
-        """搜索文章"""
+    def set_infinite_scroll(self, enabled):
+        """切换连续滚动，从第1页重新开始"""
+        self.infinite_scroll = enabled
+        self.prev_btn.setVisible(not enabled)
+        self.next_btn.setVisible(not enabled)
+        self.app.engine.cancel_owner(self, "load_more")
+        self.loading_more = False
         self.current_page = 1
+        self.shown_data = None  # 追加过的列表需要重新显示为第1页
         self.load_articles()
 
-    def on_article_selected(self, item):
+    def check_load_more(self, *args):
+        """连续滚动时，列表滚动到距底部不足一屏（或内容不满一屏）就加载下一页"""
+        if not self.infinite_scroll or self.loading_more:
+            return
+        scroll_bar = self.article_list.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() <= scroll_bar.pageStep():
+            self.load_more()
+
+    def load_more(self):
+        """加载下一页并追加到列表末尾"""
+        # 显示的是本地结果，或筛选条件已改变但还没有重新加载时，不追加
+        if self.shown_data is None or self.search_context != self.filter_context():
+            return
+        if not self.app.user_info or not self.has_next_page():
+            return
+        page = self.current_page + 1
+        local = self.local_page(page)
+        if local is not None:
+            self.on_more_loaded(page, local)
+            return
+        request = self.page_request(page)
+        self.loading_more = True
+        self.set_loading(True)
+        handle = self.app.engine.submit(
+            self.app.api.get_filtered_articles,
+            self.app.user_info["userid"],
+            owner=self,
+            key="load_more",
+            **request
+        )
+        handle.succeeded.connect(lambda data, page=page: self.on_more_loaded(page, data))
+        handle.failed.connect(self.on_load_more_failed)
+
+    def on_more_loaded(self, page, data):
+        """下一页返回，追加列表中还没有的文章"""
+        self.loading_more = False
+        if not self.infinite_scroll or page != self.current_page + 1:
+            return
+        self.page_cursor.record(page, data)
+        self.current_page = page
+        # 按偏移翻页时，期间新增的文章会把已显示的文章挤到下一页
+        shown = {article.get("article_id") for article in self.articles}
+        articles = [article for article in self.merged_articles(data.get("articles_by_category", {}))
+                    if article.get("article_id") not in shown]
+        self.articles.extend(articles)
+        self.article_model.append_articles(articles)
+        self.incremental_search.reset()
+        self.update_pagination(data.get("total_count", self.total_count))
+        self.prefetch_page(page + 1)
+
+    def on_load_more_failed(self, error):
+        """追加加载失败，只在分页标签中提示，滚动到底部时会再次尝试"""
+        self.loading_more = False
+        message = error.text if isinstance(error, ApiError) else str(error)
+        self.page_label.setText(f"{self.position_text()} 加载失败: {message}")
+
+    def on_search(self):
+        """搜索文章：先显示本地全文检索的结果，服务器结果返回后再替换"""
+        self.current_page = 1
+        query = self.search_input.text().strip()
+        articles = self.incremental_search.narrow(query, article_matches, self.filter_context())
+        if articles is not None:
+            self.show_narrowed_results(query, articles)
+            return
+
+        local_count = 0
+        if query and self.app.user_info:
+            local_count = self.show_local_results(query)
+        self.load_articles()
+        # 没有缓存的服务器结果覆盖本地结果时，提示正在等待服务器
+        if local_count and self.shown_data is None:
+            self.page_label.setText(f"本地匹配 {local_count} 条，正在搜索服务器...")
+
+    def filter_context(self):
+        """决定结果集的筛选条件，只有条件相同时才能复用上一次的结果"""
+        return (
+            tuple(sorted(self.get_selected_categories())),
+            self.sort_by,
+            self.sort_order_combo.currentData()
+        )
+
+    def show_narrowed_results(self, query, articles):
+        """在上一次的完整结果中过滤出新查询的结果，不访问服务器"""
+        # 丢弃还未返回的旧查询，避免它的结果覆盖本地过滤的结果
+        self.app.engine.cancel_owner(self, "load_articles")
+        self.search_query = query
+        self.search_context = self.filter_context()
+        self.page_cursor.bind((self.search_context, query))
+        articles_by_category = {}
+        for article in articles:
+            articles_by_category.setdefault(article.get("category"), []).append(article)
+        self.on_articles_loaded({"articles_by_category": articles_by_category, "total_count": len(articles)})
+
+    def show_local_results(self, query):
+        """显示本地缓存文章中与搜索词匹配的结果，返回匹配条数"""
+        selected_categories = self.get_selected_categories()
+        if not selected_categories:
+            return 0
+        hits = self.app.api.search_local(
+            self.app.user_info["userid"], query,
+            categories=selected_categories, limit=self.per_page
+        )
+        if not hits:
+            return 0
+        self.shown_data = None
+        self.articles = [hit["article"] for hit in hits]
+        self.article_model.sync_articles(self.articles, query)
+        return len(hits)
+
+    def on_article_selected(self, index):
         """文章项被选中"""
-        article_data = item.data(Qt.UserRole + 1)  # 获取保存的完整文章数据
+        article_data = index.data(ArticleListModel.ArticleRole)  # 获取保存的完整文章数据
         self.app.current_article = article_data
         self.app.navigate_to(self.app.article_detail_page)
 
-    def reload_articles(self):
-        """每次进入页面都加载"""
-        self.current_page = 1
-        self.load_articles()
\ No newline at end of file
+    def delete_selected_articles(self):
+        """批量删除选中的文章：先在本地移除，再分批通知服务器"""
+        rows = sorted(index.row() for index in self.article_list.selectionModel().selectedRows())
+        if not rows:
+            QMessageBox.information(self, "提示", "请先选择要删除的文章（按住 Ctrl 或 Shift 多选）")
+            return
+        article_ids = [self.article_model.article(row)["article_id"] for row in rows]
+        if not confirm_bulk_delete(self, len(article_ids)):
+            return
+
+        user_id = self.app.user_info["userid"]
+        self.app.api.drop_articles("category", user_id, article_ids)
+        removed = [self.remove_article(article_id) for article_id in article_ids]
+        run_bulk_delete(
+            self, self.app.engine, self.app.api.delete_category_articles, user_id, article_ids,
+            on_finished=lambda deleted, failed: self.on_bulk_deleted(removed, failed)
+        )
+
+    def on_bulk_deleted(self, removed, failed):
+        """批量删除结束，放回未能删除的文章"""
+        if not failed:
+            return
+        self.app.api.invalidate_dropped("category", self.app.user_info["userid"])
+        failed = set(failed)
+        # 按移除的相反顺序插回，行号才能对上
+        for item in reversed(removed):
+            if item is not None and item[1].get("article_id") in failed:
+                self.restore_article(item)
+
+    def remove_article(self, article_id):
+        """在本地移除一篇文章，返回撤销用的 (行号, 文章)，列表中没有时返回 None"""
+        if self.working_set is not None:
+            self.working_set.discard(article_id)
+        removed = self.article_model.remove_article(article_id)
+        if removed is None:
+            return None
+        self.articles = list(self.article_model.articles)
+        self.incremental_search.reset()
+        self.update_pagination(max(self.total_count - 1, 0) if self.total_count is not None else None)
+        return removed
+
+    def restore_article(self, removed):
+        """撤销 remove_article()"""
+        row, article = removed
+        # 工作集无法知道文章原来的位置，下次加载时重新获取
+        self.working_set = None
+        self.working_set_source = None
+        self.working_set_requested_at = None
+        self.article_model.insert_article(row, article)
+        self.articles = list(self.article_model.articles)
+        self.incremental_search.reset()
+        self.update_pagination(self.total_count + 1 if self.total_count is not None else None)
\ No newline at end of file
@@ -0,0 +1,227 @@
+import heapq
+
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem
+from PyQt5.QtCore import Qt, QSize, QRect, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QColor, QFontMetrics, QPainter
+
+from utils.search_index import highlight_spans
+from widgets.model_diff import sync_rows
+
+# 分类映射 (英文: 中文)
+CATEGORY_MAP = {
+    "Foreign Affairs": "外交",
+    "Finance": "金融",
+    "Military": "军事",
+    "Technology": "科技",
+    "Domestic": "国内",
+    "Culture": "文化",
+    "Entertainment": "娱乐",
+    "Sports": "体育"
+}
+
+
+def article_matches(article, query):
+    """文章标题是否包含搜索词（忽略大小写），与服务器的标题搜索一致"""
+    return query.lower() in (article.get("title") or "").lower()
+
+
+def sort_key(sort_by):
+    """排序字段对应的取值函数，与服务器的排序一致"""
+    if sort_by == "score":
+        return lambda article: float(article.get("score") or 0)
+    return lambda article: str(article.get(sort_by) or "")
+
+
+def merge_categories(articles_by_category, sort_by, sort_order):
+    """按分类分组、组内已排好序的文章归并为一个整体有序的序列
+
+    用堆做多路归并，每次只比较各组当前的第一篇，逐篇产出，不对整页重新排序；
+    排序值相同时先出现的分组在前。
+    """
+    return heapq.merge(*articles_by_category.values(), key=sort_key(sort_by),
+                       reverse=sort_order == "desc")
+
+
+class ArticleListModel(QAbstractListModel):
+    """文章列表模型，行数据直接保存文章字典"""
+    ArticleIdRole = Qt.UserRole
+    ArticleRole = Qt.UserRole + 1
+    TitleHighlightRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.articles = []
+        self.highlight_query = ""
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.articles)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.articles):
+            return None
+
+        article = self.articles[index.row()]
+        if role == Qt.DisplayRole:
+            return article.get("title", "")
+        if role == self.ArticleIdRole:
+            return article.get("article_id")
+        if role == self.ArticleRole:
+            return article
+        if role == self.TitleHighlightRole:
+            return highlight_spans(article.get("title", ""), self.highlight_query)
+        return None
+
+    def set_articles(self, articles, highlight_query=""):
+        """整体替换文章数据，highlight_query 为标题中需要高亮的搜索词"""
+        self.beginResetModel()
+        self.articles = list(articles)
+        self.highlight_query = highlight_query or ""
+        self.endResetModel()
+
+    def sync_articles(self, articles, highlight_query=""):
+        """原地更新为新的文章列表，只通知变化的行；高亮词变化时整体替换"""
+        highlight_query = highlight_query or ""
+        if highlight_query != self.highlight_query:
+            self.set_articles(articles, highlight_query)
+            return
+        sync_rows(self, self.articles, list(articles), "article_id")
+
+    def append_articles(self, articles):
+        """在末尾追加文章"""
+        if not articles:
+            return
+        first = len(self.articles)
+        self.beginInsertRows(QModelIndex(), first, first + len(articles) - 1)
+        self.articles.extend(articles)
+        self.endInsertRows()
+
+    def remove_article(self, article_id):
+        """移除一篇文章，返回 (行号, 文章)，不存在时返回 None"""
+        for row, article in enumerate(self.articles):
+            if article.get("article_id") == article_id:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.articles[row]
+                self.endRemoveRows()
+                return row, article
+        return None
+
+    def insert_article(self, row, article):
+        """在指定行插入一篇文章"""
+        row = min(max(row, 0), len(self.articles))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.articles.insert(row, article)
+        self.endInsertRows()
+
+    def article(self, row):
+        """获取指定行的文章"""
+        if 0 <= row < len(self.articles):
+            return self.articles[row]
+        return None
+
+
+class ArticleItemDelegate(QStyledItemDelegate):
+    """直接绘制文章行：分类标签、标题、评分和来源信息"""
+    ROW_HEIGHT = 90
+
+    def __init__(self, category_map, parent=None):
+        super().__init__(parent)
+        self.category_map = category_map
+
+        # 字体和度量只创建一次，绘制时复用
+        self.category_font = QFont("Arial", 10, QFont.Bold)
+        self.title_font = QFont("Arial", 12)
+        self.score_font = QFont("Arial", 9)
+        self.score_value_font = QFont("Arial", 9, QFont.Bold)
+        self.meta_font = QFont("Arial", 9)
+        self.category_metrics = QFontMetrics(self.category_font)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.score_metrics = QFontMetrics(self.score_font)
+        self.meta_metrics = QFontMetrics(self.meta_font)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        article = index.data(ArticleListModel.ArticleRole)
+        if not article:
+            return super().paint(painter, option, index)
+
+        painter.save()
+
+        # 背景（悬停/选中效果交给样式表）
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style:
+            style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        rect = opt.rect.adjusted(10, 5, -10, -5)
+
+        # 第一行：分类标签 + 标题
+        category = self.category_map.get(article.get("category"), article.get("category") or "")
+        line_height = max(self.category_metrics.height(), self.title_metrics.height()) + 4
+        x = rect.left()
+        y = rect.top()
+        if category:
+            pill_width = self.category_metrics.horizontalAdvance(category) + 16
+            pill_rect = QRect(x, y + (line_height - self.category_metrics.height() - 4) // 2,
+                              pill_width, self.category_metrics.height() + 4)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#4285f4"))
+            painter.drawRoundedRect(pill_rect, 10, 10)
+            painter.setPen(QColor("white"))
+            painter.setFont(self.category_font)
+            painter.drawText(pill_rect, Qt.AlignCenter, category)
+            x = pill_rect.right() + 8
+
+        title_rect = QRect(x, y, rect.right() - x, line_height)
+        painter.setPen(QColor("#333"))
+        painter.setFont(self.title_font)
+        full_title = article.get("title", "")
+        title = self.title_metrics.elidedText(full_title, Qt.ElideRight, title_rect.width())
+        # 搜索词高亮：在文字下面铺底色，只处理省略号之前可见的部分
+        visible = len(title) if title == full_title else len(title) - 1
+        for start, end in index.data(ArticleListModel.TitleHighlightRole) or []:
+            if start >= visible:
+                break
+            end = min(end, visible)
+            left = title_rect.left() + self.title_metrics.horizontalAdvance(title[:start])
+            width = self.title_metrics.horizontalAdvance(title[start:end])
+            painter.fillRect(QRect(left, title_rect.top() + 2, width, title_rect.height() - 4),
+                             QColor("#ffe58f"))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+        y += line_height + 4
+
+        # 第二行：评分
+        if article.get("score") is not None:
+            score_height = self.score_metrics.height()
+            painter.setFont(self.score_font)
+            painter.setPen(QColor("#000"))
+            label = "评分:"
+            painter.drawText(QRect(rect.left(), y, rect.width(), score_height),
+                             Qt.AlignLeft | Qt.AlignVCenter, label)
+            painter.setFont(self.score_value_font)
+            painter.setPen(QColor("#FFA500"))
+            value_x = rect.left() + self.score_metrics.horizontalAdvance(label) + 6
+            painter.drawText(QRect(value_x, y, rect.right() - value_x, score_height),
+                             Qt.AlignLeft | Qt.AlignVCenter, str(article["score"]))
+            y += score_height + 4
+
+        # 第三行：更新时间和来源
+        meta_parts = []
+        if article.get("updated_at"):
+            meta_parts.append(f"更新: {article['updated_at']}")
+        if article.get("source_url"):
+            meta_parts.append(f"来源: {article['source_url']}")
+        if meta_parts:
+            meta_rect = QRect(rect.left(), y, rect.width(), self.meta_metrics.height())
+            painter.setFont(self.meta_font)
+            painter.setPen(QColor("#666"))
+            meta = self.meta_metrics.elidedText("    ".join(meta_parts), Qt.ElideRight, meta_rect.width())
+            painter.drawText(meta_rect, Qt.AlignLeft | Qt.AlignVCenter, meta)
+
+        painter.restore()
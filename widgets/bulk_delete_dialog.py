@@ -0,0 +1,189 @@
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListView, QPushButton,
+                             QLabel, QProgressDialog, QMessageBox, QAbstractItemView)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+
+from utils.api_client import ApiError
+from utils.bulk_delete import BulkDelete
+from widgets.article_model import ArticleListModel, ArticleItemDelegate, CATEGORY_MAP
+
+
+class ArticlePickerDialog(QDialog):
+    """列出任务下的全部文章供多选，按页陆续加载"""
+    PER_PAGE = 100
+
+    def __init__(self, app, fetch, parent=None):
+        super().__init__(parent)
+        self.app = app
+        self.fetch = fetch  # fetch(page=, per_page=, on_partial=) -> {"articles": [...], "total": n}
+        self.total = None
+        self.streamed = 0  # 当前页已经流式显示的文章数
+        self.init_ui()
+        self.load_page(1)
+
+    def init_ui(self):
+        self.setWindowTitle("批量删除")
+        self.resize(800, 600)
+        layout = QVBoxLayout()
+
+        self.status_label = QLabel("加载中...")
+        self.status_label.setFont(QFont("Arial", 10))
+        layout.addWidget(self.status_label)
+
+        self.article_model = ArticleListModel(self)
+        self.article_list = QListView()
+        self.article_list.setModel(self.article_model)
+        self.article_list.setItemDelegate(ArticleItemDelegate(CATEGORY_MAP, self.article_list))
+        self.article_list.setUniformItemSizes(True)
+        self.article_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.article_list.setEditTriggers(QListView.NoEditTriggers)
+        self.article_list.selectionModel().selectionChanged.connect(self.update_status)
+        layout.addWidget(self.article_list)
+
+        button_layout = QHBoxLayout()
+        select_all_btn = QPushButton("全选")
+        select_all_btn.clicked.connect(self.article_list.selectAll)
+        self.delete_btn = QPushButton("删除所选")
+        self.delete_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #ea4335;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 6px 15px;
+            }
+            QPushButton:hover {
+                background-color: #d33426;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+            }
+        """)
+        self.delete_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton("取消")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(select_all_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(self.delete_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.update_status()
+
+    def load_page(self, page):
+        """流式加载一页，文章边下载边显示，加载完后继续加载下一页"""
+        self.streamed = 0
+        handle = self.app.engine.submit(
+            self.fetch,
+            page=page,
+            per_page=self.PER_PAGE,
+            owner=self,
+            key="load_page",
+            streaming=True
+        )
+        handle.partial.connect(self.on_articles_streamed)
+        handle.succeeded.connect(lambda data: self.on_page_loaded(page, data))
+        handle.failed.connect(self.on_page_failed)
+
+    def on_articles_streamed(self, articles):
+        """一批文章解析完成，先显示出来"""
+        self.streamed += len(articles)
+        self.article_model.append_articles(articles)
+        self.update_status()
+
+    def on_page_loaded(self, page, data):
+        articles = data.get("articles", [])
+        total = data.get("total")
+        # 流式显示过的文章不再重复添加，命中缓存时整页一次添加
+        self.article_model.append_articles(articles[self.streamed:])
+        if total is None and len(articles) > self.PER_PAGE:
+            # 服务器忽略了分页参数，一次返回了全部文章
+            self.total = len(articles)
+        else:
+            loaded = self.article_model.rowCount()
+            if total is None and len(articles) == self.PER_PAGE:
+                self.load_page(page + 1)
+            elif total is not None and articles and loaded < total:
+                self.total = total
+                self.load_page(page + 1)
+            else:
+                self.total = loaded
+        self.update_status()
+
+    def on_page_failed(self, error):
+        self.total = self.article_model.rowCount()
+        self.update_status()
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", f"获取文章失败: {error.text}")
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
+
+    def update_status(self):
+        loaded = self.article_model.rowCount()
+        selected = len(self.article_list.selectionModel().selectedRows())
+        if self.total is None or loaded < self.total:
+            text = f"已加载 {loaded} 篇，加载中..."
+        else:
+            text = f"共 {loaded} 篇"
+        self.status_label.setText(f"{text}  已选择 {selected} 篇")
+        self.delete_btn.setDisabled(selected == 0)
+
+    def selected_ids(self):
+        """选中文章的ID，按列表顺序"""
+        rows = sorted(index.row() for index in self.article_list.selectionModel().selectedRows())
+        return [self.article_model.article(row)["article_id"] for row in rows]
+
+    def done(self, result):
+        self.app.engine.cancel_owner(self)
+        super().done(result)
+
+
+def confirm_bulk_delete(parent, count):
+    """删除前确认一次"""
+    answer = QMessageBox.question(parent, "确认删除", f"确定删除选中的 {count} 篇文章吗？",
+                                  QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+    return answer == QMessageBox.Yes
+
+
+def run_bulk_delete(parent, engine, delete_fn, user_id, article_ids, on_finished=None):
+    """分批删除文章：显示一个进度对话框，全部结束后汇总提示一次
+
+    on_finished(已删除的ID, 未删除的ID) 在提示之前调用，页面在这里回滚未删除的文章。
+    """
+    job = BulkDelete(engine, delete_fn, user_id, article_ids, parent=parent)
+
+    progress = QProgressDialog("正在删除文章...", "停止", 0, len(article_ids), parent)
+    progress.setWindowTitle("批量删除")
+    progress.setWindowModality(Qt.WindowModal)
+    progress.setMinimumDuration(0)
+    progress.setAutoClose(False)
+    progress.setAutoReset(False)
+    progress.setValue(0)
+    progress.canceled.connect(job.cancel)
+    job.progress.connect(lambda done, total: progress.setValue(done))
+
+    def finish(deleted, failed, error):
+        # 关闭对话框也会发出 canceled，先断开
+        progress.canceled.disconnect(job.cancel)
+        progress.close()
+        if on_finished:
+            on_finished(deleted, failed)
+
+        summary = f"已删除 {len(deleted)} 篇文章"
+        if failed:
+            if isinstance(error, ApiError):
+                reason = error.payload.get("error", error.text)
+            elif error is not None:
+                reason = str(error)
+            else:
+                reason = "已停止"
+            QMessageBox.warning(parent, "批量删除", f"{summary}，{len(failed)} 篇未删除\n原因: {reason}")
+        else:
+            QMessageBox.information(parent, "批量删除", summary)
+        progress.deleteLater()
+        job.deleteLater()
+
+    job.finished.connect(finish)
+    job.start()
+    return job
@@ -0,0 +1,54 @@
+from PyQt5.QtWidgets import QPlainTextEdit, QFrame, QSizePolicy
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QTextCursor, QTextOption
+
+CHUNK_SIZE = 16 * 1024  # 每次写入文档的字符数
+
+
+class ContentViewer(QPlainTextEdit):
+    """只读的文章正文显示区域，用于代替自动换行的 QLabel
+
+    QPlainTextEdit 按段落分块排版，只绘制可见的块，改变窗口大小时也只重排可见部分。
+    setText() 只同步写入开头的一段，其余文本由间隔为 0 的 QTimer 在GUI线程中逐段追加，
+    每次事件循环只追加一段，中间照常处理其他事件；切换文章时丢弃上一篇还没写入的部分，
+    所以打开很长的文章也不会卡住界面。
+    正文自己带滚动条，不要再放进 QScrollArea，否则会出现两层滚动条；放进布局时给它伸展系数，
+    让它占满剩余的高度。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumHeight(120)
+        self._pending = ""  # 还没写入文档的文本
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._append_chunk)
+
+    def setText(self, text):
+        """替换显示的文本，回到顶部"""
+        self._timer.stop()
+        text = text or ""
+        self._pending = text[CHUNK_SIZE:]
+        self.setPlainText(text[:CHUNK_SIZE])
+        if self._pending:
+            self._timer.start()
+
+    def text(self):
+        """完整的文本，包括还没写入文档的部分"""
+        return self.toPlainText() + self._pending
+
+    def is_loading(self):
+        return bool(self._pending)
+
+    def _append_chunk(self):
+        chunk, self._pending = self._pending[:CHUNK_SIZE], self._pending[CHUNK_SIZE:]
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+        if not self._pending:
+            self._timer.stop()
@@ -0,0 +1,150 @@
+from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                             QTableView, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+
+from utils.api_client import ApiError
+from widgets.task_model import STATUS_COLOR
+
+
+def format_elapsed(seconds):
+    """耗时显示为 分:秒"""
+    if seconds is None:
+        return "-"
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def job_error_text(error):
+    if isinstance(error, ApiError):
+        return error.payload.get("error", error.text)
+    return str(error)
+
+
+class JobTableModel(QAbstractTableModel):
+    """作业列表：名称、状态、耗时"""
+    HEADERS = ["作业", "状态", "耗时"]
+    ELAPSED_COLUMN = 2
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.jobs = list(manager.jobs)
+        manager.job_added.connect(self.add_job)
+        manager.job_changed.connect(self.update_job)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.jobs):
+            return None
+
+        job = self.jobs[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return job.title
+            if column == 1:
+                return job.status
+            return format_elapsed(job.elapsed())
+        if role == Qt.ForegroundRole and column == 1 and job.status in STATUS_COLOR:
+            return QColor(STATUS_COLOR[job.status])
+        if role == Qt.ToolTipRole and job.error is not None:
+            return job_error_text(job.error)
+        return None
+
+    def job(self, row):
+        return self.jobs[row]
+
+    def add_job(self, job):
+        row = len(self.jobs)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.jobs.append(job)
+        self.endInsertRows()
+
+    def update_job(self, job):
+        if job in self.jobs:
+            row = self.jobs.index(job)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def tick(self):
+        """刷新执行中作业的耗时"""
+        for row, job in enumerate(self.jobs):
+            if job.started_at is not None and job.finished_at is None:
+                index = self.index(row, self.ELAPSED_COLUMN)
+                self.dataChanged.emit(index, index)
+
+    def refresh(self):
+        """作业列表被清理后重新同步"""
+        self.beginResetModel()
+        self.jobs = list(self.manager.jobs)
+        self.endResetModel()
+
+
+class JobPanel(QDockWidget):
+    """后台作业面板，停靠在主窗口底部"""
+
+    def __init__(self, manager, parent=None):
+        super().__init__("后台作业", parent)
+        self.manager = manager
+        self.setObjectName("job_panel")
+        self.init_ui()
+
+        # 每秒刷新一次耗时
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.job_model.tick)
+        self.timer.start()
+
+    def init_ui(self):
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(5, 5, 5, 5)
+
+        self.job_model = JobTableModel(self.manager, self)
+        self.job_table = QTableView()
+        self.job_table.setModel(self.job_model)
+        self.job_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.job_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.job_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.job_table.verticalHeader().hide()
+        header = self.job_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        layout.addWidget(self.job_table)
+
+        button_layout = QHBoxLayout()
+        cancel_btn = QPushButton("取消所选")
+        cancel_btn.clicked.connect(self.cancel_selected)
+        clear_btn = QPushButton("清除已结束")
+        clear_btn.clicked.connect(self.clear_finished)
+        button_layout.addStretch()
+        button_layout.addWidget(cancel_btn)
+        button_layout.addWidget(clear_btn)
+        layout.addLayout(button_layout)
+
+        self.setWidget(container)
+
+    def cancel_selected(self):
+        """取消选中的作业"""
+        rows = [index.row() for index in self.job_table.selectionModel().selectedRows()]
+        for job in [self.job_model.job(row) for row in rows]:
+            self.manager.cancel(job)
+
+    def clear_finished(self):
+        self.manager.clear_finished()
+        self.job_model.refresh()
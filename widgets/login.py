@@ -3,15 +3,13 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
                              QPushButton, QLabel, QFrame, QSizePolicy)
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt, QSize
-import requests
-from urllib.parse import urljoin
 from utils.path_tool import resource_path
+from utils.api_client import ApiError
 
 class LoginPage(QWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.base_url = "http://127.0.0.1:8000/api/"  # 根据你的后端地址修改
         self.init_ui()
 
     def init_ui(self):
@@ -144,29 +142,25 @@ class LoginPage(QWidget):
             self.show_message("请输入用户名和密码")
             return
 
-        try:
-            response = requests.post(
-                urljoin(self.base_url, "login/"),
-                json={"useraccount": useraccount, "userpwd": password},
-                timeout=5
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                # 保存用户信息到应用全局
-                self.app.user_info = {
-                    "userid": data["userid"],
-                    "useraccount": data["useraccount"],
-                    "username": data["username"]
-                }
-                # 跳转到首页
-                print('success')
-                self.app.navigate_to(self.app.home_page)
-            else:
-                self.show_message(response.json().get("message", "登录失败"))
-
-        except requests.exceptions.RequestException as e:
-            self.show_message(f"网络错误: {str(e)}")
+        self.login_btn.setDisabled(True)
+        handle = self.app.engine.submit(self.app.api.login, useraccount, password,
+                                        owner=self, key="login")
+        handle.succeeded.connect(self.on_login_success)
+        handle.failed.connect(lambda e: self.show_error(e, "登录失败"))
+        handle.finished.connect(lambda: self.login_btn.setDisabled(False))
+
+    def on_login_success(self, data):
+        """登录成功"""
+        # 保存用户信息到应用全局
+        self.app.user_info = {
+            "userid": data["userid"],
+            "useraccount": data["useraccount"],
+            "username": data["username"]
+        }
+        self.app.start_push_updates()
+        # 跳转到首页
+        print('success')
+        self.app.navigate_to(self.app.home_page)
 
     def on_register(self):
         """处理注册逻辑"""
@@ -177,21 +171,20 @@ class LoginPage(QWidget):
             self.show_message("请输入用户名和密码")
             return
 
-        try:
-            response = requests.post(
-                urljoin(self.base_url, "register/"),
-                json={"username": username, "userpwd": password},
-                timeout=5
-            )
-
-            if response.status_code == 201:
-                data = response.json()
-                self.show_message(f"注册成功! 您的账号是: {data['useraccount']}")
-            else:
-                self.show_message(response.json().get("message", "注册失败"))
-
-        except requests.exceptions.RequestException as e:
-            self.show_message(f"网络错误: {str(e)}")
+        self.register_btn.setDisabled(True)
+        handle = self.app.engine.submit(self.app.api.register, username, password,
+                                        owner=self, key="register")
+        handle.succeeded.connect(
+            lambda data: self.show_message(f"注册成功! 您的账号是: {data['useraccount']}"))
+        handle.failed.connect(lambda e: self.show_error(e, "注册失败"))
+        handle.finished.connect(lambda: self.register_btn.setDisabled(False))
+
+    def show_error(self, error, default):
+        """显示请求失败信息"""
+        if isinstance(error, ApiError):
+            self.show_message(error.payload.get("message", default))
+        else:
+            self.show_message(f"网络错误: {str(error)}")
 
     def show_message(self, message):
         """显示提示消息"""
@@ -0,0 +1,38 @@
+from difflib import SequenceMatcher
+
+from PyQt5.QtCore import QModelIndex
+
+
+def sync_rows(model, rows, new_rows, id_key):
+    """把列表模型的行数据 rows 原地更新为 new_rows，不重置模型
+
+    按ID比对新旧两份列表，删除、插入的行分别通知视图，ID相同但内容变化的行只发 dataChanged，
+    滚动位置和选中状态因此得以保留。ID有重复时无法比对，退回整体重置。
+    """
+    old_ids = [row.get(id_key) for row in rows]
+    new_ids = [row.get(id_key) for row in new_rows]
+    if len(set(old_ids)) != len(old_ids) or len(set(new_ids)) != len(new_ids):
+        model.beginResetModel()
+        rows[:] = new_rows
+        model.endResetModel()
+        return
+
+    # 从后往前应用，前面的行号不受影响
+    opcodes = SequenceMatcher(None, old_ids, new_ids, autojunk=False).get_opcodes()
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                new_row = new_rows[j1 + offset]
+                if rows[i1 + offset] is not new_row and rows[i1 + offset] != new_row:
+                    rows[i1 + offset] = new_row
+                    index = model.index(i1 + offset)
+                    model.dataChanged.emit(index, index)
+            continue
+        if i2 > i1:
+            model.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+            del rows[i1:i2]
+            model.endRemoveRows()
+        if j2 > j1:
+            model.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+            rows[i1:i1] = new_rows[j1:j2]
+            model.endInsertRows()
@@ -1,39 +1,15 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QLineEdit, QLabel, QMessageBox, QScrollArea, QFrame, QSizePolicy)
+                             QLineEdit, QLabel, QMessageBox, QFrame, QSizePolicy)
 from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
-from PyQt5.QtCore import Qt, QUrl, pyqtSignal, QSize, QThread
+from PyQt5.QtCore import Qt, QUrl, pyqtSignal, QSize
 from PyQt5.QtGui import QIcon, QFont
-import requests
-from urllib.parse import urljoin
 import os
 
 from utils.path_tool import resource_path
+from utils.api_client import ApiError
+from widgets.content_viewer import ContentViewer
 
 
-class WorkerThread(QThread):
-    finished_signal = pyqtSignal(object)  # 成功信号
-    error_signal = pyqtSignal(str)       # 错误信号
-
-    def __init__(self, parent, url, user_id):
-        super().__init__(parent)
-        self.url = url
-        self.user_id = user_id
-        self.base_url = parent.base_url
-
-    def run(self):
-        try:
-            response = requests.post(
-                urljoin(self.base_url, "desktop/quick_task/"),
-                json={
-                    'user_id': self.user_id,
-                    'url': self.url
-                },
-                timeout=30
-            )
-            self.finished_signal.emit(response)
-        except requests.exceptions.RequestException as e:
-            self.error_signal.emit(str(e))
-
 class WebPage(QWebEnginePage):
     linkClicked = pyqtSignal(QUrl)  # 自定义信号用于链接点击
 
@@ -53,11 +29,11 @@ class ReaderPage(QWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.base_url = "http://127.0.0.1:8000/"
         self.simplified_mode = False
         self.current_article = None
         self.msg_box = None
-        self.worker_thread = None
+        self.quick_task = None
+        self.quick_task_url = None
         self.init_ui()
 
     def init_ui(self):
@@ -169,12 +145,10 @@ class ReaderPage(QWidget):
         main_layout.addWidget(self.browser)
 
         # 简化模式下的文章显示区域
-        self.simplified_container = QScrollArea()
-        self.simplified_container.setWidgetResizable(True)
+        # 正文由 ContentViewer 自己滚动，外面不再套一层滚动区域
+        self.simplified_container = QWidget()
         self.simplified_container.hide()
-
-        self.simplified_widget = QWidget()
-        self.simplified_layout = QVBoxLayout(self.simplified_widget)
+        self.simplified_layout = QVBoxLayout(self.simplified_container)
         self.simplified_layout.setContentsMargins(20, 20, 20, 20)
         self.simplified_layout.setSpacing(15)
 
@@ -199,15 +173,11 @@ class ReaderPage(QWidget):
         separator.setStyleSheet("color: #eee;")
         self.simplified_layout.addWidget(separator)
 
-        # 文章内容
-        self.article_content = QLabel()
-        self.article_content.setWordWrap(True)
+        # 文章内容，长文章分段写入，只排版可见部分
+        self.article_content = ContentViewer()
         self.article_content.setFont(QFont("Arial", 12))
-        self.article_content.setStyleSheet("color: #444;")
-        self.simplified_layout.addWidget(self.article_content)
-
-        self.simplified_layout.addStretch()
-        self.simplified_container.setWidget(self.simplified_widget)
+        self.article_content.setStyleSheet("color: #444; background-color: white;")
+        self.simplified_layout.addWidget(self.article_content, 1)
         main_layout.addWidget(self.simplified_container)
 
         self.setLayout(main_layout)
@@ -257,79 +227,86 @@ class ReaderPage(QWidget):
 
             # 获取当前URL
             current_url = self.browser.url().toString()
-
-            # 创建并启动工作线程
-            self.worker_thread = WorkerThread(self, current_url, self.app.user_info["userid"])
-            self.worker_thread.finished_signal.connect(self.handle_task_response)
-            self.worker_thread.error_signal.connect(self.handle_task_error)
-            self.worker_thread.finished.connect(self.cleanup_thread)
-            self.worker_thread.start()
+            self.quick_task_url = current_url
+
+            # 在后台请求引擎中执行
+            self.quick_task = self.app.engine.submit(
+                self.app.api.quick_task,
+                self.app.user_info["userid"],
+                current_url,
+                owner=self,
+                key="quick_task"
+            )
+            self.quick_task.succeeded.connect(self.handle_task_response)
+            self.quick_task.failed.connect(self.handle_task_error)
+            self.quick_task.finished.connect(self.cleanup_task)
 
     def cancel_task(self):
-        """取消任务"""
-        if hasattr(self, 'worker_thread') and self.worker_thread:
-            self.worker_thread.quit()
+        """取消任务，之后返回的结果会被丢弃"""
+        if self.quick_task:
+            self.quick_task.cancel()
+            self.cleanup_task()
         if hasattr(self, 'msg_box') and self.msg_box:
             self.msg_box.close()
 
-    def cleanup_thread(self):
-        """清理线程资源"""
-        if hasattr(self, 'worker_thread') and self.worker_thread:
-            self.worker_thread.deleteLater()
-            del self.worker_thread
+    def cleanup_task(self):
+        """清理任务句柄"""
+        self.quick_task = None
 
-    def handle_task_response(self, response):
+    def handle_task_response(self, result):
         """处理任务响应"""
         try:
             # 确保消息框存在再关闭
             if hasattr(self, 'msg_box') and self.msg_box:
                 self.msg_box.close()
 
-            if response.status_code == 200:
-                data = response.json().get('data', {})
-                self.current_article = data
-
-                # 显示简化视图
-                self.browser.hide()
-                self.simplified_container.show()
-                self.toggle_btn.setText("恢复")
-                self.simplified_mode = True
-
-                # 填充文章数据
-                self.article_title.setText(data.get('title', '无标题'))
-
-                source_parts = []
-                if data.get('author'):
-                    source_parts.append(f"作者: {data['author']}")
-                if data.get('publish_time'):
-                    source_parts.append(f"时间: {data['publish_time']}")
-                if self.browser.url().toString():
-                    source_parts.append(f"来源: {self.browser.url().toString()}")
-
-                self.article_source.setText(" | ".join(source_parts) if source_parts else "无来源信息")
-                self.article_content.setText(data.get('content', '无内容'))
-            else:
-                error_msg = response.json().get('error', '未知错误')
-                QMessageBox.warning(self, "错误", f"获取内容失败: {error_msg}")
+            data = result.get('data', {})
+            self.current_article = data
+
+            # 显示简化视图
+            self.browser.hide()
+            self.simplified_container.show()
+            self.toggle_btn.setText("恢复")
+            self.simplified_mode = True
+
+            # 填充文章数据
+            self.article_title.setText(data.get('title', '无标题'))
+
+            source_parts = []
+            if data.get('author'):
+                source_parts.append(f"作者: {data['author']}")
+            if data.get('publish_time'):
+                source_parts.append(f"时间: {data['publish_time']}")
+            if self.browser.url().toString():
+                source_parts.append(f"来源: {self.browser.url().toString()}")
+
+            self.article_source.setText(" | ".join(source_parts) if source_parts else "无来源信息")
+            self.article_content.setText(data.get('content', '无内容'))
         except Exception as e:
             QMessageBox.warning(self, "错误", f"处理响应时出错: {str(e)}")
-        finally:
-            self.cleanup_thread()
 
-    def handle_task_error(self, error_msg):
+    def handle_task_error(self, error):
         """处理任务错误"""
-        try:
-            if hasattr(self, 'msg_box') and self.msg_box:
-                self.msg_box.close()
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {error_msg}")
-        finally:
-            self.cleanup_thread()
+        if hasattr(self, 'msg_box') and self.msg_box:
+            self.msg_box.close()
+
+        # 连不上服务器时退回本地保存的结果
+        if not isinstance(error, ApiError):
+            cached = self.app.api.cached_quick_task(self.app.user_info["userid"], self.quick_task_url)
+            if cached is not None:
+                self.handle_task_response(cached)
+                return
+
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", f"获取内容失败: {error.payload.get('error', '未知错误')}")
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
 
     def closeEvent(self, event):
         """窗口关闭时清理资源"""
-        if self.worker_thread and self.worker_thread.isRunning():
-            self.worker_thread.quit()
-            self.worker_thread.wait()
+        if self.quick_task:
+            self.quick_task.cancel()
+            self.cleanup_task()
         if self.msg_box:
             self.msg_box.close()
         super().closeEvent(event)
\ No newline at end of file
@@ -1,21 +1,33 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QLabel, QScrollArea, QFrame, QMessageBox)
+                             QLabel, QFrame, QMessageBox)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QIcon, QFont
-import requests
-from urllib.parse import urljoin
 import os
+from functools import partial
 
 from utils.path_tool import resource_path
+from utils.api_client import ApiError
+from utils.article_cursor import ArticleCursor
+from utils.body_loader import BodyLoader
+from widgets.content_viewer import ContentViewer
+from utils.job_manager import JOB_DONE, JOB_FAILED, TRANSLATE_PARALLELISM
+from widgets.bulk_delete_dialog import ArticlePickerDialog, confirm_bulk_delete, run_bulk_delete
 
 
 class TaskDetailPage(QWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.base_url = "http://127.0.0.1:8000/"
-        self.current_article_index = 0
-        self.articles = []
+        # 按页懒加载的文章游标，只保留当前位置附近的文章
+        self.cursor = ArticleCursor(app.engine, owner=self, parent=self)
+        self.cursor.current_changed.connect(self.on_cursor_changed)
+        self.cursor.load_failed.connect(self.on_articles_failed)
+        # 列表为摘要模式时正文单独获取
+        self.bodies = BodyLoader(app.api, app.engine, "task", owner=self, parent=self)
+        self.bodies.body_ready.connect(self.on_body_ready)
+        self.bodies.body_failed.connect(self.on_body_failed)
+        self.shown_source = None  # 当前游标对应的 (用户, 任务)
+        app.events.event_received.connect(self.on_push_event)
         self.init_ui()
 
     def showEvent(self, event):
@@ -121,6 +133,12 @@ class TaskDetailPage(QWidget):
         """)
         self.delete_btn.clicked.connect(self.delete_current_article)
 
+        # 批量删除按钮
+        self.bulk_delete_btn = QPushButton("批量删除")
+        self.bulk_delete_btn.setFixedSize(80, 30)
+        self.bulk_delete_btn.setStyleSheet(self.delete_btn.styleSheet())
+        self.bulk_delete_btn.clicked.connect(self.bulk_delete_articles)
+
         # 下一篇按钮
         self.next_btn = QPushButton("下一篇")
         self.next_btn.setFixedSize(60, 30)
@@ -133,19 +151,17 @@ class TaskDetailPage(QWidget):
         main_layout.addLayout(nav_buttons)
 
         # 文章内容区域
-        self.article_scroll = QScrollArea()
-        self.article_scroll.setWidgetResizable(True)
-        self.article_scroll.setStyleSheet("""
-            QScrollArea {
+        # 正文由 ContentViewer 自己滚动，外面不再套一层滚动区域
+        self.article_frame = QFrame()
+        self.article_frame.setObjectName("article_frame")
+        self.article_frame.setStyleSheet("""
+            QFrame#article_frame {
                 border: 1px solid #ddd;
                 border-radius: 5px;
                 background-color: white;
             }
         """)
-
-        # 文章内容容器
-        self.article_container = QWidget()
-        self.article_layout = QVBoxLayout(self.article_container)
+        self.article_layout = QVBoxLayout(self.article_frame)
         self.article_layout.setContentsMargins(20, 20, 20, 20)
         self.article_layout.setSpacing(15)
 
@@ -170,18 +186,13 @@ class TaskDetailPage(QWidget):
         separator.setStyleSheet("color: #eee;")
         self.article_layout.addWidget(separator)
 
-        # 文章内容
-        self.content_label = QLabel()
-        self.content_label.setWordWrap(True)
+        # 文章内容，长文章分段写入，只排版可见部分
+        self.content_label = ContentViewer()
         self.content_label.setFont(QFont("Arial", 12))
-        self.content_label.setStyleSheet("color: #444;")
-        self.article_layout.addWidget(self.content_label)
+        self.content_label.setStyleSheet("color: #444; background-color: white;")
+        self.article_layout.addWidget(self.content_label, 1)
 
-        # 添加拉伸项使内容顶部对齐
-        self.article_layout.addStretch()
-
-        self.article_scroll.setWidget(self.article_container)
-        main_layout.addWidget(self.article_scroll)
+        main_layout.addWidget(self.article_frame)
 
         self.translate_btn = QPushButton("翻译文章")
         self.translate_btn.setFixedSize(80, 30)
@@ -199,15 +210,23 @@ class TaskDetailPage(QWidget):
         """)
         self.translate_btn.clicked.connect(self.translate_current_article)
 
+        # 全部翻译按钮，翻译进行中时用于停止
+        self.translate_all_btn = QPushButton("全部翻译")
+        self.translate_all_btn.setFixedSize(80, 30)
+        self.translate_all_btn.setStyleSheet(self.translate_btn.styleSheet())
+        self.translate_all_btn.clicked.connect(self.translate_all_articles)
+
         nav_buttons.addWidget(self.prev_btn)
         nav_buttons.addWidget(self.delete_btn)
         nav_buttons.addWidget(self.translate_btn)  # 添加翻译按钮
+        nav_buttons.addWidget(self.translate_all_btn)
+        nav_buttons.addWidget(self.bulk_delete_btn)
         nav_buttons.addWidget(self.next_btn)
 
         # 一键分类按钮
-        classify_btn = QPushButton("一键分类简写")
-        classify_btn.setFixedHeight(40)
-        classify_btn.setStyleSheet("""
+        self.classify_btn = QPushButton("一键分类简写")
+        self.classify_btn.setFixedHeight(40)
+        self.classify_btn.setStyleSheet("""
             QPushButton {
                 background-color: #34a853;
                 color: white;
@@ -220,8 +239,8 @@ class TaskDetailPage(QWidget):
                 background-color: #2d9248;
             }
         """)
-        classify_btn.clicked.connect(self.process_articles)
-        main_layout.addWidget(classify_btn)
+        self.classify_btn.clicked.connect(self.process_articles)
+        main_layout.addWidget(self.classify_btn)
 
         self.setLayout(main_layout)
         self.update_nav_buttons()
@@ -232,40 +251,58 @@ class TaskDetailPage(QWidget):
             QMessageBox.warning(self, "错误", "无法获取用户或任务信息")
             return
 
-        try:
-            params = {
-                "user_id": self.app.user_info["userid"],
-                "task_id": self.app.current_task_id
-            }
-
-            response = requests.get(
-                urljoin(self.base_url, "get_articles/"),
-                params=params,
-                timeout=5
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                self.articles = data.get("articles", [])
-                self.current_article_index = 0
-                if self.articles:
-                    self.display_current_article()
-                else:
-                    self.clear_article_display()
-                    QMessageBox.information(self, "提示", "该任务下没有文章")
-            else:
-                QMessageBox.warning(self, "错误", f"获取文章失败: {response.text}")
-
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
+        # 同一任务只重新加载当前位置，切换任务时从第一篇开始
+        user_id = self.app.user_info["userid"]
+        source = (user_id, self.app.current_task_id)
+        if source == self.shown_source:
+            self.cursor.reload()
+        else:
+            self.shown_source = source
+            self.cursor.reset(partial(self.app.api.get_articles, user_id, self.app.current_task_id))
+        self.update_job_buttons()
+
+    def on_push_event(self, event_type, data):
+        """正在显示的任务有新文章或当前文章翻译完成时刷新当前位置，页面隐藏时等下次显示再加载"""
+        if not self.isVisible() or not self.shown_source:
+            return
+        if event_type == "articles_added" and data.get("task_id") == self.shown_source[1]:
+            self.cursor.reload()
+        elif event_type == "article_translated":
+            current = self.cursor.current()
+            if current is not None and current.get("article_id") == data.get("article_id"):
+                self.cursor.reload()
+
+    def on_cursor_changed(self):
+        """当前文章变化：显示文章、加载提示或空任务提示"""
+        if self.cursor.current() is not None:
+            self.display_current_article()
+        elif self.cursor.is_loading():
+            self.set_loading(True)
+        else:
+            self.clear_article_display()
+            if self.cursor.total == 0:
+                QMessageBox.information(self, "提示", "该任务下没有文章")
+
+    def on_articles_failed(self, error):
+        """文章数据加载失败"""
+        self.clear_article_display()
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", f"获取文章失败: {error.text}")
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
+
+    def set_loading(self, loading):
+        """切换加载状态"""
+        if loading:
+            self.clear_article_display()
+            self.title_label.setText("加载中...")
 
     def display_current_article(self):
         """显示当前文章"""
-        if not self.articles or self.current_article_index >= len(self.articles):
+        article = self.cursor.current()
+        if article is None:
             return
 
-        article = self.articles[self.current_article_index]
-
         # 显示标题
         self.title_label.setText(article.get("title", "无标题"))
 
@@ -280,11 +317,27 @@ class TaskDetailPage(QWidget):
 
         self.meta_label.setText(" | ".join(meta_parts) if meta_parts else "无来源信息")
 
-        # 显示内容
-        self.content_label.setText(article.get("content", "无内容"))
+        # 显示内容，正文不在列表数据中时先显示加载提示，并预取前后两篇的正文
+        user_id = self.app.user_info["userid"]
+        if not self.bodies.load(user_id, article):
+            self.content_label.setText("正文加载中...")
+        self.bodies.prefetch(user_id, [self.cursor.article(self.cursor.index + step) for step in (-1, 1)])
 
         self.update_nav_buttons()
 
+    def on_body_ready(self, article_id, body):
+        """正文返回，仍是当前文章时显示"""
+        current = self.cursor.current()
+        if current is not None and current.get("article_id") == article_id:
+            self.content_label.setText(body.get("content", "无内容"))
+
+    def on_body_failed(self, article_id, error):
+        """正文加载失败，只在正文区域提示"""
+        current = self.cursor.current()
+        if current is not None and current.get("article_id") == article_id:
+            message = error.text if isinstance(error, ApiError) else str(error)
+            self.content_label.setText(f"正文加载失败: {message}")
+
     def clear_article_display(self):
         """清空文章显示"""
         self.title_label.setText("")
@@ -294,101 +347,205 @@ class TaskDetailPage(QWidget):
 
     def update_nav_buttons(self):
         """更新导航按钮状态"""
-        has_articles = bool(self.articles)
-        self.prev_btn.setDisabled(self.current_article_index <= 0 or not has_articles)
-        self.next_btn.setDisabled(self.current_article_index >= len(self.articles) - 1 or not has_articles)
+        has_articles = self.cursor.current() is not None
+        self.prev_btn.setDisabled(not self.cursor.has_prev())
+        self.next_btn.setDisabled(not self.cursor.has_next() or not has_articles)
         self.delete_btn.setDisabled(not has_articles)
 
     def show_prev_article(self):
         """显示上一篇文章"""
-        if self.current_article_index > 0:
-            self.current_article_index -= 1
-            self.display_current_article()
+        self.cursor.move(-1)
 
     def show_next_article(self):
         """显示下一篇文章"""
-        if self.current_article_index < len(self.articles) - 1:
-            self.current_article_index += 1
-            self.display_current_article()
+        self.cursor.move(1)
 
     def delete_current_article(self):
-        """删除当前文章"""
-        if not self.articles or self.current_article_index >= len(self.articles):
+        """删除当前文章：立即在本地移除并显示下一篇，后台通知服务器，失败时恢复"""
+        article = self.cursor.current()
+        if article is None:
             return
 
-        article_id = self.articles[self.current_article_index]["article_id"]
-
-        try:
-            response = requests.delete(
-                urljoin(self.base_url, "delete_articles/"),
-                json={
-                    "article_ids": [article_id],
-                    "user_id": self.app.user_info["userid"]
-                },
-                timeout=5
-            )
+        article_id = article["article_id"]
+        user_id = self.app.user_info["userid"]
+        self.app.api.drop_articles("task", user_id, [article_id])
+        snapshot = self.cursor.remove_current()
+
+        handle = self.app.engine.submit(
+            self.app.api.delete_articles,
+            user_id,
+            [article_id]
+        )
+        handle.succeeded.connect(lambda result: self.cursor.confirm([article_id]))
+        handle.failed.connect(lambda error: self.on_delete_failed(error, snapshot))
+
+    def bulk_delete_articles(self):
+        """从任务的文章列表中多选后批量删除"""
+        if not self.app.user_info or not self.app.current_task_id:
+            QMessageBox.warning(self, "错误", "无法获取用户或任务信息")
+            return
 
-            if response.status_code == 200:
-                QMessageBox.information(self, "成功", response.json().get("message", "文章删除成功"))
-                # 重新加载文章列表
-                self.load_articles()
-            else:
-                QMessageBox.warning(self, "错误", response.json().get("error", "删除文章失败"))
+        user_id = self.app.user_info["userid"]
+        dialog = ArticlePickerDialog(self.app, partial(self.app.api.get_articles, user_id, self.app.current_task_id), self)
+        if dialog.exec_() != ArticlePickerDialog.Accepted:
+            return
+        article_ids = dialog.selected_ids()
+        if not article_ids or not confirm_bulk_delete(self, len(article_ids)):
+            return
 
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
+        self.app.api.drop_articles("task", user_id, article_ids)
+        self.cursor.remove_ids(article_ids)
+        run_bulk_delete(
+            self, self.app.engine, self.app.api.delete_articles, user_id, article_ids,
+            on_finished=self.on_bulk_deleted
+        )
+
+    def on_bulk_deleted(self, deleted, failed):
+        """批量删除结束，放回未能删除的文章并与服务器同步"""
+        if failed:
+            self.app.api.invalidate_dropped("task", self.app.user_info["userid"])
+        self.cursor.confirm(deleted)
+        self.cursor.restore_ids(failed)
+
+    def on_delete_failed(self, error, snapshot):
+        """文章删除失败，把文章放回原位置"""
+        self.cursor.restore(snapshot)
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", error.payload.get("error", "删除文章失败"))
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
+
+    def job_group(self, kind, task_id):
+        """同一任务的同类作业归为一组"""
+        return f"{kind}_{task_id}"
+
+    def update_job_buttons(self):
+        """按当前任务是否有进行中的作业更新按钮"""
+        task_id = self.app.current_task_id
+        if self.app.jobs.active_jobs(self.job_group("process", task_id)):
+            self.classify_btn.setDisabled(True)
+            self.classify_btn.setText("正在分类简写...")
+        else:
+            self.classify_btn.setDisabled(False)
+            self.classify_btn.setText("一键分类简写")
+
+        if self.app.jobs.active_jobs(self.job_group("translate", task_id)):
+            self.translate_all_btn.setText("停止翻译")
+        else:
+            self.translate_all_btn.setText("全部翻译")
 
     def process_articles(self):
-        """一键分类处理"""
+        """一键分类处理，在后台作业队列中执行"""
         if not self.app.user_info or not self.app.current_task_id:
             QMessageBox.warning(self, "错误", "无法获取用户或任务信息")
             return
 
-        try:
-            response = requests.post(
-                urljoin(self.base_url, "api/process-articles/"),
-                json={
-                    "user_id": self.app.user_info["userid"],
-                    "task_id": self.app.current_task_id
-                },
-                timeout=30  # 处理可能需要更长时间
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                if "error" in result:
-                    QMessageBox.warning(self, "处理失败", result["error"])
-                else:
-                    QMessageBox.information(self, "成功", "文章分类处理完成")
-            else:
-                QMessageBox.warning(self, "错误", f"处理失败: {response.text}")
-
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
+        task_id = self.app.current_task_id
+        job = self.app.jobs.submit(
+            f"分类简写: 任务 {task_id}",
+            self.app.api.process_articles,
+            self.app.user_info["userid"],
+            task_id,
+            group=self.job_group("process", task_id)
+        )
+        job.finished.connect(self.on_process_job_finished)
+        # 处理可能需要较长时间，期间禁用按钮防止重复提交
+        self.update_job_buttons()
+
+    def on_process_job_finished(self, job):
+        """分类处理作业结束"""
+        self.update_job_buttons()
+        if job.status == JOB_DONE:
+            self.on_articles_processed(job.result)
+        elif job.status == JOB_FAILED:
+            self.on_process_failed(job.error)
+
+    def on_articles_processed(self, result):
+        """分类处理完成"""
+        if "error" in result:
+            QMessageBox.warning(self, "处理失败", result["error"])
+        else:
+            QMessageBox.information(self, "成功", "文章分类处理完成")
+
+    def on_process_failed(self, error):
+        """分类处理失败"""
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", f"处理失败: {error.text}")
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
 
     def translate_current_article(self):
-        """翻译当前文章"""
-        if not self.articles or self.current_article_index >= len(self.articles):
+        """翻译当前文章，在后台作业队列中执行，可以连续提交多篇"""
+        article = self.cursor.current()
+        if article is None:
             return
 
-        article_id = self.articles[self.current_article_index]["article_id"]
-
-        try:
-            response = requests.post(
-                urljoin(self.base_url, "api/translate-article/"),
-                json={
-                    "article_id": article_id,
-                    "user_id": self.app.user_info["userid"]
-                },
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                QMessageBox.information(self, "成功", "文章翻译成功")
-                # 重新加载文章列表
-                self.load_articles()
-            else:
-                QMessageBox.warning(self, "错误", response.json().get("error", "翻译文章失败"))
-
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
\ No newline at end of file
+        task_id = self.app.current_task_id
+        article_id = article["article_id"]
+        self.submit_translate(task_id, article_id, article.get("title") or f"文章 {article_id}", notify=True)
+        self.update_job_buttons()
+
+    def translate_all_articles(self):
+        """翻译任务下的全部文章；已有翻译作业时停止它们"""
+        if not self.app.user_info or not self.app.current_task_id:
+            QMessageBox.warning(self, "错误", "无法获取用户或任务信息")
+            return
+
+        task_id = self.app.current_task_id
+        group = self.job_group("translate", task_id)
+        if self.app.jobs.active_jobs(group):
+            self.app.jobs.cancel_group(group)
+            self.update_job_buttons()
+            return
+
+        # 先在后台列出全部文章，再逐篇加入队列，同一任务最多同时翻译 TRANSLATE_PARALLELISM 篇
+        self.app.jobs.set_group_limit(group, TRANSLATE_PARALLELISM)
+        job = self.app.jobs.submit(
+            f"列出文章: 任务 {task_id}",
+            self.app.api.list_article_ids,
+            self.app.user_info["userid"],
+            task_id,
+            group=group
+        )
+        job.finished.connect(lambda job: self.on_article_ids_listed(task_id, job))
+        self.update_job_buttons()
+
+    def on_article_ids_listed(self, task_id, job):
+        """文章列表获取完成，为每篇文章提交翻译作业"""
+        if job.status == JOB_DONE:
+            for article_id in job.result:
+                self.submit_translate(task_id, article_id, f"文章 {article_id}", notify=False)
+        elif job.status == JOB_FAILED:
+            self.on_translate_failed(job.error)
+        self.update_job_buttons()
+
+    def submit_translate(self, task_id, article_id, title, notify):
+        """提交一篇文章的翻译作业，notify 为 True 时失败会弹出提示"""
+        job = self.app.jobs.submit(
+            f"翻译: {title}",
+            self.app.api.translate_article,
+            self.app.user_info["userid"],
+            article_id,
+            group=self.job_group("translate", task_id)
+        )
+        job.finished.connect(lambda job: self.on_translate_job_finished(task_id, article_id, notify, job))
+        return job
+
+    def on_translate_job_finished(self, task_id, article_id, notify, job):
+        """翻译作业结束：正在显示的文章被翻译或整组翻译结束时刷新当前位置"""
+        self.update_job_buttons()
+        if job.status == JOB_FAILED and notify:
+            self.on_translate_failed(job.error)
+        if job.status != JOB_DONE or not self.shown_source or self.shown_source[1] != task_id:
+            return
+        current = self.cursor.current()
+        group_idle = not self.app.jobs.active_jobs(self.job_group("translate", task_id))
+        if group_idle or (current is not None and current.get("article_id") == article_id):
+            self.cursor.reload()
+
+    def on_translate_failed(self, error):
+        """文章翻译失败"""
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", error.payload.get("error", "翻译文章失败"))
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
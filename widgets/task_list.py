@@ -1,22 +1,35 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
-                             QListWidgetItem, QPushButton, QLabel, QMessageBox,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView,
+                             QPushButton, QLabel, QMessageBox,
                              QSpacerItem, QSizePolicy, QLineEdit)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QFont, QColor, QPixmap, QIcon
-import requests
-from urllib.parse import urljoin
 import os
+from functools import partial
 
 from utils.path_tool import resource_path
+from utils.api_client import ApiError
+from utils.incremental_search import IncrementalSearch
+from utils.status_poller import StatusPoller
+from widgets.task_model import TaskListModel, TaskItemDelegate, task_matches
 
 
 class TaskListPage(QWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
-        self.base_url = "http://127.0.0.1:8000/api/"
         self.current_page = 1
         self.per_page = 10
+        self.shown_data = None  # 当前显示的响应，避免重复渲染同一份缓存
+        self.search_query = ""  # 当前结果对应的搜索词
+        self.task_request = None  # 当前列表对应的 (用户, 请求参数)
+        # 后台轮询执行中/排队中任务的状态，只更新变化的行
+        self.status_poller = StatusPoller(app.engine, parent=self)
+        self.status_poller.task_changed.connect(self.on_task_status_changed)
+        self.status_poller.task_completed.connect(self.on_task_completed)
+        # 推送可用时由推送事件更新状态，轮询暂停
+        self.status_poller.set_push_active(app.events.is_connected())
+        app.events.connection_changed.connect(self.status_poller.set_push_active)
+        app.events.event_received.connect(self.on_push_event)
         self.initialized = False  # 添加初始化标志
         self.init_ui()
         # 不再在这里调用load_tasks()
@@ -26,7 +39,12 @@ class TaskListPage(QWidget):
         super().showEvent(event)
         if not self.initialized:
             self.load_tasks()
-            self.initialized = True
+        self.status_poller.set_background(False)
+
+    def hideEvent(self, event):
+        """页面隐藏后放慢轮询，任务完成时仍会通知"""
+        super().hideEvent(event)
+        self.status_poller.set_background(True)
 
     def init_ui(self):
         # 主布局
@@ -94,15 +112,23 @@ class TaskListPage(QWidget):
                 background-color: #3367d6;
             }
         """)
-        search_btn.clicked.connect(self.on_search)
+        # 边输入边搜索：按键防抖，回车和搜索按钮立即搜索
+        self.incremental_search = IncrementalSearch(self.search_input, parent=self)
+        self.incremental_search.triggered.connect(self.on_search)
+        search_btn.clicked.connect(self.incremental_search.flush)
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(search_btn)
         main_layout.addLayout(search_layout)
 
-        # 任务列表
-        self.task_list = QListWidget()
+        # 任务列表（模型/视图，行由委托按状态绘制）
+        self.task_model = TaskListModel(self)
+        self.task_list = QListView()
+        self.task_list.setModel(self.task_model)
+        self.task_list.setItemDelegate(TaskItemDelegate(show_keyword=False, parent=self.task_list))
+        self.task_list.setUniformItemSizes(True)
+        self.task_list.setEditTriggers(QListView.NoEditTriggers)
         self.task_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: white;
                 border: 1px solid #ddd;
                 border-radius: 5px;
@@ -110,14 +136,14 @@ class TaskListPage(QWidget):
                 min-width: 600px;
                 min-height: 400px;
             }
-            QListWidget::item {
+            QListView::item {
                 border-bottom: 1px solid #eee;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f5f5f5;
             }
         """)
-        self.task_list.itemDoubleClicked.connect(self.on_task_selected)
+        self.task_list.doubleClicked.connect(self.on_task_selected)
         main_layout.addWidget(self.task_list)
 
         # 分页控件
@@ -166,94 +192,84 @@ class TaskListPage(QWidget):
             self.app.navigate_to(self.app.login_page)
             return
 
-        try:
-            user_id = self.app.user_info["userid"]
-            search = self.search_input.text().strip()
-
-            params = {
-                "page": self.current_page,
-                "per_page": self.per_page,
-                "task_target": "webpage"  # 只获取普通任务
-            }
-            if search:
-                params["search"] = search
-
-            response = requests.get(
-                urljoin(self.base_url, f"tasks/{user_id}/"),
-                params=params,
-                timeout=5
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                self.display_tasks(data["tasks"])
-                self.update_pagination(data["total"])
-            else:
-                QMessageBox.warning(self, "错误", f"获取任务失败: {response.text}")
+        user_id = self.app.user_info["userid"]
+        search = self.search_input.text().strip()
+        self.search_query = search
+
+        request = dict(
+            page=self.current_page,
+            per_page=self.per_page,
+            task_target="webpage",  # 只获取普通任务
+            search=search
+        )
+        self.task_request = (user_id, request)
+
+        # 有缓存时先立即渲染，再在后台刷新
+        cached = self.app.api.get_tasks(user_id, cached_only=True, **request)
+        if cached is not None:
+            self.on_tasks_loaded(cached)
+
+        self.set_loading(True)
+        handle = self.app.engine.submit(
+            self.app.api.get_tasks,
+            user_id,
+            owner=self,
+            key="load_tasks",
+            **request
+        )
+        handle.succeeded.connect(self.on_tasks_loaded)
+        handle.failed.connect(self.on_tasks_failed)
+
+    def on_tasks_loaded(self, data):
+        """任务数据返回"""
+        self.initialized = True
+        if data is not self.shown_data:
+            self.shown_data = data
+            self.display_tasks(data["tasks"])
+            # 第1页已包含全部匹配项时，后续更精确的搜索可以直接在本地过滤
+            complete = self.current_page == 1 and data["total"] <= len(data["tasks"])
+            self.incremental_search.remember(self.search_query, data["tasks"], complete)
+            self.watch_statuses(data["tasks"])
+        self.update_pagination(data["total"])
+
+    def watch_statuses(self, tasks):
+        """轮询当前显示的任务中尚未结束的那些"""
+        if self.task_request is None:
+            return
+        user_id, request = self.task_request
+        self.status_poller.watch(partial(self.app.api.get_tasks, user_id, fresh=True, **request), tasks)
+
+    def on_push_event(self, event_type, data):
+        """服务器推送的任务状态与轮询结果同样处理"""
+        if event_type == "task_status":
+            self.status_poller.apply([data])
+
+    def on_task_status_changed(self, task):
+        """任务状态变化，只刷新这一行；推送的数据可能只有部分字段"""
+        row = self.task_model.row_of(task["task_id"])
+        if row >= 0:
+            self.task_model.update_task(self.task_model.tasks[row].replace(**task))
+
+    def on_task_completed(self, task):
+        """任务执行完成，通知用户"""
+        self.app.show_notification("任务完成", f"任务 {task['task_id']} 已完成，可以查看结果")
+
+    def on_tasks_failed(self, error):
+        """任务数据加载失败"""
+        self.set_loading(False)
+        if isinstance(error, ApiError):
+            QMessageBox.warning(self, "错误", f"获取任务失败: {error.text}")
+        else:
+            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(error)}")
 
-        except requests.exceptions.RequestException as e:
-            QMessageBox.warning(self, "网络错误", f"无法连接到服务器: {str(e)}")
+    def set_loading(self, loading):
+        """切换加载状态，翻页按钮保持可用以便随时改变请求"""
+        suffix = " 加载中..." if loading else ""
+        self.page_label.setText(f"第 {self.current_page} 页{suffix}")
 
     def display_tasks(self, tasks):
         """显示任务列表"""
-        self.task_list.clear()
-
-        for task in tasks[:10]:
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 90))  # 设置行高为90
-
-            # 根据状态设置背景色
-            status = task["status"]
-            bg_color = {
-                "完成": "#e6f7e6",  # 浅绿
-                "失败": "#ffebeb",  # 浅红
-                "执行中": "#fff8e6",  # 浅黄
-                "排队中": "#e6f3ff"  # 浅蓝
-            }.get(status, "#ffffff")  # 默认白色
-
-            # 创建自定义widget
-            widget = QWidget()
-            layout = QVBoxLayout(widget)
-            layout.setContentsMargins(15, 10, 15, 10)
-            layout.setSpacing(8)
-
-            # 任务ID和状态
-            top_layout = QHBoxLayout()
-            id_label = QLabel(f"任务ID: {task['task_id']}")
-            id_label.setFont(QFont("Arial", 12, QFont.Bold))
-
-            status_label = QLabel(status)
-            status_label.setFont(QFont("Arial", 12))
-            status_color = {
-                "完成": "#2e7d32",
-                "失败": "#c62828",
-                "执行中": "#f9a825",
-                "排队中": "#1565c0"
-            }.get(status, "#000000")
-            status_label.setStyleSheet(f"color: {status_color};")
-
-            top_layout.addWidget(id_label)
-            top_layout.addStretch()
-            top_layout.addWidget(status_label)
-            layout.addLayout(top_layout)
-
-            # 创建时间
-            time_label = QLabel(f"创建时间: {task['created_at']}")
-            time_label.setFont(QFont("Arial", 10))
-            time_label.setStyleSheet("color: #666;")
-            layout.addWidget(time_label)
-
-            widget.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {bg_color};
-                    border-radius: 5px;
-                }}
-            """)
-
-            item.setData(Qt.UserRole, task["task_id"])  # 保存task_id
-
-            self.task_list.addItem(item)
-            self.task_list.setItemWidget(item, widget)
+        self.task_model.sync_tasks(tasks)
 
     def update_pagination(self, total):
         """更新分页控件状态"""
@@ -273,45 +289,42 @@ class TaskListPage(QWidget):
         self.load_tasks()
 
     def on_search(self):
-        """搜索任务"""
+        """搜索任务，能用上一次的完整结果缩小范围时不再请求服务器"""
         self.current_page = 1
-        self.load_tasks()
+        search = self.search_input.text().strip()
+        tasks = self.incremental_search.narrow(search, task_matches)
+        if tasks is None:
+            self.load_tasks()
+            return
+
+        # 丢弃还未返回的旧查询，避免它的结果覆盖本地过滤的结果
+        self.app.engine.cancel_owner(self, "load_tasks")
+        self.search_query = search
+        self.on_tasks_loaded({"tasks": tasks, "total": len(tasks)})
 
-    def on_task_selected(self, item):
+    def on_task_selected(self, index):
         """任务项被选中"""
-        task_id = item.data(Qt.UserRole)
-
-        # 直接从item widget获取状态
-        widget = self.task_list.itemWidget(item)
-        if widget:
-            # 找到状态标签 - 现在我们知道它在第二个QLabel
-            status_label = None
-            for child in widget.findChildren(QLabel):
-                if child.text() in ["完成", "失败", "执行中", "排队中"]:
-                    status_label = child
-                    break
-
-            if status_label:
-                status = status_label.text()
-
-                # 根据状态处理
-                if status == "完成":
-                    # 保存当前task_id到app，以便详情页使用
-                    self.app.current_task_id = task_id
-                    self.app.navigate_to(self.app.task_detail_page)
-                else:
-                    message = {
-                        "执行中": "任务正在执行中，请等待完成",
-                        "排队中": "任务在排队中，请等待执行",
-                        "失败": "任务执行失败，无数据可用"
-                    }.get(status, "未知状态")
-
-                    QMessageBox.information(
-                        self,
-                        "提示",
-                        f"任务 {task_id}\n状态: {status}\n{message}"
-                    )
-            else:
-                QMessageBox.warning(self, "错误", "无法获取任务状态")
+        task_id = index.data(TaskListModel.TaskIdRole)
+        status = index.data(TaskListModel.TaskStatusRole)
+
+        if not status:
+            QMessageBox.warning(self, "错误", "无法获取任务状态")
+            return
+
+        # 根据状态处理
+        if status == "完成":
+            # 保存当前task_id到app，以便详情页使用
+            self.app.current_task_id = task_id
+            self.app.navigate_to(self.app.task_detail_page)
         else:
-            QMessageBox.warning(self, "错误", "无法获取任务信息")
\ No newline at end of file
+            message = {
+                "执行中": "任务正在执行中，完成后会自动通知",
+                "排队中": "任务在排队中，完成后会自动通知",
+                "失败": "任务执行失败，无数据可用"
+            }.get(status, "未知状态")
+
+            QMessageBox.information(
+                self,
+                "提示",
+                f"任务 {task_id}\n状态: {status}\n{message}"
+            )
\ No newline at end of file
@@ -0,0 +1,164 @@
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem
+from PyQt5.QtCore import Qt, QSize, QRect, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QColor, QFontMetrics, QPainter
+
+from widgets.model_diff import sync_rows
+
+# 根据状态设置背景色
+STATUS_BACKGROUND = {
+    "完成": "#e6f7e6",  # 浅绿
+    "失败": "#ffebeb",  # 浅红
+    "执行中": "#fff8e6",  # 浅黄
+    "排队中": "#e6f3ff"  # 浅蓝
+}
+
+# 状态文字颜色
+STATUS_COLOR = {
+    "完成": "#2e7d32",
+    "失败": "#c62828",
+    "执行中": "#f9a825",
+    "排队中": "#1565c0"
+}
+
+
+def task_matches(task, query):
+    """任务是否匹配搜索词（忽略大小写），检索字段与服务器一致：任务ID、状态和关键词"""
+    query = query.lower()
+    fields = [str(task.get("task_id", "")), task.get("status") or ""]
+    config = task.get("config")
+    if isinstance(config, list):
+        fields.extend(str(item.get("keyword", "")) for item in config if isinstance(item, dict))
+    return any(query in field.lower() for field in fields)
+
+
+class TaskListModel(QAbstractListModel):
+    """任务列表模型，状态保存在单独的数据角色中"""
+    TaskIdRole = Qt.UserRole
+    TaskStatusRole = Qt.UserRole + 1
+    TaskRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = []
+        self._rows = {}  # task_id -> 行号
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.tasks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.tasks):
+            return None
+
+        task = self.tasks[index.row()]
+        if role == Qt.DisplayRole:
+            return f"任务ID: {task['task_id']}"
+        if role == self.TaskIdRole:
+            return task["task_id"]
+        if role == self.TaskStatusRole:
+            return task.get("status")
+        if role == self.TaskRole:
+            return task
+        return None
+
+    def set_tasks(self, tasks):
+        """整体替换任务数据"""
+        self.beginResetModel()
+        self.tasks = list(tasks)
+        self._rows = {task["task_id"]: row for row, task in enumerate(self.tasks)}
+        self.endResetModel()
+
+    def sync_tasks(self, tasks):
+        """原地更新为新的任务列表，只通知变化的行"""
+        sync_rows(self, self.tasks, list(tasks), "task_id")
+        self._rows = {task["task_id"]: row for row, task in enumerate(self.tasks)}
+
+    def row_of(self, task_id):
+        """任务所在行，不存在时返回 -1"""
+        return self._rows.get(task_id, -1)
+
+    def update_task(self, task):
+        """原地更新一条任务，只刷新这一行"""
+        row = self.row_of(task["task_id"])
+        if row < 0:
+            return False
+        self.tasks[row] = task
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """按任务状态绘制带背景色的任务行"""
+    ROW_HEIGHT = 90
+
+    def __init__(self, show_keyword=False, parent=None):
+        super().__init__(parent)
+        self.show_keyword = show_keyword
+
+        # 字体和度量只创建一次，绘制时复用
+        self.id_font = QFont("Arial", 12, QFont.Bold)
+        self.status_font = QFont("Arial", 12)
+        self.meta_font = QFont("Arial", 10)
+        self.id_metrics = QFontMetrics(self.id_font)
+        self.status_metrics = QFontMetrics(self.status_font)
+        self.meta_metrics = QFontMetrics(self.meta_font)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        task = index.data(TaskListModel.TaskRole)
+        if not task:
+            return super().paint(painter, option, index)
+
+        painter.save()
+
+        # 悬停/选中效果交给样式表
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style:
+            style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        # 状态背景
+        status = task.get("status", "")
+        card = opt.rect.adjusted(2, 2, -2, -2)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(STATUS_BACKGROUND.get(status, "#ffffff")))  # 默认白色
+        painter.drawRoundedRect(card, 5, 5)
+
+        rect = card.adjusted(15, 10, -15, -10)
+        y = rect.top()
+
+        # 任务ID和状态
+        line_height = max(self.id_metrics.height(), self.status_metrics.height())
+        line_rect = QRect(rect.left(), y, rect.width(), line_height)
+        painter.setFont(self.status_font)
+        painter.setPen(QColor(STATUS_COLOR.get(status, "#000000")))
+        painter.drawText(line_rect, Qt.AlignRight | Qt.AlignVCenter, status)
+        painter.setFont(self.id_font)
+        painter.setPen(QColor("#000000"))
+        painter.drawText(line_rect, Qt.AlignLeft | Qt.AlignVCenter, f"任务ID: {task['task_id']}")
+        y += line_height + 6
+
+        # 关键词信息和创建时间
+        lines = []
+        if self.show_keyword:
+            config = task.get("config")
+            if isinstance(config, list) and config and "keyword" in config[0]:
+                lines.append(f"关键词: {config[0]['keyword']}")
+        lines.append(f"创建时间: {task.get('created_at', '')}")
+
+        painter.setFont(self.meta_font)
+        painter.setPen(QColor("#666"))
+        for text in lines:
+            text_rect = QRect(rect.left(), y, rect.width(), self.meta_metrics.height())
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             self.meta_metrics.elidedText(text, Qt.ElideRight, rect.width()))
+            y += self.meta_metrics.height() + 6
+
+        painter.restore()